@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Spracherkennung (ASR)
+Austauschbare Erkennungs-Backends hinter einer gemeinsamen Schnittstelle:
+
+    recognizer = get_recognizer()          # Auswahl per AEGIS_ASR_BACKEND
+    result = recognizer.transcribe(audio)  # audio = speech_recognition.AudioData
+    if result: text, language = result
+
+None heißt "nichts verstanden"; ist das Backend nicht erreichbar, kommt
+RecognitionUnavailable (sonst sähe ein Netzausfall aus wie Stille).
+
+- google:  Google Web Speech (Netzwerk), de-DE und en-US parallel
+- whisper: faster-whisper lokal auf der CPU, Modell bleibt geladen
+"""
+
+import io
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from aegis_trace import current_span
+
+DEFAULT_BACKEND = "google"
+
+
+class RecognitionUnavailable(Exception):
+    """Backend hat keine Antwort geliefert (Netzwerk, Quota); Erkennung später wiederholen"""
+
+
+class Recognizer:
+    """Basisklasse: zählt, welche Sprache wie oft erkannt wurde"""
+
+    name = "base"
+
+    def __init__(self):
+        self.language_hits = Counter()
+        self.failures = 0
+        self._stats_lock = threading.Lock()  # eine Instanz pro Prozess, Pipeline und Live-Modus zählen parallel
+
+    def _record(self, result):
+        with self._stats_lock:
+            if result:
+                self.language_hits[result[1]] += 1
+            else:
+                self.failures += 1
+        return result
+
+    def stats(self):
+        """Trefferquote pro Sprache, um die Standard-Reihenfolge datenbasiert zu wählen"""
+        with self._stats_lock:
+            language_hits = dict(self.language_hits)
+            failures = self.failures
+        total = sum(language_hits.values()) + failures
+        return {
+            "backend": self.name,
+            "total": total,
+            "failures": failures,
+            "language_hits": language_hits,
+            "language_rates": {lang: hits / total for lang, hits in language_hits.items()},
+        }
+
+
+class GoogleRecognizer(Recognizer):
+    """Google Web Speech: alle Sprachen parallel, erstes sicheres Ergebnis gewinnt"""
+
+    name = "google"
+
+    def __init__(self, languages=("de-DE", "en-US"), min_confidence=0.8):
+        import speech_recognition as sr
+
+        super().__init__()
+        self.sr = sr
+        self.recognizer = sr.Recognizer()
+        self.recognizer.operation_timeout = 10
+        self.languages = languages
+        self.min_confidence = min_confidence
+        self._pool = ThreadPoolExecutor(max_workers=len(languages), thread_name_prefix="aegis-asr")
+
+    def _recognize(self, audio, language):
+        try:
+            result = self.recognizer.recognize_google(audio, language=language, show_all=True)
+        except self.sr.UnknownValueError:
+            return None
+        if not result or not result.get("alternative"):
+            return None
+        best = result["alternative"][0]
+        return best["transcript"], best.get("confidence", 0.0)
+
+    def transcribe(self, audio):
+        futures = {self._pool.submit(self._recognize, audio, lang): lang for lang in self.languages}
+        candidates = {}
+        errors = []
+        for future in as_completed(futures):
+            language = futures[future]
+            try:
+                result = future.result()
+            except self.sr.RequestError as e:
+                print(f"❌ Google Speech Recognition Fehler ({language}): {e}")
+                errors.append(f"{language}: {e}")
+                continue
+            if result is None:
+                continue
+            if result[1] >= self.min_confidence:
+                # Sicher genug: nicht auf die langsamere Sprache warten
+                for other in futures:
+                    other.cancel()
+                return self._record((result[0], language[:2]))
+            candidates[language] = result
+
+        if not candidates:
+            if errors:
+                # Mindestens eine Sprache nicht geprüft: kein Beleg für "nichts gesagt"
+                self._record(None)
+                raise RecognitionUnavailable("; ".join(errors))
+            return self._record(None)
+        # Sonst höchste Konfidenz, bei Gleichstand gilt die Reihenfolge in self.languages
+        language = max(candidates, key=lambda lang: (candidates[lang][1], -self.languages.index(lang)))
+        return self._record((candidates[language][0], language[:2]))
+
+
+class WhisperRecognizer(Recognizer):
+    """Offline-Erkennung mit faster-whisper; Spracherkennung im selben Durchlauf"""
+
+    name = "whisper"
+
+    def __init__(self, model_size=None, cpu_threads=None, languages=("de", "en")):
+        from faster_whisper import WhisperModel
+
+        super().__init__()
+        model_size = model_size or os.getenv("AEGIS_WHISPER_MODEL", "small")
+        cpu_threads = cpu_threads or int(os.getenv("AEGIS_ASR_THREADS", "0"))
+        self.model = WhisperModel(model_size, device="cpu", compute_type="int8", cpu_threads=cpu_threads)
+        self.languages = languages
+
+    def _run(self, wav_bytes, language=None):
+        segments, info = self.model.transcribe(io.BytesIO(wav_bytes), language=language, beam_size=1)
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        return text, info.language
+
+    def transcribe(self, audio):
+        wav_bytes = audio.get_wav_data(convert_rate=16000, convert_width=2)
+        text, language = self._run(wav_bytes)
+        if language not in self.languages:
+            # Erkennung auf unsere Sprachen beschränken (wie beim Google-Weg)
+            text, language = self._run(wav_bytes, self.languages[0])
+        return self._record((text, language) if text else None)
+
+
+BACKENDS = {
+    "google": GoogleRecognizer,
+    "whisper": WhisperRecognizer,
+}
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def register_backend(name, factory):
+    """Weiteres Backend bekannt machen (z.B. Stub-Engine für Benchmarks)"""
+    BACKENDS[name] = factory
+    _instances.pop(name, None)
+
+
+def get_recognizer(name=None):
+    """Warmes Backend pro Prozess; Name aus Argument oder AEGIS_ASR_BACKEND"""
+    name = name or os.getenv("AEGIS_ASR_BACKEND", DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(f"Unbekanntes ASR-Backend: {name} (verfügbar: {', '.join(BACKENDS)})")
+    with _instances_lock:  # Hintergrund-Vorladen und erste Anfrage dürfen sich überschneiden
+        if name not in _instances:
+            _instances[name] = BACKENDS[name]()
+        return _instances[name]
+
+
+def transcribe_chunks(chunks, recognizer=None, sample_rate=16000):
+    """Erkenne mehrere PCM16-Mono-Stücke (Bytes oder AudioBuffer) und füge den Text zusammen"""
+    import speech_recognition as sr
+
+    recognizer = recognizer or get_recognizer()
+    current_span().set(asr_backend=recognizer.name)
+    texts = []
+    language = None
+    for chunk in chunks:
+        # bytes oder AudioBuffer (sr.AudioData braucht eine eigene Kopie)
+        pcm = chunk.tobytes() if hasattr(chunk, "tobytes") else chunk
+        result = recognizer.transcribe(sr.AudioData(pcm, getattr(chunk, "sample_rate", sample_rate), 2))
+        if result:
+            texts.append(result[0])
+            language = language or result[1]
+    return (" ".join(texts), language) if texts else None
+
+
+def recognizer_stats():
+    """Statistiken aller in diesem Prozess geladenen Backends"""
+    return [recognizer.stats() for recognizer in _instances.values()]
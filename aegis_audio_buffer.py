@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Audio-Puffer
+PCM im Speicher statt als Datei zwischen den Stufen: Abtastrate, Kanäle,
+Sampleformat und ein Puffer, auf den Ausschnitte ohne Kopie zeigen.
+
+    audio = AudioBuffer.from_file("nachricht.ogg")   # 16 kHz Mono PCM16
+    chunk = audio.clip(0.5, 2.0)                      # Sicht auf denselben Speicher
+    shared = audio.share()                            # einmal in Shared Memory kopieren
+
+Ein geteilter Puffer (share()) wird beim Pickeln nur als Name + Ausschnitt
+übertragen; Worker im Prozess-Pool hängen dasselbe Shared-Memory-Segment ein,
+statt die Samples zu serialisieren. Das Segment gehört der Prozessfamilie,
+die es angelegt hat; wer es nicht mehr braucht, ruft release() (löscht es).
+"""
+
+import io
+import warnings
+import wave
+import weakref
+from multiprocessing import shared_memory
+
+from aegis_audio_decode import TARGET_RATE, decode_to_pcm
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop  # ab Python 3.13 nicht mehr vorhanden
+    except ImportError:
+        audioop = None
+
+DTYPES = {"int16": ("h", 2), "float32": ("f", 4)}
+
+
+class AudioBuffer:
+    """PCM-Puffer mit Format; Ausschnitte (clip, [a:b]) teilen sich den Speicher"""
+
+    # Gespeichert werden nur Träger + Byte-Bereich; Sichten (data) entstehen bei Bedarf,
+    # damit keine langlebige memoryview das Aushängen des Segments blockiert
+    __slots__ = ("_base", "_shm", "_start", "_end", "sample_rate", "channels", "dtype")
+
+    def __init__(self, data, sample_rate=TARGET_RATE, channels=1, dtype="int16", _shm=None, _start=0, _end=None):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unbekanntes Sampleformat: {dtype} (verfügbar: {', '.join(DTYPES)})")
+        self._base = data  # bytes-artig, bei Shared Memory None
+        self._shm = _shm
+        self._start = _start
+        self._end = _end if _end is not None else _start + memoryview(data if _shm is None else _shm.buf).nbytes
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = dtype
+        if self.nbytes % self.frame_bytes:
+            raise ValueError("Puffergröße ist kein Vielfaches der Framegröße")
+
+    @classmethod
+    def from_file(cls, audio_file, sample_rate=TARGET_RATE):
+        """Beliebige Audiodatei -> Mono PCM16 mit sample_rate (siehe decode_to_pcm)"""
+        return cls(decode_to_pcm(audio_file, sample_rate), sample_rate)
+
+    @classmethod
+    def from_wav(cls, wav_file):
+        """PCM16-WAV (Pfad oder Dateiobjekt) unverändert einlesen"""
+        with wave.open(wav_file if hasattr(wav_file, "read") else str(wav_file), "rb") as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("nur 16-bit PCM")
+            return cls(wav.readframes(wav.getnframes()), wav.getframerate(), wav.getnchannels())
+
+    # --- Format ---
+
+    @property
+    def data(self):
+        """Bytes-Sicht (memoryview) ohne Kopie; nicht länger halten als den Puffer selbst"""
+        carrier = self._shm.buf if self._shm is not None else memoryview(self._base).cast("B")
+        return carrier[self._start:self._end]
+
+    @property
+    def frame_bytes(self):
+        return DTYPES[self.dtype][1] * self.channels
+
+    @property
+    def frames(self):
+        return self.nbytes // self.frame_bytes
+
+    @property
+    def seconds(self):
+        return self.frames / self.sample_rate
+
+    @property
+    def nbytes(self):
+        return self._end - self._start
+
+    @property
+    def shared(self):
+        return self._shm is not None
+
+    def samples(self):
+        """Sicht als Samples (memoryview im Format h bzw. f)"""
+        return self.data.cast(DTYPES[self.dtype][0])
+
+    def tobytes(self):
+        return self.data.tobytes()
+
+    def __len__(self):
+        return self.frames
+
+    def __repr__(self):
+        where = f" shm={self._shm.name}" if self._shm else ""
+        return (f"AudioBuffer({self.seconds:.2f}s, {self.sample_rate} Hz, {self.channels} ch, "
+                f"{self.dtype}{where})")
+
+    def resampled(self, sample_rate=TARGET_RATE):
+        """Mono PCM16 mit sample_rate; passt das Format schon, ohne Kopie derselbe Puffer"""
+        if self.sample_rate == sample_rate and self.channels == 1 and self.dtype == "int16":
+            return self
+        if self.dtype != "int16" or self.channels > 2 or audioop is None:
+            raise ValueError(f"Umwandlung von {self!r} nicht möglich")
+        pcm = self.data
+        if self.channels == 2:
+            pcm = audioop.tomono(pcm, 2, 0.5, 0.5)
+        if self.sample_rate != sample_rate:
+            pcm, _ = audioop.ratecv(pcm, 2, 1, self.sample_rate, sample_rate, None)
+        return AudioBuffer(pcm, sample_rate)
+
+    # --- Ausschnitte ohne Kopie ---
+
+    def _view(self, start, end):
+        return AudioBuffer(self._base, self.sample_rate, self.channels, self.dtype,
+                           self._shm, self._start + start, self._start + end)
+
+    def __getitem__(self, frames):
+        """buffer[a:b] in Frames"""
+        if not isinstance(frames, slice) or frames.step not in (None, 1):
+            raise TypeError("nur zusammenhängende Ausschnitte [a:b]")
+        start, end, _ = frames.indices(self.frames)
+        return self._view(start * self.frame_bytes, max(start, end) * self.frame_bytes)
+
+    def clip(self, start_seconds, end_seconds=None):
+        end = self.frames if end_seconds is None else int(end_seconds * self.sample_rate)
+        return self[int(start_seconds * self.sample_rate):end]
+
+    def byte_range(self, start, end):
+        """Ausschnitt nach Byte-Offsets (z.B. aus aegis_vad.pause_ranges); muss auf Frames fallen"""
+        if start % self.frame_bytes or end % self.frame_bytes:
+            raise ValueError("Byte-Offsets liegen nicht auf Frame-Grenzen")
+        return self._view(start, end)
+
+    # --- Shared Memory ---
+
+    def share(self):
+        """In ein neues Shared-Memory-Segment kopieren (geteilte Puffer bleiben, wie sie sind)"""
+        if self._shm is not None:
+            return self
+        shm = shared_memory.SharedMemory(create=True, size=max(1, self.nbytes))
+        shm.buf[:self.nbytes] = self.data
+        return AudioBuffer(None, self.sample_rate, self.channels, self.dtype, shm, 0, self.nbytes)
+
+    def release(self):
+        """Segment löschen (aus jedem Prozess der Familie); bestehende Sichten bleiben lesbar"""
+        if self._shm is not None:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass  # schon gelöscht
+
+    def __reduce__(self):
+        if self._shm is None:
+            return AudioBuffer, (self.tobytes(), self.sample_rate, self.channels, self.dtype)
+        return _attach, (self._shm.name, self._start, self._end, self.sample_rate, self.channels, self.dtype)
+
+    # --- Ausgabe ---
+
+    def write_wav(self, wav_file):
+        """Als WAV schreiben (nur int16); gibt wav_file zurück"""
+        if self.dtype != "int16":
+            raise ValueError("WAV-Ausgabe nur für int16")
+        with wave.open(wav_file if hasattr(wav_file, "write") else str(wav_file), "wb") as wav:
+            wav.setnchannels(self.channels)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.data)
+        return wav_file
+
+    def wav_buffer(self):
+        """WAV im BytesIO (z.B. für sr.AudioFile)"""
+        buffer = io.BytesIO()
+        self.write_wav(buffer)
+        buffer.seek(0)
+        return buffer
+
+
+# Pro Prozess nur einmal einhängen, auch wenn viele Ausschnitte ankommen; das Segment
+# wird ausgehängt, sobald kein Puffer mehr darauf zeigt
+_attached = weakref.WeakValueDictionary()
+
+
+def _attach(name, start, end, sample_rate, channels, dtype):
+    shm = _attached.get(name)
+    if shm is None:
+        shm = _attached[name] = shared_memory.SharedMemory(name=name)
+    return AudioBuffer(None, sample_rate, channels, dtype, shm, start, end)
+
+
+def as_audio_buffer(audio, sample_rate=TARGET_RATE):
+    """Mono PCM16 mit sample_rate aus einem AudioBuffer oder einer Datei (Pfad)"""
+    if isinstance(audio, AudioBuffer):
+        return audio.resampled(sample_rate)
+    return AudioBuffer.from_file(audio, sample_rate)
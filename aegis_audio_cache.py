@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Audio-Cache
+Inhaltsadressierter Festplatten-Cache für synthetisierte Antworten.
+Schlüssel ist (Modellname, Sprache, normalisierter Text) plus Ausgabeformat
+(Dateiendung: .wav oder das fertig kodierte .ogg); bei einem Treffer wird
+weder das Modell angefasst noch neu kodiert.
+
+- LRU-Verdrängung unter einem Byte-Budget (Zugriffszeit = mtime der Datei)
+- Schreiben über temporäre Datei + os.replace, Leser sehen nie halbe Dateien
+- Mehrere Prozesse dürfen denselben Cache-Ordner gleichzeitig lesen
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unicodedata
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def normalize_text(text):
+    """Unicode-NFC und zusammengefasste Leerzeichen"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model_name, language, text):
+    """SHA-256 über (Modell, Sprache, normalisierter Text)"""
+    payload = json.dumps([model_name, language or "", normalize_text(text)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """LRU-Cache für Audiodateien mit Byte-Budget und Trefferzählern"""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key, suffix):
+        # Format gehört zum Eintrag: WAV und OGG desselben Textes liegen nebeneinander
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _scan(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue  # parallel von anderem Prozess verdrängt
+            entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def get(self, model_name, language, text, suffix=".wav"):
+        """Pfad der gecachten Audiodatei oder None"""
+        path = self._path(cache_key(model_name, language, text), suffix)
+        try:
+            os.utime(path)  # als zuletzt benutzt markieren
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def copy_to(self, model_name, language, text, output_file, suffix=".wav"):
+        """Treffer nach output_file kopieren; False bei Fehlgriff, auch wenn der Eintrag
+        zwischen Nachschlagen und Kopieren verdrängt wurde. Der Cache-Pfad selbst geht
+        nicht nach außen, eine spätere Verdrängung trifft also keinen Aufrufer.
+        """
+        path = self._path(cache_key(model_name, language, text), suffix)
+        try:
+            os.utime(path)
+            shutil.copyfile(path, output_file)
+        except OSError:  # meist FileNotFoundError: gerade verdrängt
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, model_name, language, text, audio_file, suffix=".wav"):
+        """Kopiere audio_file in den Cache und gib den Cache-Pfad zurück"""
+        path = self._path(cache_key(model_name, language, text), suffix)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as dst, open(audio_file, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            size = os.path.getsize(tmp_path)
+            try:
+                replaced = os.path.getsize(path)  # überschriebener Eintrag zählt nicht doppelt
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self.stores += 1
+            self._total_bytes += size - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return path
+
+    def _evict(self):
+        """Älteste Einträge löschen, bis das Budget wieder passt (Lock gehalten)"""
+        entries = sorted(self._scan(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    def stats(self):
+        """Zähler für Monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Audio-Dekodierung
+Dekodiert OGG/Opus/MP3 im Prozess (PyAV) zu 16 kHz Mono PCM16 im
+Speicher; PCM-WAV liest die Standardbibliothek direkt. Formate, die PyAV
+nicht kann, gehen an ffmpeg – aber per Pipe, ohne Zwischendatei in /tmp.
+"""
+
+import io
+import subprocess
+import warnings
+import wave
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop  # ab Python 3.13 nicht mehr vorhanden
+    except ImportError:
+        audioop = None
+
+TARGET_RATE = 16000
+
+
+def decode_with_wave(audio_file, sample_rate=TARGET_RATE):
+    """PCM16-WAV direkt mit der Standardbibliothek lesen (kein Decoder nötig)"""
+    with wave.open(str(audio_file), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError("nur 16-bit PCM")
+        channels, rate = wav.getnchannels(), wav.getframerate()
+        pcm = wav.readframes(wav.getnframes())
+    if channels != 1 or rate != sample_rate:
+        if audioop is None:
+            raise ValueError("Resampling ohne audioop nicht möglich")
+        if channels == 2:
+            pcm = audioop.tomono(pcm, 2, 0.5, 0.5)
+        elif channels != 1:
+            raise ValueError(f"{channels} Kanäle nicht unterstützt")
+        if rate != sample_rate:
+            pcm, _ = audioop.ratecv(pcm, 2, 1, rate, sample_rate, None)
+    return pcm
+
+
+def decode_with_pyav(audio_file, sample_rate=TARGET_RATE):
+    """Dekodiere und resample im Prozess, gibt rohe PCM16-Mono-Bytes zurück"""
+    import av
+
+    chunks = []
+    with av.open(str(audio_file)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                chunks.append(bytes(out.planes[0])[:out.samples * 2])
+        for out in resampler.resample(None):  # Resampler leeren
+            chunks.append(bytes(out.planes[0])[:out.samples * 2])
+    return b"".join(chunks)
+
+
+def decode_with_ffmpeg(audio_file, sample_rate=TARGET_RATE):
+    """Fallback: ffmpeg dekodiert nach stdout, ebenfalls ohne Temp-Datei"""
+    result = subprocess.run([
+        'ffmpeg', '-v', 'error', '-i', str(audio_file),
+        '-ar', str(sample_rate), '-ac', '1',
+        '-f', 's16le', '-'
+    ], check=True, capture_output=True)
+    return result.stdout
+
+
+def decode_to_pcm(audio_file, sample_rate=TARGET_RATE):
+    """PCM16 Mono Bytes: WAV direkt, sonst PyAV, dann ffmpeg"""
+    if str(audio_file).lower().endswith('.wav'):
+        try:
+            return decode_with_wave(audio_file, sample_rate)
+        except (wave.Error, ValueError, EOFError):
+            pass
+    try:
+        return decode_with_pyav(audio_file, sample_rate)
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"ℹ️ PyAV konnte {audio_file} nicht dekodieren ({e}), nutze ffmpeg")
+    return decode_with_ffmpeg(audio_file, sample_rate)
+
+
+def pcm_to_wav_buffer(pcm, sample_rate=TARGET_RATE):
+    """Verpacke PCM16 Mono als WAV in einem BytesIO (für sr.AudioFile)"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    buffer.seek(0)
+    return buffer
+
+
+def decode_to_wav_buffer(audio_file, sample_rate=TARGET_RATE):
+    """Audio-Datei -> 16 kHz Mono WAV im Speicher"""
+    return pcm_to_wav_buffer(decode_to_pcm(audio_file, sample_rate), sample_rate)
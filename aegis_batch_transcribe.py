@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Batch-Transkription
+Transkribiert ganze Archive (z.B. /root/.clawdbot/media/inbound/) statt einer
+Datei pro Prozessstart:
+
+- Prozess-Pool, jeder Worker lädt sein ASR-Backend einmal und bleibt warm
+- Ergebnisse als JSON-Zeilen, sofort geschrieben (flush + fsync pro Datei)
+- die Ausgabe ist zugleich der Checkpoint: ein erneuter Lauf überspringt,
+  was schon drinsteht, und setzt nach einem Absturz an derselben Stelle fort
+- Fortschritt mit Dateien/s und Audio-Stunden/s
+
+Start: python3 aegis_batch_transcribe.py /root/.clawdbot/media/inbound/ [--output transkripte.jsonl]
+       python3 aegis_batch_transcribe.py "/archiv/**/*.ogg" --workers 4 --backend whisper
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from aegis_asr import get_recognizer, transcribe_chunks
+from aegis_audio_buffer import AudioBuffer
+from aegis_tts_pool import default_workers
+from aegis_vad import pause_ranges
+
+DEFAULT_PATTERN = "*.ogg"
+PROGRESS_INTERVAL = 5.0
+
+_recognizer = None  # pro Worker-Prozess
+
+
+def find_audio_files(sources, pattern=DEFAULT_PATTERN):
+    """Ordner (rekursiv nach pattern) und Glob-Muster zu einer Dateiliste auflösen"""
+    files = set()
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            files.update(p for p in path.rglob(pattern) if p.is_file())
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(source, recursive=True) if os.path.isfile(p))
+    return sorted(p.resolve() for p in files)
+
+
+def load_checkpoint(output):
+    """Bereits erledigte Dateien (Pfad -> Größe) aus der JSONL-Ausgabe; halbe letzte Zeile wird abgeschnitten"""
+    done = {}
+    if not output.exists():
+        return done
+    valid_bytes = 0
+    with open(output, "rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # beim Absturz nur halb geschrieben
+            if not line.endswith(b"\n"):
+                break
+            valid_bytes += len(line)
+            done[record["file"]] = record
+    if valid_bytes < output.stat().st_size:
+        with open(output, "r+b") as f:
+            f.truncate(valid_bytes)
+    return done
+
+
+def _init_worker(backend, threads):
+    global _recognizer
+    os.environ.setdefault("AEGIS_ASR_THREADS", str(threads))
+    _recognizer = get_recognizer(backend)  # Modell einmal pro Worker laden
+
+
+def transcribe_file(path):
+    """Eine Datei im Worker transkribieren; liefert den JSONL-Datensatz"""
+    started = time.perf_counter()
+    record = {"file": str(path), "size": os.path.getsize(path)}
+    try:
+        audio = AudioBuffer.from_file(path)
+        chunks = [audio.byte_range(start, end) for start, end in pause_ranges(audio.data, audio.sample_rate)]
+        record["audio_seconds"] = round(audio.seconds, 3)
+        # Nur echte Stille (keine VAD-Stücke) gilt mit leerem Text als erledigt
+        result = transcribe_chunks(chunks, _recognizer) if chunks else ("", None)
+        if result is None:
+            record["error"] = "nichts erkannt"
+        else:
+            record["text"], record["language"] = result
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - started, 3)
+    return record
+
+
+class BatchProgress:
+    """Zähler für Dateien/s und Audio-Stunden/s"""
+
+    def __init__(self, total):
+        self.total = total
+        self.files = 0
+        self.failed = 0
+        self.audio_seconds = 0.0
+        self.started = time.perf_counter()
+        self._last_report = self.started
+
+    def add(self, record):
+        self.files += 1
+        self.failed += "error" in record
+        self.audio_seconds += record.get("audio_seconds", 0.0)
+
+    def line(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (f"{self.files}/{self.total} Dateien ({self.failed} Fehler), "
+                f"{self.files / elapsed:.2f} Dateien/s, "
+                f"{self.audio_seconds / 3600 / elapsed:.4f} Audio-Stunden/s "
+                f"(RTF {elapsed / self.audio_seconds if self.audio_seconds else 0:.3f})")
+
+    def maybe_report(self):
+        now = time.perf_counter()
+        if now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            print(f"⏳ {self.line()}")
+
+
+def run_batch(files, output, workers=None, backend=None, window=None):
+    """Dateien über den Pool transkribieren, Ergebnisse an output anhängen; gibt BatchProgress zurück"""
+    workers = workers or default_workers()
+    threads = max(1, default_workers() // workers)
+    window = window or workers * 4  # begrenzt, wie viele Aufträge gleichzeitig unterwegs sind
+    # Lange Dateien zuerst (pop() vom Ende), damit am Ende keine Riesendatei allein läuft
+    queue = sorted(files, key=os.path.getsize)
+    progress = BatchProgress(len(queue))
+
+    with open(output, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(backend, threads)) as pool:
+        pending = set()
+        try:
+            while queue or pending:
+                while queue and len(pending) < window:
+                    pending.add(pool.submit(transcribe_file, queue.pop()))
+                done, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record = future.result()
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    progress.add(record)
+                if done:
+                    out.flush()
+                    os.fsync(out.fileno())  # Checkpoint: was hier steht, wird nicht wiederholt
+                progress.maybe_report()
+        except KeyboardInterrupt:
+            for future in pending:
+                future.cancel()
+            print("\n⏹️ Abgebrochen, Fortsetzung mit demselben Aufruf")
+            raise
+    return progress
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sources", nargs="+", help="Ordner, Dateien oder Glob-Muster")
+    parser.add_argument("--output", default="transcripts.jsonl", help="JSONL-Ausgabe und Checkpoint")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN, help="Dateimuster in Ordnern")
+    parser.add_argument("--workers", type=int, default=None, help="Worker-Prozesse (Standard: alle Kerne)")
+    parser.add_argument("--backend", default=None, help="ASR-Backend (Standard: AEGIS_ASR_BACKEND)")
+    parser.add_argument("--retry-errors", action="store_true", help="fehlgeschlagene Dateien erneut versuchen")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    done = load_checkpoint(output)
+    files = find_audio_files(args.sources, args.pattern)
+    todo = [
+        path for path in files
+        if str(path) not in done
+        or done[str(path)].get("size") != path.stat().st_size
+        or (args.retry_errors and "error" in done[str(path)])
+    ]
+    print(f"🛡️ Batch-Transkription: {len(files)} Dateien, {len(files) - len(todo)} schon erledigt, "
+          f"{len(todo)} offen -> {output}")
+    if not todo:
+        return 0
+
+    try:
+        progress = run_batch(todo, output, args.workers, args.backend)
+    except KeyboardInterrupt:
+        return 130
+    print(f"✅ {progress.line()}")
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Benchmark-Hilfen
+Gemeinsame Werkzeuge für die bench_*.py Skripte: Skript-Loader,
+Stub-Engines ohne Modell und einfache Latenz-Statistik.
+"""
+
+import importlib.util
+import io
+import json
+import math
+import socket
+import ssl
+import struct
+import sys
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+
+def load_script(filename):
+    """Lade ein Skript mit Bindestrich im Namen (z.B. coqui-voice-chat.py) als Modul"""
+    path = BASE_DIR / filename
+    module_name = path.stem.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Mitgelieferte Sprachclips (de/en, mit eSpeak NG erzeugt, 16 kHz Mono Opus);
+# Soll-Texte und Sprache stehen in transcripts.json
+FIXTURE_DIR = BASE_DIR / "fixtures" / "voice"
+
+
+def synthetic_pcm(seconds, sample_rate=16000, lead_silence=0.5, trail_silence=0.5, freq=220.0):
+    """Deterministischer "Sprach"-Clip: Stille, silbenartige Tonstöße, Stille (PCM16 Mono)"""
+    out = bytearray()
+    lead = int(lead_silence * sample_rate)
+    body = int(max(0.0, seconds - lead_silence - trail_silence) * sample_rate)
+    trail = int(trail_silence * sample_rate)
+    out += b"\x00\x00" * lead
+    syllable = int(0.18 * sample_rate)
+    for i in range(body):
+        # 180 ms Silben mit kurzen Lücken, leicht schwankende Tonhöhe
+        position = i % syllable
+        if position > syllable * 0.8:
+            value = 0
+        else:
+            envelope = math.sin(math.pi * position / (syllable * 0.8))
+            pitch = freq * (1.0 + 0.2 * math.sin(2 * math.pi * i / sample_rate))
+            value = int(9000 * envelope * math.sin(2 * math.pi * pitch * i / sample_rate))
+        out += struct.pack('<h', value)
+    out += b"\x00\x00" * trail
+    return bytes(out)
+
+
+def fixture_transcripts():
+    """Soll-Transkripte der Fixture-Clips: {Dateiname: {"language": ..., "text": ...}}"""
+    return json.loads((FIXTURE_DIR / "transcripts.json").read_text(encoding="utf-8"))
+
+
+def fixture_fingerprint():
+    """SHA-256 über transcripts.json und alle Clips, damit Ergebnisse nur mit denselben Clips verglichen werden"""
+    import hashlib
+
+    digest = hashlib.sha256((FIXTURE_DIR / "transcripts.json").read_bytes())
+    for name in sorted(fixture_transcripts()):
+        digest.update(name.encode())
+        digest.update((FIXTURE_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def fixture_clips(sample_rate=16000, durations=(2.0, 4.0, 10.0)):
+    """Liste von (Name, PCM16-Bytes): die Clips aus fixtures/voice/ plus synthetische Clips.
+
+    Fehlt ein Clip aus transcripts.json oder lässt er sich nicht dekodieren, gibt es
+    einen Fehler statt stillschweigend nur synthetischem Audio.
+    """
+    from aegis_audio_decode import decode_to_pcm
+
+    clips = []
+    for name in sorted(fixture_transcripts()):
+        clips.append((name, decode_to_pcm(FIXTURE_DIR / name, sample_rate)))
+    for seconds in durations:
+        clips.append((f"synthetic_{seconds:g}s", synthetic_pcm(seconds, sample_rate)))
+    return clips
+
+
+class PcmAudio:
+    """Minimaler Ersatz für speech_recognition.AudioData (PCM16 Mono)"""
+
+    def __init__(self, frame_data, sample_rate=16000, sample_width=2):
+        self.frame_data = frame_data
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+
+    def get_wav_data(self, convert_rate=None, convert_width=None):
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(self.sample_width)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.frame_data)
+        return buffer.getvalue()
+
+
+def audio_data(pcm, sample_rate=16000):
+    """sr.AudioData wenn speech_recognition installiert ist, sonst PcmAudio"""
+    try:
+        import speech_recognition as sr
+    except ImportError:
+        return PcmAudio(pcm, sample_rate)
+    return sr.AudioData(pcm, sample_rate, 2)
+
+
+class StubRecognizer:
+    """ASR-Attrappe: feste Latenz plus Anteil der Audiodauer (Real-Time-Faktor)"""
+
+    name = "stub"
+
+    def __init__(self, latency=0.05, rtf=0.1, text="Hallo Aegis, wie geht es dir?"):
+        self.latency = latency
+        self.rtf = rtf
+        self.text = text
+
+    def transcribe(self, audio):
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        time.sleep(self.latency + self.rtf * seconds)
+        return self.text, "de"
+
+
+def write_tone_wav(path, seconds=1.0, sample_rate=16000, freq=440.0, amplitude=0.3):
+    """Schreibe eine Mono-PCM16-WAV mit Sinuston (für Fixture-Clips)"""
+    frames = int(seconds * sample_rate)
+    peak = int(32767 * amplitude)
+    samples = (int(peak * math.sin(2 * math.pi * freq * i / sample_rate)) for i in range(frames))
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b''.join(struct.pack('<h', s) for s in samples))
+    return str(path)
+
+
+class StubTTS:
+    """Deterministische TTS-Attrappe mit Coqui-kompatibler tts_to_file() Schnittstelle"""
+
+    def __init__(self, model_name="stub/de/thorsten", load_delay=0.0, char_delay=0.0, sample_rate=22050,
+                 cpu_bound=False, weights_mb=0):
+        time.sleep(load_delay)
+        self.weights = b"\x01" * (weights_mb << 20)  # belegter Speicher wie Modellgewichte
+        self.model_name = model_name
+        self.char_delay = char_delay
+        self.sample_rate = sample_rate
+        self.cpu_bound = cpu_bound  # rechnen statt schlafen, wie ein echtes Modell auf der CPU
+
+    def tts_to_file(self, text, file_path, **kwargs):
+        if self.cpu_bound:
+            deadline = time.thread_time() + self.char_delay * len(text)
+            while time.thread_time() < deadline:
+                pass
+        else:
+            time.sleep(self.char_delay * len(text))
+        # ~60 ms Audio pro Zeichen, grob wie echte Sprache
+        write_tone_wav(file_path, seconds=max(0.1, 0.06 * len(text)), sample_rate=self.sample_rate)
+        return file_path
+
+
+class StubApiHandler(BaseHTTPRequestHandler):
+    """OpenAI-artiger Stub: /audio/transcriptions (JSON) und /audio/speech (gestückeltes Audio)"""
+
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+
+    def setup(self):
+        super().setup()
+        # Sonst verzögert Nagle + Delayed-ACK jede Keep-Alive-Antwort um ~40 ms
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/audio/speech"):
+            # Audio in Stücken, wie ein TTS-Dienst, der während der Synthese sendet
+            chunk = b"\xff" * 16384
+            chunks = self.server.audio_bytes // len(chunk)
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/mpeg")
+            self.send_header("Content-Length", str(chunks * len(chunk)))
+            self.end_headers()
+            for _ in range(chunks):
+                time.sleep(self.server.chunk_delay)
+                self.wfile.write(chunk)
+                self.wfile.flush()
+        else:
+            body = json.dumps({"text": "Hallo Aegis, wie geht es dir?"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+def start_stub_api(audio_bytes=256 * 1024, chunk_delay=0.0, latency=0.0, tls=None):
+    """Stub-API im Hintergrund-Thread starten; tls=(cert, key) für HTTPS. Gibt (server, base_url) zurück"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubApiHandler)
+    server.audio_bytes = audio_bytes
+    server.chunk_delay = chunk_delay
+    server.latency = latency
+    scheme = "http"
+    if tls:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*tls)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://localhost:{server.server_address[1]}/v1"
+
+
+def percentile(samples, pct):
+    """Perzentil per linearer Interpolation"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Kennzahlen einer Latenz-Messreihe (Sekunden)"""
+    return {
+        'n': len(samples),
+        'mean': sum(samples) / len(samples) if samples else 0.0,
+        'p50': percentile(samples, 50),
+        'p95': percentile(samples, 95),
+        'p99': percentile(samples, 99),
+    }
+
+
+def print_summary(label, samples):
+    """Gib eine Messreihe in Millisekunden aus"""
+    s = summarize(samples)
+    print(f"📊 {label:<28} n={s['n']:<4} mean={s['mean'] * 1000:8.1f} ms  "
+          f"p50={s['p50'] * 1000:8.1f} ms  p95={s['p95'] * 1000:8.1f} ms")
+    return s
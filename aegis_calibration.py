@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Kalibrierung pro Absender
+Die VAD-Schwelle wird sonst aus jeder Nachricht allein geschätzt (leiseste
+Frames = Grundrauschen). Kurze Notizen ohne echte Pause liefern dabei ein zu
+hohes Rauschniveau, und die ersten Wörter fallen unter die Schwelle.
+
+Hier lernt jeder Absender (Chat-ID, Gerät) sein Rauschprofil über mehrere
+Nachrichten: Grundrauschen und Sprachpegel als gleitende Mittel, aktualisiert
+nur aus Nachrichten mit erkennbarer Stille. Bekannte Absender bekommen die
+Schwelle direkt aus dem Profil, ohne Kalibrierfenster.
+
+Die Profile liegen im Speicher, höchstens max_senders (LRU-Verdrängung,
+Standard über AEGIS_CALIBRATION_SENDERS).
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from aegis_trace import current_span
+from aegis_vad import MIN_THRESHOLD, estimate_threshold, frame_energies
+
+DEFAULT_MAX_SENDERS = int(os.getenv("AEGIS_CALIBRATION_SENDERS", 10000))
+QUIET_RATIO = 4  # Nachricht enthält Stille, wenn 10. Perzentil <= 90. Perzentil / 4 (12 dB)
+
+
+class NoiseProfile:
+    """Gelerntes Grundrauschen und Sprachpegel eines Absenders (RMS-Energie pro Frame)"""
+
+    __slots__ = ("noise_floor", "speech_level", "messages")
+
+    def __init__(self):
+        self.noise_floor = None
+        self.speech_level = None
+        self.messages = 0
+
+    @property
+    def threshold(self):
+        """Wie estimate_threshold (3x Grundrauschen), aber nie über dem halben Sprachpegel"""
+        threshold = max(MIN_THRESHOLD, self.noise_floor * 3)
+        if self.speech_level:
+            threshold = min(threshold, max(MIN_THRESHOLD, self.speech_level / 2))
+        return threshold
+
+    def update(self, floor, level, alpha):
+        if floor is not None:
+            if self.noise_floor is None:
+                self.noise_floor = floor
+            else:
+                # Lauter werdende Umgebung nur schrittweise (höchstens Verdopplung pro Nachricht)
+                floor = min(floor, self.noise_floor * 2)
+                self.noise_floor += alpha * (floor - self.noise_floor)
+        self.speech_level = level if self.speech_level is None else self.speech_level + alpha * (level - self.speech_level)
+        self.messages += 1
+
+
+class CalibrationCache:
+    """Rauschprofile pro Absender mit LRU-Grenze"""
+
+    def __init__(self, max_senders=None, alpha=0.3):
+        self.max_senders = max_senders or DEFAULT_MAX_SENDERS
+        self.alpha = alpha
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def calibrate(self, sender, pcm, sample_rate=16000):
+        """Schwelle für diese Nachricht und Profil-Update; gibt (Schwelle, Frame-Energien) zurück.
+
+        Die Energien können an split_at_pauses(energies=...) weitergereicht werden.
+        """
+        energies = frame_energies(pcm, sample_rate)
+        if sender is None or not energies:
+            return estimate_threshold(energies), energies
+
+        ordered = sorted(energies)
+        floor = ordered[len(ordered) // 10]
+        level = ordered[len(ordered) * 9 // 10]
+        has_silence = floor * QUIET_RATIO <= level
+
+        with self._lock:
+            profile = self._profiles.get(sender)
+            if profile is None:
+                self.misses += 1
+                profile = self._profiles[sender] = NoiseProfile()
+                while len(self._profiles) > self.max_senders:
+                    self._profiles.popitem(last=False)
+                    self.evicted += 1
+            else:
+                # Jeder Zugriff zählt für LRU, auch solange noch kein Rauschboden gelernt ist
+                self._profiles.move_to_end(sender)
+                if profile.noise_floor is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            calibrated = profile.noise_floor is not None
+            profile.update(floor if has_silence else None, level, self.alpha)
+            if profile.noise_floor is not None:
+                threshold = profile.threshold
+            else:
+                threshold = estimate_threshold(energies)  # noch kein Profil: wie bisher aus der Nachricht
+
+        current_span().set(calibrated=calibrated, vad_threshold=round(threshold))
+        return threshold, energies
+
+    def profile(self, sender):
+        with self._lock:
+            return self._profiles.get(sender)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "senders": len(self._profiles),
+                "max_senders": self.max_senders,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+            }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis eSpeak Engine
+eSpeak als residente Engine statt eines neuen espeak-Prozesses pro Antwort:
+libespeak-ng (bzw. libespeak) wird per ctypes einmal initialisiert, die
+Stimme bleibt eingestellt, jede Synthese ist nur noch ein Funktionsaufruf.
+synthesize_batch() erzeugt mehrere Antworten in einem Aufruf.
+
+Ohne Bibliothek bleibt es beim bisherigen Weg (espeak -w pro Aufruf).
+Ein langlebiger "espeak --stdin"-Prozess taugt nicht als Ersatz: er schreibt
+alle Äußerungen in einen einzigen WAV-Strom ohne Grenzen dazwischen.
+
+    engine = get_espeak()
+    engine.synthesize_to_file("Hallo Ironman!", "antwort.wav")
+    engine.synthesize_batch(["Eins.", "Zwei."], ["1.wav", "2.wav"])
+"""
+
+import ctypes
+import ctypes.util
+import shutil
+import subprocess
+import threading
+import wave
+
+# Beste eSpeak-Einstellungen für Deutsch (wie bisher auf der Kommandozeile)
+VOICE = "de+f3"   # Deutsche weibliche Stimme
+RATE = 120        # Langsamer als vorhin
+PITCH = 32        # Tiefere Stimme
+AMPLITUDE = 140   # Lautstärke
+WORD_GAP = 12     # Längere Pausen (in 10 ms)
+
+# speak_lib.h
+_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_INITIALIZE_DONT_EXIT = 0x8000
+_POS_CHARACTER = 1
+_CHARS_UTF8 = 1
+_RATE, _VOLUME, _PITCH, _WORDGAP = 1, 2, 3, 7
+
+_SYNTH_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+
+class EspeakUnavailable(RuntimeError):
+    """Weder libespeak(-ng) noch ein espeak-Programm vorhanden"""
+
+
+def _write_wav(file_path, pcm, sample_rate):
+    with wave.open(str(file_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return str(file_path)
+
+
+class EspeakLibrary:
+    """Residente eSpeak-Engine über libespeak-ng; ein Aufruf zur Zeit (die Bibliothek ist global)"""
+
+    def __init__(self, voice=VOICE, rate=RATE, pitch=PITCH, amplitude=AMPLITUDE, word_gap=WORD_GAP):
+        name = ctypes.util.find_library("espeak-ng") or ctypes.util.find_library("espeak")
+        if not name:
+            raise EspeakUnavailable("libespeak-ng nicht gefunden")
+        lib = ctypes.CDLL(name)
+        lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        lib.espeak_SetSynthCallback.argtypes = [_SYNTH_CALLBACK]
+        lib.espeak_SetSynthCallback.restype = None
+        lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        lib.espeak_SetParameter.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.espeak_Synth.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+                                     ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p]
+
+        self.sample_rate = lib.espeak_Initialize(_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, _INITIALIZE_DONT_EXIT)
+        if self.sample_rate <= 0:
+            raise EspeakUnavailable(f"espeak_Initialize fehlgeschlagen ({self.sample_rate})")
+        self._lib = lib
+        self._chunks = []
+        self._callback = _SYNTH_CALLBACK(self._collect)  # Referenz halten, sonst räumt die GC sie weg
+        lib.espeak_SetSynthCallback(self._callback)
+
+        if lib.espeak_SetVoiceByName(voice.encode()) != 0:
+            raise EspeakUnavailable(f"Stimme {voice} nicht verfügbar")
+        for parameter, value in ((_RATE, rate), (_PITCH, pitch), (_VOLUME, amplitude), (_WORDGAP, word_gap)):
+            lib.espeak_SetParameter(parameter, value, 0)
+        self.backend = "libespeak-ng" if "espeak-ng" in name else "libespeak"
+        self.utterances = 0
+        self._lock = threading.RLock()
+
+    def _collect(self, wav, numsamples, events):
+        if wav and numsamples > 0:
+            self._chunks.append(ctypes.string_at(wav, numsamples * 2))
+        return 0  # weitermachen
+
+    def synthesize(self, text):
+        """Text -> PCM16 Mono mit self.sample_rate"""
+        data = text.encode("utf-8")
+        with self._lock:
+            self._chunks = []
+            error = self._lib.espeak_Synth(data, len(data) + 1, 0, _POS_CHARACTER, 0, _CHARS_UTF8, None, None)
+            self._lib.espeak_Synchronize()
+            pcm, self._chunks = b"".join(self._chunks), []
+            self.utterances += 1
+        if error != 0:
+            raise RuntimeError(f"espeak_Synth fehlgeschlagen ({error})")
+        return pcm
+
+    def synthesize_to_file(self, text, file_path):
+        return _write_wav(file_path, self.synthesize(text), self.sample_rate)
+
+    def synthesize_batch(self, texts, file_paths):
+        """Mehrere Äußerungen in einem Aufruf; gibt die Pfade zurück"""
+        with self._lock:  # Stapel am Stück, andere Aufrufer warten dahinter
+            return [self.synthesize_to_file(text, path) for text, path in zip(texts, file_paths)]
+
+
+class EspeakProcess:
+    """Bisheriger Weg: ein espeak-Prozess pro Äußerung"""
+
+    backend = "subprocess"
+
+    def __init__(self, voice=VOICE, rate=RATE, pitch=PITCH, amplitude=AMPLITUDE, word_gap=WORD_GAP):
+        self.program = shutil.which("espeak") or shutil.which("espeak-ng")
+        if not self.program:
+            raise EspeakUnavailable("espeak nicht installiert")
+        self.args = ["-v", voice, "-s", str(rate), "-p", str(pitch), "-a", str(amplitude), "-g", str(word_gap)]
+        self.utterances = 0
+
+    def synthesize_to_file(self, text, file_path):
+        subprocess.run([self.program, *self.args, "-w", str(file_path), text], check=True, capture_output=True)
+        self.utterances += 1
+        return str(file_path)
+
+    def synthesize_batch(self, texts, file_paths):
+        return [self.synthesize_to_file(text, path) for text, path in zip(texts, file_paths)]
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_espeak():
+    """Gemeinsame eSpeak-Engine des Prozesses (Bibliothek, sonst Programmaufruf)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            try:
+                _engine = EspeakLibrary()
+            except (EspeakUnavailable, OSError, AttributeError):
+                _engine = EspeakProcess()
+        return _engine
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Gesprächsverlauf
+Die letzten Züge eines Gesprächs liegen in einem Ring fester Größe im
+Speicher (Kontext für Antworten). Der vollständige Verlauf wird nur angehängt,
+in SQLite, und übersteht so Neustarts.
+
+- last(n): aus dem Ring, ältere Züge über den Index (conversation, seq)
+- alle COMPACT_INTERVAL Züge wird das WAL in die Datenbank zurückgeschrieben;
+  gelöscht wird dabei nichts
+- Ausdünnen nur auf Wunsch: mit keep_turns bleiben pro Gespräch nur die
+  neuesten keep_turns Züge, ältere sind dann endgültig weg
+"""
+
+import sqlite3
+import threading
+from collections import deque
+from pathlib import Path
+
+DEFAULT_RING_SIZE = 20
+COMPACT_INTERVAL = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    conversation TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    user TEXT,
+    ai TEXT,
+    timestamp TEXT,
+    PRIMARY KEY (conversation, seq)
+) WITHOUT ROWID;
+"""
+
+
+class ConversationHistory:
+    """Begrenzter Verlauf eines Gesprächs: Ring im Speicher, Journal auf der Platte
+
+    Verhält sich beim Anhängen und Iterieren wie die bisherige Liste von
+    dicts ({'user', 'ai', 'timestamp'}), hält aber höchstens ring_size Züge.
+    Ohne db_path bleibt nur der Ring (nichts wird gespeichert). keep_turns=None
+    (Standard) behält den vollständigen Verlauf.
+    """
+
+    def __init__(self, conversation="default", db_path=None, ring_size=DEFAULT_RING_SIZE,
+                 keep_turns=None, compact_every=COMPACT_INTERVAL):
+        self.conversation = conversation
+        self.keep_turns = keep_turns
+        self.compact_every = compact_every
+        self.compactions = 0
+        self._ring = deque(maxlen=ring_size)
+        self._lock = threading.Lock()
+        self._db = None
+        self.turns = 0  # alle Züge des Gesprächs, auch die nicht mehr im Ring
+
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            last_seq = self._db.execute(
+                "SELECT MAX(seq) FROM turns WHERE conversation = ?", (conversation,)
+            ).fetchone()[0]
+            self.turns = last_seq or 0
+            self._ring.extend(self._query(ring_size))
+
+    def _query(self, n):
+        rows = self._db.execute(
+            "SELECT user, ai, timestamp FROM turns WHERE conversation = ? ORDER BY seq DESC LIMIT ?",
+            (self.conversation, n),
+        ).fetchall()
+        return [{"user": user, "ai": ai, "timestamp": timestamp} for user, ai, timestamp in reversed(rows)]
+
+    def append(self, turn):
+        """Zug anhängen: in den Ring und ans Journal"""
+        with self._lock:
+            self._ring.append(turn)
+            self.turns += 1
+            if self._db is None:
+                return
+            with self._db:
+                # seq im selben Statement vergeben: andere Prozesse dürfen dasselbe Gespräch fortsetzen
+                self._db.execute(
+                    "INSERT INTO turns (conversation, seq, user, ai, timestamp) "
+                    "SELECT ?1, COALESCE(MAX(seq), 0) + 1, ?2, ?3, ?4 FROM turns WHERE conversation = ?1",
+                    (self.conversation, turn.get("user"), turn.get("ai"), turn.get("timestamp")),
+                )
+                self.turns = self._db.execute(
+                    "SELECT MAX(seq) FROM turns WHERE conversation = ?", (self.conversation,)
+                ).fetchone()[0]
+            if self.turns % self.compact_every == 0:
+                self._compact()
+
+    def last(self, n):
+        """Die letzten n Züge, älteste zuerst"""
+        with self._lock:
+            if n <= len(self._ring) or self._db is None:
+                return list(self._ring)[-n:] if n > 0 else []
+            return self._query(n)
+
+    def compact(self):
+        with self._lock:
+            if self._db is not None:
+                self._compact()
+
+    def _compact(self):
+        if self.keep_turns is not None:
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM turns WHERE conversation = ? AND seq <= ?",
+                    (self.conversation, self.turns - self.keep_turns),
+                )
+        self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.compactions += 1
+
+    def __len__(self):
+        return len(self._ring)
+
+    def __iter__(self):
+        return iter(list(self._ring))
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis HTTP
+Gemeinsame requests-Session mit Keep-Alive-Pool, Timeouts und
+Retry/Backoff, plus Streaming-Download direkt auf die Platte.
+
+Uploads bleiben gepuffert: Sprachnachrichten sind klein, und nur ein
+gepufferter Body kann bei einem Retry erneut gesendet werden.
+"""
+
+import subprocess
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (Verbindungsaufbau, Lesen) in Sekunden
+DEFAULT_TIMEOUT = (5, 60)
+CHUNK_SIZE = 16 * 1024
+
+
+def create_session(pool_size=4, retries=3, backoff=0.5, headers=None):
+    """Session mit Verbindungspool; wiederholt 429/5xx und Verbindungsfehler mit Backoff"""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,  # auch POST: Whisper/TTS-Aufrufe sind idempotent
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def stream_to_file(response, path, player=None, chunk_size=CHUNK_SIZE):
+    """Antwort-Body stückweise auf die Platte (und optional in einen Player) schreiben.
+
+    player: Kommando, das Audio auf stdin abspielt, z.B. ['mpg123', '-q', '-'].
+    Gibt (Bytes, Sekunden bis zum ersten Byte) zurück.
+    """
+    started = time.perf_counter()
+    first_byte = None
+    total = 0
+    playback = None
+    if player:
+        try:
+            playback = subprocess.Popen(player, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"ℹ️ Wiedergabe nicht verfügbar ({e})")
+
+    try:
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                if first_byte is None:
+                    first_byte = time.perf_counter() - started
+                f.write(chunk)
+                total += len(chunk)
+                if playback:
+                    try:
+                        playback.stdin.write(chunk)
+                    except BrokenPipeError:
+                        playback = None
+    finally:
+        response.close()
+        if playback:
+            playback.stdin.close()
+            playback.wait()
+    return total, first_byte
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Inbox-Watcher
+Ereignisgesteuerte Überwachung des Telegram-Eingangsordners.
+
+- inotify (per ctypes, keine Zusatzpakete), sonst Polling als Fallback
+- jede neue Datei landet genau einmal in der Warteschlange
+- ein Ledger (eine Zeile pro verarbeitetem Dateinamen, fsync) sorgt dafür,
+  dass nach einem Neustart nichts doppelt verarbeitet und nichts verpasst wird
+- ins Ledger kommt nur Erfolgreiches; Fehlschläge kommen nach RETRY_DELAYS
+  erneut dran, danach erst wieder nach einem Neustart
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import heapq
+import os
+import select
+import struct
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT_HEADER = struct.Struct("iIII")
+RETRY_DELAYS = (30.0, 120.0, 600.0)  # Sekunden bis zum 1., 2., 3. Wiederholungsversuch
+
+
+def _open_inotify(directory):
+    """inotify-Deskriptor für directory oder None, wenn nicht verfügbar"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class InboxWatcher:
+    """Warteschlange neuer Dateien in einem Ordner mit dauerhaftem Verarbeitungs-Ledger"""
+
+    def __init__(self, directory, ledger_path=None, pattern="*.ogg", poll_interval=5.0, settle_seconds=1.0,
+                 retry_delays=RETRY_DELAYS):
+        self.directory = Path(directory)
+        self.ledger_path = Path(ledger_path or self.directory / ".aegis_processed")
+        self.pattern = pattern
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.retry_delays = retry_delays
+
+        self.pending = deque()
+        self.failures = {}  # Dateiname -> Fehlversuche seit dem Start
+        self._retry = []  # Heap aus (fällig, Dateiname, Pfad)
+        self.processed = self._load_ledger()
+        self._queued = set()
+        self._compact_ledger()
+
+        self._fd = _open_inotify(self.directory)
+        self.backend = "inotify" if self._fd is not None else "polling"
+        self._last_scan = 0.0
+        # Nachholen, was während der Downtime angekommen ist
+        self._scan(require_settled=self._fd is None)
+
+    def _load_ledger(self):
+        if not self.ledger_path.exists():
+            return set()
+        return {line for line in self.ledger_path.read_text(encoding="utf-8").splitlines() if line}
+
+    def _compact_ledger(self):
+        """Einträge für nicht mehr vorhandene Dateien verwerfen, damit das Ledger klein bleibt"""
+        if not self.processed:
+            return
+        existing = {name for name in self.processed if (self.directory / name).exists()}
+        if existing == self.processed:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.ledger_path.parent, prefix=".ledger_")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(f"{name}\n" for name in sorted(existing))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.ledger_path)
+        self.processed = existing
+
+    def _enqueue(self, name):
+        if name in self.processed or name in self._queued or not fnmatch.fnmatch(name, self.pattern):
+            return
+        self._queued.add(name)
+        self.pending.append(self.directory / name)
+
+    def _scan(self, require_settled=True):
+        now = time.time()
+        self._last_scan = now
+        for entry in sorted(os.scandir(self.directory), key=lambda e: e.name):
+            if entry.name in self.processed or entry.name in self._queued or not entry.is_file():
+                continue
+            # Beim Polling nur Dateien nehmen, die nicht mehr geschrieben werden
+            if require_settled and now - entry.stat().st_mtime < self.settle_seconds:
+                continue
+            self._enqueue(entry.name)
+
+    def _read_events(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return
+        data = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self._scan(require_settled=False)
+            elif name:
+                self._enqueue(name)
+
+    def next_file(self, timeout=None):
+        """Nächste unverarbeitete Datei (Path) oder None nach timeout Sekunden"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._take_due_retries():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            if self._retry:
+                # Nicht länger warten als bis zum nächsten fälligen Wiederholungsversuch
+                until_retry = max(self._retry[0][0] - time.monotonic(), 0.0)
+                remaining = until_retry if remaining is None else min(remaining, until_retry)
+            if self._fd is not None:
+                self._read_events(remaining)
+            else:
+                wait = self.poll_interval - (time.time() - self._last_scan)
+                if remaining is not None:
+                    wait = min(wait, remaining)
+                if wait > 0:
+                    time.sleep(wait)
+                if time.time() - self._last_scan >= self.poll_interval:
+                    self._scan()
+        return self.pending.popleft()
+
+    def _take_due_retries(self):
+        """Fällige Wiederholungen in die Warteschlange; True, wenn etwas ansteht"""
+        now = time.monotonic()
+        while self._retry and self._retry[0][0] <= now:
+            self.pending.append(heapq.heappop(self._retry)[2])
+        return bool(self.pending)
+
+    def mark_processed(self, path):
+        """Datei nach erfolgreicher Verarbeitung dauerhaft als erledigt vermerken"""
+        name = Path(path).name
+        with open(self.ledger_path, "a", encoding="utf-8") as f:
+            f.write(f"{name}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.processed.add(name)
+        self._queued.discard(name)
+        self.failures.pop(name, None)
+
+    def mark_failed(self, path):
+        """Fehlschlag vermerken: Datei kommt nach dem nächsten RETRY_DELAYS-Abstand wieder dran
+
+        Gibt False zurück, wenn alle Versuche aufgebraucht sind; die Datei bleibt dann
+        bis zum nächsten Neustart liegen (sie steht nicht im Ledger).
+        """
+        name = Path(path).name
+        attempts = self.failures.get(name, 0) + 1
+        self.failures[name] = attempts
+        if attempts > len(self.retry_delays):
+            return False
+        heapq.heappush(self._retry, (time.monotonic() + self.retry_delays[attempts - 1], name, Path(path)))
+        return True
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Intent-Router
+Ordnet eine Nachricht einer Absicht zu und füllt eine Antwortvorlage.
+Absichten und Vorlagen werden einmal geladen; alle Schlüsselwörter landen in
+einem einzigen kompilierten Regex (als Präfix-Baum zusammengefasst), der den
+Text in einem Durchlauf prüft. Die Kosten hängen von der Textlänge ab,
+nicht von der Zahl der Absichten.
+
+    router = IntentRouter([
+        Intent("greeting", ["hallo", "hi", "hello"], ["Hallo! Du sagtest '{user_text}'"]),
+        Intent("technical", ["code", "entwickl*"], ["Zu '{user_text}': ..."]),
+    ], default=Intent("general", [], ["Du sagtest '{user_text}'"]))
+    intent, response = router.respond("Hallo Aegis")
+
+Schlüsselwörter treffen ganze Wörter; ein '*' am Ende erlaubt beliebige
+Endungen ("entwickl*" trifft "Entwickler", "entwickeln" nicht). Mit
+substring=True trifft jedes Schlüsselwort auch mitten im Wort, wie das
+bisherige any(word in text) ("hören" in "zuhören", "app" in "Apps").
+Passen mehrere Absichten, gewinnt die zuerst definierte. Wörter werden als
+Unicode verglichen (casefold), damit funktionieren alle Sprachen gleich.
+"""
+
+import json
+import random
+import re
+from pathlib import Path
+
+
+class Intent:
+    """Eine Absicht: Schlüsselwörter plus Antwortvorlagen mit {user_text}"""
+
+    __slots__ = ("name", "keywords", "templates")
+
+    def __init__(self, name, keywords, templates):
+        self.name = name
+        self.keywords = [keyword.casefold() for keyword in keywords]
+        self.templates = list(templates)
+
+
+def _trie_pattern(words):
+    """Regex für eine Wortliste mit gemeinsamen Präfixen zusammengefasst"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class IntentRouter:
+    """Kompiliert alle Absichten zu einem Regex; route() ist ein Durchlauf über den Text"""
+
+    def __init__(self, intents, default, rng=None, substring=False):
+        self.intents = list(intents)
+        self.default = default
+        self.rng = rng or random.Random()
+        self.substring = substring
+        self._words, self._stems, self._pattern = self._compile(self.intents, substring)
+
+    @staticmethod
+    def _compile(intents, substring=False):
+        words, stems = {}, {}
+        for index, intent in enumerate(intents):
+            for keyword in intent.keywords:
+                if substring or keyword.endswith("*"):
+                    stems.setdefault(keyword.rstrip("*"), index)
+                else:
+                    words.setdefault(keyword, index)
+        if not words and not stems:
+            return words, stems, None
+
+        # Ein Wort/Präfix steht für die früheste Absicht, deren Präfix auch passt
+        # ("tech*" vor "technik"), dann genügt ein Treffer pro Wort
+        def earliest(key, own):
+            return min([own] + [stems[key[:n]] for n in range(1, len(key) + 1) if key[:n] in stems])
+
+        words = {word: earliest(word, index) for word, index in words.items()}
+        stems = {stem: earliest(stem, index) for stem, index in stems.items()}
+        if substring:
+            # An jeder Textposition prüfen (Lookahead überlappt); der längste Treffer
+            # steht dank earliest() auch für alle kürzeren Schlüsselwörter dort
+            return words, stems, re.compile(f"(?=(?P<s>{_trie_pattern(stems)}))")
+
+        alternatives = []
+        if words:
+            alternatives.append(f"(?P<w>{_trie_pattern(words)})\\b")
+        if stems:
+            alternatives.append(f"(?P<s>{_trie_pattern(stems)})\\w*")
+        return words, stems, re.compile(r"\b(?:" + "|".join(alternatives) + ")")
+
+    def route(self, text):
+        """Passende Absicht (früheste Definition gewinnt), sonst default"""
+        if self._pattern is None:
+            return self.default
+        best = None
+        for match in self._pattern.finditer(text.casefold()):
+            word = match.group("w") if self._words else None
+            index = self._words[word] if word else self._stems[match.group("s")]
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return self.default if best is None else self.intents[best]
+
+    def respond(self, user_text):
+        """(Absicht, ausgefüllte Vorlage) für eine Nachricht"""
+        intent = self.route(user_text)
+        template = self.rng.choice(intent.templates)
+        return intent, template.format(user_text=user_text)
+
+    @classmethod
+    def from_file(cls, path, default="general", rng=None, substring=False):
+        """Absichten aus JSON laden: [{"name": ..., "keywords": [...], "templates": [...]}, ...]
+
+        Die Absicht mit dem Namen default ist der Fallback (ihre Schlüsselwörter werden ignoriert).
+        """
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+        intents = [Intent(entry["name"], entry.get("keywords", []), entry["templates"]) for entry in entries]
+        fallback = next(intent for intent in intents if intent.name == default)
+        return cls([intent for intent in intents if intent is not fallback], fallback, rng=rng, substring=substring)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Live-Modus
+Sprache direkt vom Mikrofon oder aus einer Pipe statt Aufnahme -> Datei ->
+Konvertierung -> Erkennung:
+
+- pcm_stream(): PCM16-Mono-Blöcke von arecord (Gerät), stdin ("-"), einer
+  FIFO, oder eine Audiodatei in Echtzeit abgespielt (Test ohne Mikrofon)
+- StreamingVAD: dieselbe Energie-VAD wie aegis_vad, Frame für Frame; meldet
+  Sprachbeginn, Pause (nach HANGOVER_MS Stille) und Äußerungsende (nach
+  ENDPOINT_MS Stille)
+- LiveTranscriber: Zwischenergebnisse während gesprochen wird; ab der Pause
+  läuft die Enderkennung spekulativ, damit der Text beim bestätigten Ende
+  meist schon fertig ist (spricht der Nutzer weiter, wird sie verworfen)
+
+Die Zeitstempel (time.perf_counter) gelten für den Empfang der Blöcke; das
+Sprechende ist damit auf einen Block (CHUNK_MS) genau.
+
+    for event in LiveTranscriber(get_recognizer()).run(pcm_stream("-")):
+        if event.kind == "final":
+            antworten(event.text, seit=event.speech_end)
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from aegis_asr import transcribe_chunks
+from aegis_audio_buffer import AudioBuffer
+from aegis_trace import span
+from aegis_vad import FRAME_MS, HANGOVER_MS, MIN_THRESHOLD, PAD_MS, _frame_bytes, _rms, estimate_threshold
+
+SAMPLE_RATE = 16000
+CHUNK_MS = 20
+ENDPOINT_MS = int(os.getenv("AEGIS_LIVE_ENDPOINT_MS", 700))  # so viel Stille beendet eine Äußerung
+PARTIAL_INTERVAL = 1.0  # Sekunden neuer Sprache bis zum nächsten Zwischenergebnis
+MAX_UTTERANCE_SECONDS = 30.0
+
+
+# --- Quellen ---
+
+def _read_raw(stream, chunk_bytes):
+    while True:
+        chunk = stream.read(chunk_bytes)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _replay(path, sample_rate, chunk_bytes, speed):
+    """Audiodatei blockweise im Takt der Aufnahme liefern, als käme sie vom Mikrofon"""
+    audio = AudioBuffer.from_file(path, sample_rate)
+    bytes_per_second = sample_rate * 2 * speed
+    started = time.perf_counter()
+    for offset in range(0, audio.nbytes, chunk_bytes):
+        end = min(offset + chunk_bytes, audio.nbytes)
+        delay = started + end / bytes_per_second - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        yield audio.byte_range(offset, end).tobytes()
+
+
+def _record(device, sample_rate, chunk_bytes):
+    command = ["arecord", "-q", "-t", "raw", "-f", "S16_LE", "-c", "1", "-r", str(sample_rate)]
+    if device not in ("default", "mic"):
+        command += ["-D", device]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    try:
+        yield from _read_raw(process.stdout, chunk_bytes)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def pcm_stream(source, sample_rate=SAMPLE_RATE, chunk_ms=CHUNK_MS, speed=1.0):
+    """(PCM16-Block, Empfangszeit) aus einer Live-Quelle.
+
+    source: "-" (stdin, rohes PCM16 Mono), FIFO/Gerätedatei (roh), Audiodatei
+    (Wiedergabe in Echtzeit, speed > 1 schneller) oder ALSA-Gerät für arecord
+    ("mic"/"default", "hw:1,0", ...). Gelesen wird in einem eigenen Thread,
+    damit die Aufnahme weiterläuft, während eine Antwort entsteht.
+    """
+    chunk_bytes = _frame_bytes(sample_rate, chunk_ms)
+    if source == "-":
+        reader = _read_raw(sys.stdin.buffer, chunk_bytes)
+    elif os.path.isfile(source):
+        reader = _replay(source, sample_rate, chunk_bytes, speed)
+    elif os.path.exists(source):
+        reader = _read_raw(open(source, "rb", buffering=0), chunk_bytes)
+    else:
+        reader = _record(source, sample_rate, chunk_bytes)
+
+    chunks = queue.Queue()
+    stop = threading.Event()
+
+    def read():
+        try:
+            for chunk in reader:
+                chunks.put((chunk, time.perf_counter()))
+                if stop.is_set():
+                    break
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            reader.close()  # beendet auch arecord
+            chunks.put(None)
+
+    threading.Thread(target=read, name="aegis-live-source", daemon=True).start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+# --- Inkrementelle VAD ---
+
+class LiveEvent:
+    """Ereignis aus StreamingVAD bzw. LiveTranscriber"""
+
+    __slots__ = ("kind", "audio", "speech_end", "text", "language", "timings")
+
+    def __init__(self, kind, audio=None, speech_end=None, text=None, language=None, timings=None):
+        self.kind = kind  # start, pause, resume, end (VAD); partial, final (Transkription)
+        self.audio = audio
+        self.speech_end = speech_end  # Empfangszeit des letzten Sprach-Frames
+        self.text = text
+        self.language = language
+        self.timings = timings
+
+    def __repr__(self):
+        return f"LiveEvent({self.kind}, {self.text!r})" if self.text is not None else f"LiveEvent({self.kind})"
+
+
+class StreamingVAD:
+    """Energie-VAD für einen fortlaufenden PCM16-Mono-Strom.
+
+    Ohne feste Schwelle wird sie wie estimate_threshold() geschätzt, aber aus
+    den letzten history_seconds statt aus der ganzen Nachricht.
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE, threshold=None, endpoint_ms=ENDPOINT_MS,
+                 hangover_ms=HANGOVER_MS, pad_ms=PAD_MS, max_seconds=MAX_UTTERANCE_SECONDS, history_seconds=10.0):
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.fixed_threshold = threshold is not None
+        self.frame_bytes = _frame_bytes(sample_rate, FRAME_MS)
+        self.hangover_frames = max(1, hangover_ms // FRAME_MS)
+        self.endpoint_frames = max(self.hangover_frames + 1, endpoint_ms // FRAME_MS)
+        self.pad_frames = pad_ms // FRAME_MS
+        self.max_frames = int(max_seconds * 1000 / FRAME_MS)
+        self._history = deque(maxlen=int(history_seconds * 1000 / FRAME_MS))
+        self._preroll = deque(maxlen=max(1, self.pad_frames))
+        self._pending = bytearray()
+        self._frames_seen = 0
+        self.utterance = None  # bytearray, solange gesprochen wird
+        self._reset()
+
+    def _reset(self):
+        self.utterance = None
+        self._speech_frames = 0   # Frames bis einschließlich des letzten Sprach-Frames
+        self._silence = 0
+        self._speech_end = None
+        self._paused = False
+
+    def _update_threshold(self, energy):
+        self._history.append(energy)
+        self._frames_seen += 1
+        if not self.fixed_threshold and (self.threshold is None or self._frames_seen % 10 == 0):
+            self.threshold = estimate_threshold(self._history) if len(self._history) >= 10 else MIN_THRESHOLD
+
+    def speech_audio(self):
+        """Bisherige Äußerung bis zum letzten Sprach-Frame plus Rand (Kopie)"""
+        end = min(len(self.utterance), (self._speech_frames + self.pad_frames) * self.frame_bytes)
+        return AudioBuffer(bytes(self.utterance[:end]), self.sample_rate)
+
+    def feed(self, pcm, received_at=None):
+        """Block verarbeiten; liefert die Liste der dabei entstandenen LiveEvents"""
+        received_at = received_at if received_at is not None else time.perf_counter()
+        self._pending += pcm
+        events = []
+        frame_bytes = self.frame_bytes
+        while len(self._pending) >= frame_bytes:
+            frame = bytes(self._pending[:frame_bytes])
+            del self._pending[:frame_bytes]
+            energy = _rms(frame)
+            self._update_threshold(energy)
+            voiced = energy >= self.threshold
+
+            if self.utterance is None:
+                if voiced:
+                    self.utterance = bytearray(b"".join(self._preroll))
+                    self.utterance += frame
+                    self._speech_frames = len(self.utterance) // frame_bytes
+                    self._speech_end = received_at
+                    events.append(LiveEvent("start"))
+                else:
+                    self._preroll.append(frame)
+                continue
+
+            self.utterance += frame
+            if voiced:
+                self._speech_frames = len(self.utterance) // frame_bytes
+                self._speech_end = received_at
+                self._silence = 0
+                if self._paused:
+                    self._paused = False
+                    events.append(LiveEvent("resume"))
+            else:
+                self._silence += 1
+                if self._silence == self.hangover_frames:
+                    self._paused = True
+                    events.append(LiveEvent("pause", speech_end=self._speech_end))
+
+            if self._silence >= self.endpoint_frames or len(self.utterance) >= self.max_frames * frame_bytes:
+                events.append(LiveEvent("end", self.speech_audio(), self._speech_end))
+                self._preroll.clear()
+                self._reset()
+        return events
+
+    def flush(self):
+        """Strom zu Ende: laufende Äußerung abschließen"""
+        if self.utterance is None:
+            return []
+        event = LiveEvent("end", self.speech_audio(), self._speech_end)
+        self._reset()
+        return [event]
+
+
+# --- Transkription ---
+
+class LiveTranscriber:
+    """Zwischen- und Endergebnisse für einen Live-Strom über ein normales ASR-Backend.
+
+    Die Backends erkennen nur ganze Stücke; Zwischenergebnisse entstehen, indem
+    die wachsende Äußerung erneut erkannt wird (höchstens eine Anfrage läuft).
+    """
+
+    def __init__(self, recognizer, vad=None, partial_interval=PARTIAL_INTERVAL, speculative=True):
+        self.recognizer = recognizer
+        self.vad = vad or StreamingVAD()
+        self.partial_interval = partial_interval
+        self.speculative = speculative
+        self.utterances = 0
+        self.speculative_hits = 0
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aegis-live-asr")
+        self._partial = None       # laufendes Zwischenergebnis
+        self._partial_bytes = 0    # Länge der Äußerung beim letzten Zwischenergebnis
+        self._final = None         # (Future, Byte-Länge) der spekulativen Enderkennung
+        self._muted_until = 0.0
+
+    def mute_until(self, timestamp):
+        """Blöcke verwerfen, die vor timestamp empfangen wurden (z.B. während der eigenen Antwort)"""
+        self._muted_until = timestamp
+
+    def _transcribe(self, audio):
+        return transcribe_chunks([audio], self.recognizer)
+
+    def _poll_partial(self, events):
+        if self._partial is not None and self._partial.done():
+            try:
+                result = self._partial.result()
+            except Exception:
+                result = None
+            self._partial = None
+            if result and self.vad.utterance is not None:
+                events.append(LiveEvent("partial", text=result[0], language=result[1]))
+
+    def _maybe_start_partial(self):
+        utterance = self.vad.utterance
+        if self._partial is not None or self._final is not None or utterance is None:
+            return
+        if len(utterance) - self._partial_bytes >= self.partial_interval * self.vad.sample_rate * 2:
+            self._partial_bytes = len(utterance)
+            self._partial = self._pool.submit(self._transcribe, self.vad.speech_audio())
+
+    def _finish(self, event):
+        """Enderkennung für eine abgeschlossene Äußerung (spekulatives Ergebnis, falls passend)"""
+        endpoint_at = time.perf_counter()
+        with span("live_asr", audio_seconds=round(event.audio.seconds, 3)) as asr_span:
+            reused = self._final is not None and self._final[1] == event.audio.nbytes
+            future = self._final[0] if reused else self._pool.submit(self._transcribe, event.audio)
+            self._final = None
+            self._partial = None
+            self._partial_bytes = 0
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Live-Erkennung fehlgeschlagen: {e}")
+                result = None
+            asr_span.set(speculative=reused)
+        self.utterances += 1
+        self.speculative_hits += reused
+        if not result:
+            return None
+        now = time.perf_counter()
+        return LiveEvent("final", event.audio, event.speech_end, result[0], result[1], {
+            "endpoint": endpoint_at - event.speech_end,
+            "asr_wait": now - endpoint_at,
+            "speculative": reused,
+        })
+
+    def feed(self, pcm, received_at=None):
+        """Block verarbeiten; liefert partial- und final-Ereignisse"""
+        events = []
+        if received_at is not None and received_at < self._muted_until:
+            return events
+        self._poll_partial(events)
+        for event in self.vad.feed(pcm, received_at):
+            if event.kind == "pause" and self.speculative:
+                audio = self.vad.speech_audio()
+                self._final = (self._pool.submit(self._transcribe, audio), audio.nbytes)
+            elif event.kind == "resume":
+                self._final = None  # weitergesprochen: Ergebnis wird nicht gebraucht
+            elif event.kind == "end":
+                final = self._finish(event)
+                if final:
+                    events.append(final)
+        self._maybe_start_partial()
+        return events
+
+    def run(self, stream):
+        """Ereignisse für einen ganzen Strom aus pcm_stream()"""
+        try:
+            for pcm, received_at in stream:
+                yield from self.feed(pcm, received_at)
+            for event in self.vad.flush():
+                final = self._finish(event)
+                if final:
+                    yield final
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
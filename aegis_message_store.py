@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Message-Store
+SQLite-Speicher für bereits verarbeitete Sprachnachrichten, adressiert über
+den SHA-256 des Audioinhalts. Vor jeder ASR- oder TTS-Arbeit nachschlagen:
+ein Treffer liefert Transkript, Antworttext und Antwort-Audio direkt.
+
+- TTL-Verdrängung (inkl. Löschen der zugehörigen Antwort-Audiodatei)
+- Zähler für unterdrückte Duplikate, auch über Neustarts hinweg
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_TTL = 7 * 24 * 3600
+EVICT_INTERVAL = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    digest TEXT PRIMARY KEY,
+    transcription TEXT,
+    response_text TEXT,
+    response_audio TEXT,
+    created REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS messages_created ON messages (created);
+"""
+
+
+def content_hash(audio_file, chunk_size=1 << 16):
+    """SHA-256 des Dateiinhalts (Dateiname und mtime spielen keine Rolle)"""
+    digest = hashlib.sha256()
+    with open(audio_file, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class MessageStore:
+    """Inhaltsadressierter Cache für Transkript, Antwort und Antwort-Audio"""
+
+    def __init__(self, db_path, ttl_seconds=DEFAULT_TTL):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._last_evict = 0.0
+        self.evict_expired()
+
+    def lookup(self, digest):
+        """Gespeichertes Ergebnis als dict oder None (abgelaufen zählt als Fehlgriff)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM messages WHERE digest = ? AND created >= ?",
+                (digest, time.time() - self.ttl_seconds),
+            ).fetchone()
+            if row is None or (row["response_audio"] and not os.path.exists(row["response_audio"])):
+                self.misses += 1
+                return None
+            with self._db:
+                self._db.execute("UPDATE messages SET hits = hits + 1 WHERE digest = ?", (digest,))
+            self.hits += 1
+            return dict(row)
+
+    def save(self, digest, transcription, response_text=None, response_audio=None):
+        """Ergebnis einer erfolgreichen Verarbeitung speichern"""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO messages (digest, transcription, response_text, response_audio, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, transcription, response_text, str(response_audio) if response_audio else None, time.time()),
+            )
+            self.stores += 1
+        if time.time() - self._last_evict > EVICT_INTERVAL:
+            self.evict_expired()
+
+    def evict_expired(self):
+        """Abgelaufene Einträge und ihre Antwort-Audiodateien löschen"""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock, self._db:
+            expired = self._db.execute(
+                "SELECT digest, response_audio FROM messages WHERE created < ?", (cutoff,)
+            ).fetchall()
+            self._db.execute("DELETE FROM messages WHERE created < ?", (cutoff,))
+            self._last_evict = time.time()
+            self.evictions += len(expired)
+        for row in expired:
+            if row["response_audio"] and os.path.exists(row["response_audio"]):
+                os.remove(row["response_audio"])
+        return len(expired)
+
+    def stats(self):
+        """Duplikat-Unterdrückung dieses Prozesses und insgesamt"""
+        with self._lock:
+            entries, total_hits = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM messages"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "duplicates_suppressed": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": entries,
+                "duplicates_suppressed_total": total_hits,
+            }
+
+    def close(self):
+        self._db.close()
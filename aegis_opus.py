@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Opus-Encoder
+Kodiert PCM16 direkt nach OGG/Opus, dem Format von Telegram-Sprachnachrichten
+(etwa ein Zehntel der WAV-Größe). Im Prozess über PyAV, sonst per Pipe an
+ffmpeg. Beide arbeiten stückweise: fertige OGG-Seiten stehen schon in der
+Datei, während noch Audio nachkommt.
+
+    with OpusWriter("antwort.ogg", sample_rate=22050) as writer:
+        writer.write(pcm_chunk)
+    encode_wav_file("antwort.wav", "antwort.ogg")
+    encode_audio(audio_buffer, "antwort.ogg")      # aegis_audio_buffer.AudioBuffer
+
+Umgebungsvariablen:
+    AEGIS_OPUS_BITRATE   Bitrate in bit/s (Standard 24000)
+    AEGIS_REPLY_FORMAT   ogg (Standard) oder wav für Antwort-Audio
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import wave
+from fractions import Fraction
+
+from aegis_trace import current_span, traced
+
+DEFAULT_BITRATE = int(os.getenv("AEGIS_OPUS_BITRATE", 24000))
+REPLY_FORMAT = os.getenv("AEGIS_REPLY_FORMAT", "ogg")
+OPUS_RATE = 48000
+OPUS_FRAME = 960  # 20 ms bei 48 kHz
+CHUNK_FRAMES = 8192
+
+
+class EncoderUnavailable(RuntimeError):
+    """Weder PyAV mit libopus noch ffmpeg vorhanden"""
+
+
+def opus_available():
+    """Kann kodiert werden? (ohne PyAV schon beim Import zu laden)"""
+    return importlib.util.find_spec("av") is not None or shutil.which("ffmpeg") is not None
+
+
+def reply_suffix():
+    """Dateiendung für Antwort-Audio gemäß AEGIS_REPLY_FORMAT (WAV, wenn kein Encoder da ist)"""
+    return ".ogg" if REPLY_FORMAT == "ogg" and opus_available() else ".wav"
+
+
+class _PyAVEncoder:
+    def __init__(self, target, sample_rate, bitrate):
+        import av
+
+        self._av = av
+        self._sample_rate = sample_rate
+        self._container = av.open(str(target), mode="w", format="ogg")
+        try:
+            self._stream = self._container.add_stream("libopus", rate=OPUS_RATE)
+        except ValueError:
+            # PyAV ohne libopus: UnknownCodecError (ein ValueError) erst hier, nicht beim Import
+            self._container.close()
+            raise
+        self._stream.codec_context.bit_rate = bitrate
+        self._stream.codec_context.layout = "mono"
+        self._stream.codec_context.format = "s16"
+        self._stream.codec_context.options = {"application": "voip"}
+        self._resampler = av.AudioResampler(format="s16", layout="mono", rate=OPUS_RATE)
+        self._fifo = av.AudioFifo()
+        self._samples_out = 0
+
+    def write(self, pcm):
+        frame = self._av.AudioFrame(format="s16", layout="mono", samples=len(pcm) // 2)
+        frame.planes[0].update(pcm)
+        frame.sample_rate = self._sample_rate
+        for resampled in self._resampler.resample(frame):
+            self._fifo.write(resampled)
+        self._drain(OPUS_FRAME)
+
+    def _drain(self, min_samples):
+        while self._fifo.samples >= min_samples and self._fifo.samples:
+            frame = self._fifo.read(min(OPUS_FRAME, self._fifo.samples))
+            frame.pts = self._samples_out
+            frame.time_base = Fraction(1, OPUS_RATE)
+            self._samples_out += frame.samples
+            self._container.mux(self._stream.encode(frame))
+
+    def close(self):
+        for resampled in self._resampler.resample(None):
+            self._fifo.write(resampled)
+        self._drain(1)
+        self._container.mux(self._stream.encode(None))
+        self._container.close()
+
+
+class _FfmpegEncoder:
+    def __init__(self, target, sample_rate, bitrate):
+        self._process = subprocess.Popen([
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0",
+            "-c:a", "libopus", "-b:a", str(bitrate), "-application", "voip",
+            "-f", "ogg", str(target),
+        ], stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, pcm):
+        self._process.stdin.write(pcm)
+
+    def close(self):
+        self._process.stdin.close()
+        stderr = self._process.stderr.read()
+        if self._process.wait() != 0:
+            raise subprocess.CalledProcessError(self._process.returncode, "ffmpeg", stderr=stderr)
+
+
+class OpusWriter:
+    """PCM16 Mono stückweise nach OGG/Opus schreiben (PyAV, sonst ffmpeg)"""
+
+    def __init__(self, target, sample_rate, bitrate=None):
+        bitrate = bitrate or DEFAULT_BITRATE
+        self.bytes_in = 0
+        self.sample_rate = sample_rate
+        try:
+            self._encoder = _PyAVEncoder(target, sample_rate, bitrate)
+            self.backend = "pyav"
+        except (ImportError, ValueError):  # kein PyAV, oder PyAV ohne libopus
+            if not shutil.which("ffmpeg"):
+                raise EncoderUnavailable("Opus braucht PyAV mit libopus (pip install av) oder ffmpeg")
+            self._encoder = _FfmpegEncoder(target, sample_rate, bitrate)
+            self.backend = "ffmpeg"
+
+    def write(self, pcm):
+        self.bytes_in += len(pcm)
+        self._encoder.write(pcm)
+
+    @property
+    def seconds(self):
+        return self.bytes_in / 2 / self.sample_rate
+
+    def close(self):
+        self._encoder.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+@traced()
+def encode_audio(audio, ogg_file, bitrate=None):
+    """AudioBuffer (int16 Mono) nach OGG/Opus, stückweise ohne Kopie; gibt ogg_file zurück"""
+    if audio.dtype != "int16" or audio.channels != 1:
+        raise ValueError("nur 16-bit Mono")
+    with OpusWriter(ogg_file, audio.sample_rate, bitrate) as writer:
+        for start in range(0, audio.frames, CHUNK_FRAMES):
+            writer.write(audio[start:start + CHUNK_FRAMES].data)
+
+    current_span().set(engine=writer.backend, audio_seconds=round(writer.seconds, 3),
+                       bytes_in=writer.bytes_in, bytes_out=os.path.getsize(ogg_file),
+                       bitrate=bitrate or DEFAULT_BITRATE)
+    return str(ogg_file)
+
+
+@traced()
+def encode_wav_file(wav_file, ogg_file, bitrate=None):
+    """16-bit Mono WAV (TTS-Ausgabe) nach OGG/Opus; gibt ogg_file zurück"""
+    with wave.open(str(wav_file), "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError("nur 16-bit Mono WAV")
+        with OpusWriter(ogg_file, wav.getframerate(), bitrate) as writer:
+            while True:
+                pcm = wav.readframes(CHUNK_FRAMES)
+                if not pcm:
+                    break
+                writer.write(pcm)
+
+    current_span().set(engine=writer.backend, audio_seconds=round(writer.seconds, 3),
+                       bytes_in=writer.bytes_in, bytes_out=os.path.getsize(ogg_file),
+                       bitrate=bitrate or DEFAULT_BITRATE)
+    return str(ogg_file)
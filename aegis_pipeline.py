@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Pipeline
+Asyncio-Pipeline in Stufen (z.B. Transkodieren -> ASR -> Antwort -> TTS).
+Jede Stufe hat eigene Worker und eine begrenzte Warteschlange; ist sie voll,
+wartet der Absender (Backpressure). Blockierende Stufen laufen in einem
+eigenen Thread- oder Prozess-Pool, damit mehrere Nachrichten gleichzeitig
+unterwegs sein können.
+
+Eine Nachricht ist ein dict ("Job"), das jede Stufe ergänzt. Setzt eine
+Stufe job["error"], werden die restlichen Stufen übersprungen.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+
+class Stage:
+    """Eine Pipeline-Stufe: func(job) -> job
+
+    executor: "thread" (blockierend, z.B. Netzwerk/ASR), "process" (CPU-lastig,
+    func muss picklebar sein) oder None (billig, läuft direkt in der Event-Loop).
+    """
+
+    def __init__(self, name, func, workers=1, queue_size=8, executor="thread"):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.executor = executor
+        self.processed = 0
+        self.busy_seconds = 0.0
+        self.max_queued = 0
+
+
+class StagedPipeline:
+    """Verkettete Stufen mit begrenzten Queues; process(job) liefert den fertigen Job"""
+
+    def __init__(self, stages):
+        self.stages = stages
+        self._queues = []
+        self._tasks = []
+        self._pools = {}
+
+    async def start(self):
+        for stage in self.stages:
+            self._queues.append(asyncio.Queue(maxsize=stage.queue_size))
+            if stage.executor == "thread":
+                self._pools[stage.name] = ThreadPoolExecutor(stage.workers, thread_name_prefix=f"aegis-{stage.name}")
+            elif stage.executor == "process":
+                # Gemeinsamer Resource-Tracker, damit Shared Memory (AudioBuffer.share)
+                # von jedem Worker freigegeben werden kann
+                resource_tracker.ensure_running()
+                pool = self._pools[stage.name] = ProcessPoolExecutor(stage.workers)
+                # Worker jetzt forken, bevor Thread-Stufen laufen (geerbte Locks blockieren sonst)
+                pool.submit(time.perf_counter).result()
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                self._tasks.append(asyncio.create_task(self._worker(index)))
+        return self
+
+    async def _worker(self, index):
+        stage = self.stages[index]
+        queue = self._queues[index]
+        pool = self._pools.get(stage.name)
+        loop = asyncio.get_running_loop()
+
+        while True:
+            job, future = await queue.get()
+            try:
+                if not job.get("error") and not future.done():
+                    started = time.perf_counter()
+                    if pool is None:
+                        job = stage.func(job)
+                    else:
+                        job = await loop.run_in_executor(pool, stage.func, job)
+                    elapsed = time.perf_counter() - started
+                    job.setdefault("timings", {})[stage.name] = elapsed
+                    stage.busy_seconds += elapsed
+                    stage.processed += 1
+
+                if index + 1 < len(self.stages):
+                    next_queue = self._queues[index + 1]
+                    await next_queue.put((job, future))
+                    self.stages[index + 1].max_queued = max(self.stages[index + 1].max_queued, next_queue.qsize())
+                elif not future.done():
+                    future.set_result(job)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    async def process(self, job):
+        """Job einspeisen (wartet bei voller erster Queue) und fertiges Ergebnis abwarten"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[0].put((dict(job), future))
+        self.stages[0].max_queued = max(self.stages[0].max_queued, self._queues[0].qsize())
+        return await future
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for pool in self._pools.values():
+            pool.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def stats(self):
+        """Durchsatz-Kennzahlen pro Stufe"""
+        return {
+            stage.name: {
+                "processed": stage.processed,
+                "busy_seconds": stage.busy_seconds,
+                "workers": stage.workers,
+                "max_queued": stage.max_queued,
+            }
+            for stage in self.stages
+        }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Scratch-Speicher
+Verwaltetes Arbeitsverzeichnis für Zwischen- und Antwort-Audio:
+
+- eindeutige Dateinamen (Prozess + Zähler + Zeit), keine Kollision nach Neustart
+- Byte-Quota: vor jeder neuen Datei werden die ältesten gelöscht
+- Ablage auf der Platte oder in tmpfs (/dev/shm), Zwischendateien per memfd
+- Zähler (stats) für angelegte/verdrängte Dateien und belegte Bytes
+
+Konfiguration über Umgebungsvariablen:
+    AEGIS_SCRATCH_QUOTA_BYTES   Quota (Standard 256 MiB)
+    AEGIS_SCRATCH_BACKING       disk (Standard) oder tmpfs
+"""
+
+import itertools
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_QUOTA_BYTES = 256 * 1024 * 1024
+TMPFS_ROOT = Path("/dev/shm")
+
+
+def _default_root(backing):
+    if backing == "tmpfs" and TMPFS_ROOT.is_dir() and os.access(TMPFS_ROOT, os.W_OK):
+        return TMPFS_ROOT
+    return Path(tempfile.gettempdir())
+
+
+class ScratchSpace:
+    """Arbeitsverzeichnis mit Quota; nur Dateien direkt darin zählen (Unterordner wie tts_cache nicht)"""
+
+    def __init__(self, name="aegis_voice", quota_bytes=None, backing=None, directory=None):
+        self.backing = backing or os.getenv("AEGIS_SCRATCH_BACKING", "disk")
+        if quota_bytes is None:
+            quota_bytes = int(os.getenv("AEGIS_SCRATCH_QUOTA_BYTES", DEFAULT_QUOTA_BYTES))
+        self.quota_bytes = quota_bytes
+        if directory is None:
+            root = _default_root(self.backing)
+            if root != TMPFS_ROOT:
+                self.backing = "disk"  # tmpfs nicht verfügbar
+            directory = root / name
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.created = 0
+        self.evicted_files = 0
+        self.evicted_bytes = 0
+        self.memfd_files = 0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.enforce_quota()  # Reste früherer Läufe
+
+    def path(self, prefix="audio", suffix=".wav"):
+        """Neuer, eindeutiger Dateipfad; vorher wird die Quota durchgesetzt"""
+        self.enforce_quota()
+        with self._lock:
+            self.created += 1
+            unique = f"{os.getpid()}_{time.time_ns():x}_{next(self._counter)}"
+        return self.directory / f"{prefix}_{unique}{suffix}"
+
+    def _files(self):
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+                except FileNotFoundError:
+                    pass  # gerade von einem anderen Prozess gelöscht
+        return files
+
+    def enforce_quota(self):
+        """Älteste Dateien löschen, bis die Quota eingehalten ist; gibt freigegebene Bytes zurück"""
+        with self._lock:
+            files = self._files()
+            total = sum(size for _, size, _ in files)
+            freed = 0
+            for _, size, path in sorted(files):
+                if total <= self.quota_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                freed += size
+                self.evicted_files += 1
+                self.evicted_bytes += size
+            return freed
+
+    @contextmanager
+    def intermediate(self, prefix="tmp", suffix=".wav"):
+        """Pfad für kurzlebiges Audio, das nur im Prozess gelesen wird.
+
+        Unter Linux ein memfd (nur im RAM, nie auf der Platte, verschwindet mit
+        dem Schließen), sonst eine Scratch-Datei, die danach gelöscht wird.
+        Der Pfad läuft über die eigene PID, damit auch Kindprozesse (espeak -w)
+        hineinschreiben können.
+        """
+        if hasattr(os, "memfd_create"):
+            fd = os.memfd_create(f"{prefix}{suffix}")
+            with self._lock:
+                self.memfd_files += 1
+            try:
+                yield Path(f"/proc/{os.getpid()}/fd/{fd}")
+            finally:
+                os.close(fd)
+            return
+
+        path = self.path(prefix, suffix)
+        try:
+            yield path
+        finally:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            files = self._files()
+        return {
+            "directory": str(self.directory),
+            "backing": self.backing,
+            "files": len(files),
+            "bytes": sum(size for _, size, _ in files),
+            "quota_bytes": self.quota_bytes,
+            "created": self.created,
+            "evicted_files": self.evicted_files,
+            "evicted_bytes": self.evicted_bytes,
+            "memfd_files": self.memfd_files,
+        }
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Kaltstart
+Schwere Engines (Coqui/torch, Spracherkennung) werden im Hintergrund geladen
+und aufgewärmt, damit Prompt bzw. Handler sofort bereitstehen. Wer eine
+Engine braucht, wartet mit get() nur noch auf den Rest der Ladezeit.
+
+Mit AEGIS_PROFILE_STARTUP=1 geben die Skripte die Zeit bis zum Prompt und
+Import-/Ladezeiten pro Komponente aus. Importzeiten einzelner Module und das
+Kaltstart-Budget prüft bench_startup.py.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENABLED = bool(os.getenv("AEGIS_PROFILE_STARTUP"))
+
+_timings = []  # (Komponente, Phase, Sekunden)
+_lock = threading.Lock()
+
+
+def process_uptime():
+    """Sekunden seit Prozessstart (inkl. Interpreter-Start), laut /proc"""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.process_time()
+
+
+def record(component, phase, seconds):
+    with _lock:
+        _timings.append((component, phase, seconds))
+
+
+@contextmanager
+def timed(component, phase):
+    """Dauer einer Start-Phase festhalten (auch wenn sie fehlschlägt)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(component, phase, time.perf_counter() - started)
+
+
+def report(label="Start"):
+    """Gesammelte Zeiten ausgeben (nur mit AEGIS_PROFILE_STARTUP)"""
+    if not PROFILE_ENABLED:
+        return
+    with _lock:
+        timings = list(_timings)
+    print(f"⏱️ {label}: {process_uptime() * 1000:.0f} ms seit Prozessstart", file=sys.stderr)
+    for component, phase, seconds in timings:
+        print(f"   {component:<6} {phase:<22} {seconds * 1000:9.1f} ms", file=sys.stderr)
+
+
+class BackgroundLoad:
+    """Lädt (und wärmt) eine Engine in einem Daemon-Thread; get() wartet darauf"""
+
+    def __init__(self, component, loader, warmup=None):
+        self.component = component
+        self._loader = loader
+        self._warmup = warmup
+        self._value = None
+        self._error = None
+        self._done = threading.Event()
+        threading.Thread(target=self._run, name=f"aegis-load-{component}", daemon=True).start()
+
+    def _run(self):
+        try:
+            with timed(self.component, "laden"):
+                self._value = self._loader()
+            if self._warmup:
+                with timed(self.component, "aufwärmen"):
+                    self._warmup(self._value)
+        except Exception as e:
+            self._error = e
+            print(f"❌ {self.component} konnte nicht geladen werden: {e}")
+        finally:
+            self._done.set()
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    @property
+    def failed(self):
+        """Fertig, aber mit Fehler (ohne zu warten)"""
+        return self._done.is_set() and self._error is not None
+
+    def get(self, timeout=None):
+        """Geladene Engine; wirft den Ladefehler erneut"""
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"{self.component} nach {timeout}s noch nicht geladen")
+        if self._error is not None:
+            raise self._error
+        return self._value
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Streaming-Hilfen
+Satzweise Zerlegung von Antworten und ein Vorauslauf-Pipeline, damit
+Satz N+1 synthetisiert wird, während Satz N abgespielt wird.
+"""
+
+import queue
+import re
+import threading
+
+# Satzende: . ! ? … gefolgt von Leerraum; Abkürzungen wie "z.B." bleiben zusammen,
+# weil danach meist kein Großbuchstabe/Anführungszeichen folgt
+_SENTENCE_END = re.compile(r'(?<=[.!?…])["\'»“]?\s+(?=["\'»„“]?[A-ZÄÖÜ0-9])')
+
+_DONE = object()
+
+
+def split_sentences(text, min_chars=12):
+    """Zerlege Text in Sätze; sehr kurze Fragmente werden an den Vorgänger gehängt"""
+    sentences = []
+    for part in _SENTENCE_END.split(text.strip()):
+        part = part.strip()
+        if not part:
+            continue
+        if sentences and len(sentences[-1]) < min_chars:
+            sentences[-1] = f"{sentences[-1]} {part}"
+        else:
+            sentences.append(part)
+    return sentences
+
+
+def prefetch(items, worker, depth=1):
+    """Wende worker im Hintergrund-Thread auf items an und liefere Ergebnisse in Reihenfolge.
+
+    Es werden höchstens `depth` Ergebnisse vorausberechnet. Ausnahmen im
+    Hintergrund werden beim Konsumenten erneut ausgelöst.
+    """
+    results = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                results.put((item, worker(item), None))
+        except Exception as e:
+            results.put((None, None, e))
+        finally:
+            results.put(_DONE)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            entry = results.get()
+            if entry is _DONE:
+                break
+            item, result, error = entry
+            if error is not None:
+                raise error
+            yield item, result
+    finally:
+        stop.set()
+        # Produzenten freigeben, falls er auf einen vollen Puffer wartet
+        while thread.is_alive():
+            try:
+                results.get(timeout=0.05)
+            except queue.Empty:
+                pass
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Tracing
+Spans mit Dauer und Attributen (Audiolänge, Engine, Cache-Treffer) für die
+Voice-Pfade, damit sichtbar wird, wo eine langsame Antwort ihre Zeit verbringt.
+
+Aktivierung über Umgebungsvariablen (beim Import gelesen):
+    AEGIS_TRACE=spans.jsonl     eine JSON-Zeile pro Span anhängen ("-" = stderr)
+    AEGIS_METRICS_PORT=9464     Prometheus-Textformat unter http://127.0.0.1:PORT/metrics
+
+Ist nichts aktiv, kostet ein @traced-Aufruf nur eine Listenprüfung, und
+current_span() liefert einen leeren Span, dessen set() nichts tut.
+"""
+
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import wave
+from collections import defaultdict
+
+# Obergrenzen der Latenz-Buckets in Sekunden (Prometheus-Histogramm)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_sinks = []
+_collectors = []  # liefern zusätzliche Metrik-Zeilen (z.B. Engine-Zustand)
+_local = threading.local()
+_ids = itertools.count(1)
+
+
+class _NoopSpan:
+    """Platzhalter, wenn Tracing aus ist oder kein Span läuft"""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __bool__(self):
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """Ein gemessener Abschnitt; Kind-Spans im selben Thread erben die Trace-ID"""
+
+    __slots__ = ("name", "attrs", "trace_id", "span_id", "parent_id", "started", "wall_start",
+                 "duration", "error")
+
+    def __init__(self, name, attrs=None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.parent_id = None
+        self.error = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.span_id = next(_ids)
+        if stack:
+            self.parent_id = stack[-1].span_id
+            self.trace_id = stack[-1].trace_id
+        else:
+            self.trace_id = self.span_id
+        stack.append(self)
+        self.wall_start = time.time()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.started
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _local.stack.pop()
+        for sink in _sinks:
+            sink(self)
+        return False
+
+    def to_dict(self):
+        record = {
+            "pid": os.getpid(),
+            "trace": self.trace_id,
+            "span": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "start": round(self.wall_start, 6),
+            "duration_ms": round(self.duration * 1000, 3),
+        }
+        if self.error:
+            record["error"] = self.error
+        record.update(self.attrs)
+        return record
+
+
+def enabled():
+    return bool(_sinks)
+
+
+def span(name, **attrs):
+    """Kontextmanager für einen Span (ohne aktive Ausgabe: NOOP_SPAN)"""
+    if not _sinks:
+        return NOOP_SPAN
+    return Span(name, attrs)
+
+
+def current_span():
+    """Innersten laufenden Span dieses Threads, sonst NOOP_SPAN"""
+    if not _sinks:
+        return NOOP_SPAN
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else NOOP_SPAN
+
+
+def traced(name=None):
+    """Decorator: jeder Aufruf wird zum Span (Standardname: Funktionsname)"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _sinks:
+                return func(*args, **kwargs)
+            with Span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def wav_seconds(path):
+    """Dauer einer WAV-Datei in Sekunden (None, wenn nicht lesbar)"""
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return round(wav.getnframes() / wav.getframerate(), 3)
+    except (OSError, EOFError, wave.Error):
+        return None
+
+
+class JsonLinesSink:
+    """Schreibt jeden beendeten Span als eine JSON-Zeile"""
+
+    def __init__(self, target):
+        self._lock = threading.Lock()
+        if target == "-":
+            self._file = sys.stderr
+        else:
+            self._file = open(target, "a", buffering=1, encoding="utf-8")
+
+    def __call__(self, finished):
+        line = json.dumps(finished.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+
+class PrometheusMetrics:
+    """Aggregiert Spans zu Histogrammen und Zählern im Prometheus-Textformat"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms = {}  # Span-Name -> [Bucket-Zähler..., Anzahl, Summe]
+        self._errors = defaultdict(int)
+        self._engines = defaultdict(int)
+        self._cache = defaultdict(int)
+        self._audio_seconds = defaultdict(float)
+
+    def __call__(self, finished):
+        name = finished.name
+        attrs = finished.attrs
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = [0] * len(self.buckets) + [0, 0.0]
+            for index, bound in enumerate(self.buckets):
+                if finished.duration <= bound:
+                    histogram[index] += 1
+            histogram[-2] += 1
+            histogram[-1] += finished.duration
+            if finished.error:
+                self._errors[name] += 1
+            if "engine" in attrs:
+                self._engines[(name, attrs["engine"])] += 1
+            if "cache_hit" in attrs:
+                self._cache[(name, "hit" if attrs["cache_hit"] else "miss")] += 1
+            if attrs.get("audio_seconds"):
+                self._audio_seconds[name] += attrs["audio_seconds"]
+
+    def render(self):
+        lines = [
+            "# HELP aegis_span_seconds Dauer der Aegis-Voice-Abschnitte",
+            "# TYPE aegis_span_seconds histogram",
+        ]
+        with self._lock:
+            for name, histogram in sorted(self._histograms.items()):
+                for bound, count in zip(self.buckets, histogram):
+                    lines.append(f'aegis_span_seconds_bucket{{span="{name}",le="{bound}"}} {count}')
+                lines.append(f'aegis_span_seconds_bucket{{span="{name}",le="+Inf"}} {histogram[-2]}')
+                lines.append(f'aegis_span_seconds_count{{span="{name}"}} {histogram[-2]}')
+                lines.append(f'aegis_span_seconds_sum{{span="{name}"}} {histogram[-1]:.6f}')
+            lines += ["# TYPE aegis_span_errors_total counter"]
+            lines += [f'aegis_span_errors_total{{span="{name}"}} {count}'
+                      for name, count in sorted(self._errors.items())]
+            lines += ["# TYPE aegis_engine_total counter"]
+            lines += [f'aegis_engine_total{{span="{name}",engine="{engine}"}} {count}'
+                      for (name, engine), count in sorted(self._engines.items())]
+            lines += ["# TYPE aegis_cache_total counter"]
+            lines += [f'aegis_cache_total{{span="{name}",result="{result}"}} {count}'
+                      for (name, result), count in sorted(self._cache.items())]
+            lines += ["# TYPE aegis_audio_seconds_total counter"]
+            lines += [f'aegis_audio_seconds_total{{span="{name}"}} {seconds:.3f}'
+                      for name, seconds in sorted(self._audio_seconds.items())]
+        for collector in list(_collectors):
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(metrics, port, host="127.0.0.1"):
+    """Prometheus-Endpunkt /metrics in einem Hintergrund-Thread"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # nur bei Bedarf (Startzeit)
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="aegis-metrics", daemon=True).start()
+    return server
+
+
+def add_sink(sink):
+    _sinks.append(sink)
+    return sink
+
+
+def add_collector(collector):
+    """Funktion, die beim Abruf von /metrics weitere Zeilen im Textformat liefert"""
+    _collectors.append(collector)
+    return collector
+
+
+def configure_from_env():
+    """AEGIS_TRACE / AEGIS_METRICS_PORT auswerten (einmal beim Import)"""
+    trace_target = os.getenv("AEGIS_TRACE")
+    if trace_target:
+        add_sink(JsonLinesSink(trace_target))
+
+    port = os.getenv("AEGIS_METRICS_PORT")
+    if port:
+        metrics = PrometheusMetrics()
+        try:
+            start_metrics_server(metrics, int(port))
+        except (OSError, ValueError) as e:
+            print(f"❌ Metrics-Endpunkt nicht gestartet ({e})", file=sys.stderr)
+        else:
+            add_sink(metrics)
+
+
+configure_from_env()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis TTS Daemon
+Hält das Coqui-Modell dauerhaft im Speicher und nimmt Sprachaufträge
+über einen lokalen Unix-Socket entgegen.
+
+Protokoll (eine Verbindung pro Auftrag):
+    Client -> Server: eine JSON-Zeile {"text": "...", "language": "de"}
+    Server -> Client: eine JSON-Zeile {"ok": true, "size": N, "model": "..."}
+                      gefolgt von N Bytes WAV-Audio
+                      bzw. {"ok": false, "error": "..."}
+
+Start: python3 aegis_tts_daemon.py [--socket PFAD] [--workers N]
+Clients finden den Socket über AEGIS_TTS_SOCKET (Standard: $TMPDIR/aegis_tts.sock).
+Mit --workers N laufen bis zu N Aufträge parallel in geforkten Prozessen,
+die sich das einmal geladene Modell teilen (siehe aegis_tts_pool).
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from aegis_scratch import ScratchSpace
+
+DEFAULT_SOCKET = Path(os.getenv("AEGIS_TTS_SOCKET", Path(tempfile.gettempdir()) / "aegis_tts.sock"))
+GERMAN_MODEL = "tts_models/de/thorsten/tacotron2-DDC"
+MULTILINGUAL_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
+
+
+def load_coqui_tts():
+    """Lade bestes deutsches Modell, sonst Multilingual-Fallback"""
+    from TTS.api import TTS
+
+    try:
+        return TTS(model_name=GERMAN_MODEL)
+    except Exception as e:
+        print(f"❌ Deutsches Modell nicht ladbar ({e}), versuche XTTS v2...")
+        return TTS(model_name=MULTILINGUAL_MODEL)
+
+
+def synthesize_to_file(tts, text, file_path, language="de"):
+    """Synthetisiere mit geladenem Modell (Sprache nur für Multilingual-Modelle)"""
+    if "thorsten" in tts.model_name:
+        tts.tts_to_file(text=text, file_path=str(file_path))
+    else:
+        tts.tts_to_file(text=text, file_path=str(file_path), language=language)
+    return str(file_path)
+
+
+def _read_line(rfile, limit=1 << 20):
+    line = rfile.readline(limit)
+    if not line.endswith(b"\n"):
+        raise ValueError("Unvollständige Anfrage")
+    return json.loads(line)
+
+
+class _SynthesisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            job = _read_line(self.rfile)
+            audio = self.server.synthesize(job["text"], job.get("language", "de"))
+            header = {"ok": True, "size": len(audio), "model": self.server.tts.model_name}
+            self.wfile.write(json.dumps(header).encode() + b"\n")
+            self.wfile.write(audio)
+        except Exception as e:
+            self.wfile.write(json.dumps({"ok": False, "error": str(e)}).encode() + b"\n")
+
+
+class TTSDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-Socket-Server mit residentem TTS-Modell (ohne Worker-Pool: Aufträge seriell)"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, engine_factory=load_coqui_tts, workers=1):
+        self.socket_path = Path(socket_path)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        started = time.perf_counter()
+        self.tts = engine_factory()
+        self.load_seconds = time.perf_counter() - started
+        self.jobs_done = 0
+        self.scratch = ScratchSpace("aegis_tts_daemon")
+        self._tts_lock = threading.Lock()
+        self.pool = None
+        if workers > 1:
+            from aegis_tts_pool import TTSWorkerPool
+
+            self.pool = TTSWorkerPool(self.tts, workers)
+
+        super().__init__(str(self.socket_path), _SynthesisHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def synthesize(self, text, language="de"):
+        # memfd: das WAV berührt die Platte nicht, bevor es über den Socket geht
+        with self.scratch.intermediate("aegis_daemon_") as tmp_path:
+            if self.pool:
+                self.pool.synthesize(text, tmp_path, language)
+            else:
+                with self._tts_lock:
+                    synthesize_to_file(self.tts, text, tmp_path, language)
+            self.jobs_done += 1
+            return tmp_path.read_bytes()
+
+    def server_close(self):
+        super().server_close()
+        if self.pool:
+            self.pool.close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+
+def request_speech(text, output_file, socket_path=DEFAULT_SOCKET, language="de", timeout=60.0):
+    """Sende Text an den Daemon und schreibe die Antwort nach output_file.
+
+    Gibt False zurück, wenn kein Daemon läuft oder die Synthese fehlschlägt.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps({"text": text, "language": language}).encode() + b"\n")
+            with sock.makefile("rb") as rfile:
+                header = _read_line(rfile)
+                if not header.get("ok"):
+                    print(f"❌ TTS Daemon Fehler: {header.get('error')}")
+                    return False
+                audio = rfile.read(header["size"])
+        if len(audio) != header["size"]:
+            print("❌ TTS Daemon: Antwort unvollständig")
+            return False
+        Path(output_file).write_bytes(audio)
+        return True
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    except (OSError, ValueError) as e:
+        print(f"❌ TTS Daemon nicht erreichbar: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aegis TTS Daemon")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET), help="Pfad zum Unix-Socket")
+    parser.add_argument("--workers", type=int, default=1, help="parallele Synthese-Prozesse")
+    args = parser.parse_args()
+
+    print("🛡️ Aegis TTS Daemon startet...")
+    try:
+        daemon = TTSDaemon(args.socket, workers=args.workers)
+    except ImportError:
+        print("❌ Coqui TTS nicht installiert")
+        return 1
+    print(f"✅ Modell {daemon.tts.model_name} in {daemon.load_seconds:.1f}s geladen")
+    print(f"👂 Warte auf Aufträge: {args.socket}")
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 TTS Daemon beendet")
+    finally:
+        daemon.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
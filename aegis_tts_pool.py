@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis TTS Worker-Pool
+Mehrere Synthese-Prozesse teilen sich ein im Elternprozess geladenes Modell:
+die Worker entstehen per fork und sehen die Gewichte copy-on-write, ohne sie
+neu zu laden oder zu kopieren. Eine lange Antwort blockiert so nicht mehr
+alle anderen Nutzer.
+
+- Threads pro Worker fest (torch/OpenMP/BLAS), damit N Worker x M Threads
+  nicht mehr als die vorhandenen Kerne belegen
+- Aufträge warten in einer Prioritätsschlange nach Textlänge: "shortest"
+  (Standard, kurze Antworten überholen lange) oder "longest" (Stapel, kürzeste
+  Gesamtdauer); an die Worker geht nur, was sofort bearbeitet werden kann
+
+Nur unter Linux/fork. Vor dem Pool keine Synthese im Elternprozess starten,
+sonst erben die Worker laufende OpenMP-Threads.
+"""
+
+import gc
+import heapq
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from aegis_tts_daemon import synthesize_to_file
+
+_THREAD_ENV = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+# Modell des Elternprozesses; die Worker erben es beim fork
+_engine = None
+
+
+def default_workers():
+    return max(1, len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1)
+
+
+def _init_worker(threads):
+    for name in _THREAD_ENV:
+        os.environ[name] = str(threads)
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # schon gesetzt
+
+
+def _ping():
+    return os.getpid()
+
+
+def _synthesize(text, file_path, language):
+    return synthesize_to_file(_engine, text, file_path, language)
+
+
+class TTSWorkerPool:
+    """Prozess-Pool für Sprachsynthese mit geteiltem Modell und Längen-Scheduling"""
+
+    def __init__(self, engine, workers=None, threads_per_worker=None, order="shortest"):
+        global _engine
+        if order not in ("shortest", "longest"):
+            raise ValueError(f"Unbekannte Reihenfolge: {order}")
+        self.workers = workers or default_workers()
+        self.threads_per_worker = threads_per_worker or max(1, default_workers() // self.workers)
+        self.order = order
+        self.model_name = engine.model_name
+        self.jobs_done = 0
+        self.max_queued = 0
+
+        self._pending = []  # Heap: (Schlüssel, Nummer, Text, Datei, Sprache, Future)
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+        _engine = engine
+        gc.freeze()  # Modellobjekte aus der GC nehmen, sonst werden ihre Seiten beim Sammeln kopiert
+        self._executor = ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+        )
+        # Alle Worker sofort forken, solange der Elternprozess noch nichts synthetisiert hat
+        self.worker_pids = sorted({f.result() for f in [self._executor.submit(_ping) for _ in range(self.workers)]})
+
+    def submit(self, text, file_path, language="de"):
+        """Auftrag einreihen; das Future liefert den Pfad der fertigen Datei"""
+        future = Future()
+        key = len(text) if self.order == "shortest" else -len(text)
+        with self._lock:
+            heapq.heappush(self._pending, (key, next(self._sequence), text, str(file_path), language, future))
+            self.max_queued = max(self.max_queued, len(self._pending))
+        self._dispatch()
+        return future
+
+    def synthesize(self, text, file_path, language="de"):
+        return self.submit(text, file_path, language).result()
+
+    def warm_up(self, text="Hallo."):
+        """Je Worker eine Wegwerf-Synthese, damit die erste echte Anfrage keine Kaltstartkosten trägt"""
+        for future in [self.submit(text, os.devnull) for _ in range(self.workers)]:
+            future.result()
+
+    def _dispatch(self):
+        with self._lock:
+            while self._pending and self._in_flight < self.workers:
+                _, _, text, file_path, language, future = heapq.heappop(self._pending)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._in_flight += 1
+                work = self._executor.submit(_synthesize, text, file_path, language)
+                work.add_done_callback(lambda done, future=future: self._finished(done, future))
+
+    def _finished(self, done, future):
+        with self._lock:
+            self._in_flight -= 1
+            self.jobs_done += 1
+        error = done.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(done.result())
+        self._dispatch()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "threads_per_worker": self.threads_per_worker,
+                "jobs_done": self.jobs_done,
+                "in_flight": self._in_flight,
+                "queued": len(self._pending),
+                "max_queued": self.max_queued,
+            }
+
+    def close(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for *_, future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        gc.unfreeze()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis TTS-Router
+Wählt pro Antwort eine Sprach-Engine statt starr Daemon -> Coqui -> eSpeak
+durchzuprobieren:
+
+- Circuit Breaker pro Engine: nach mehreren Fehlschlägen in Folge wird sie
+  übersprungen (offen); nach einer Wartezeit darf genau ein Probe-Aufruf
+  durch (halb offen), bei Erfolg ist sie wieder normal im Einsatz
+- gleitende Latenz pro Engine (Sekunden pro Zeichen der letzten Aufrufe),
+  daraus eine Vorhersage für den aktuellen Text
+- Qualitätsstufe: bevorzugt wird die beste Stufe, deren Vorhersage das
+  Latenz-SLO einhält; sonst die schnellste; bei Fehlschlag die nächste
+- sind alle Breaker offen, wird genau eine versucht, die am längsten offene
+  (letzter Ausweg); scheitert sie, öffnet nur ihr Breaker neu, die anderen
+  warten weiter ihr reset_after ab
+
+Zustand und Entscheidungen stehen im Prometheus-Endpunkt (aegis_trace),
+jeder Engine-Versuch ist ein eigener Span "tts_engine".
+
+    router = TTSRouter([TTSEngine("daemon", request_speech, tier=2), ...], slo_seconds=3.0)
+    engine = router.synthesize("Hallo!", "antwort.wav")  # Name der Engine oder None
+"""
+
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from aegis_trace import add_collector, current_span, span
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_VALUE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+DEFAULT_SLO_SECONDS = float(os.getenv("AEGIS_TTS_SLO_SECONDS", 0)) or None
+
+
+class CircuitBreaker:
+    """Offen nach failure_threshold Fehlern in Folge, Probe nach reset_after Sekunden"""
+
+    def __init__(self, failure_threshold=3, reset_after=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+
+    def allow(self):
+        """Darf ein Aufruf durch? Wechselt nach Ablauf der Wartezeit auf halb offen (eine Probe)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and self.clock() - self.opened_at >= self.reset_after:
+            self.state = HALF_OPEN
+            return True
+        return False  # offen, oder die Probe läuft noch
+
+    def record_success(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+
+    def release(self):
+        """Reservierte Probe wurde nicht gebraucht: wieder offen, nächste Probe nach reset_after"""
+        if self.state == HALF_OPEN:
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.trips += 1
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+
+class TTSEngine:
+    """Sprach-Engine für den Router: synthesize(text, output_file) liefert True bei Erfolg"""
+
+    def __init__(self, name, synthesize, tier=1, label=None, window=50,
+                 failure_threshold=3, reset_after=30.0, clock=time.monotonic):
+        self.name = name
+        self.synthesize = synthesize
+        self.tier = tier
+        self.label = label or name
+        self.breaker = CircuitBreaker(failure_threshold, reset_after, clock)
+        self.calls = defaultdict(int)  # ok / failed
+        self._seconds = deque(maxlen=window)
+        self._seconds_per_char = deque(maxlen=window)
+
+    def observe(self, seconds, chars):
+        self._seconds.append(seconds)
+        self._seconds_per_char.append(seconds / max(chars, 1))
+
+    def predict(self, chars, quantile=0.9):
+        """Erwartete Dauer für einen Text dieser Länge (ohne Messwerte: 0, damit sie welche bekommt)"""
+        return _quantile(self._seconds_per_char, quantile) * max(chars, 1)
+
+    def latency(self, quantile):
+        return _quantile(self._seconds, quantile)
+
+
+def _quantile(values, quantile):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(quantile * len(ordered)) - 1)]
+
+
+class TTSRouter:
+    """Reihenfolge pro Antwort nach Breaker-Zustand, Latenz-SLO und Qualitätsstufe"""
+
+    def __init__(self, engines, slo_seconds=DEFAULT_SLO_SECONDS, metrics=True):
+        self.engines = list(engines)
+        self.slo_seconds = slo_seconds
+        self.routes = defaultdict(int)  # (Engine, Grund) -> Anzahl
+        self.failures = 0  # Antworten ohne Audio
+        self._lock = threading.Lock()
+        if metrics:
+            add_collector(self.render_metrics)
+
+    def plan(self, chars, slo_seconds=None, min_tier=0):
+        """Versuchsreihenfolge als [(Engine, Grund)]; reserviert Probe-Aufrufe halb offener Engines"""
+        slo_seconds = slo_seconds if slo_seconds is not None else self.slo_seconds
+        with self._lock:
+            eligible = [engine for engine in self.engines if engine.tier >= min_tier]
+            candidates = [(engine, engine.breaker.state == HALF_OPEN)
+                          for engine in eligible if engine.breaker.allow()]
+        if not candidates and eligible:
+            # Alles offen: nur die am längsten offene Engine versuchen, nicht jede nacheinander
+            return [(min(eligible, key=lambda e: e.breaker.opened_at), "last_resort")]
+        within, over = [], []
+        for engine, probe in candidates:
+            predicted = engine.predict(chars)
+            if probe:
+                reason = "probe"
+            elif slo_seconds is None or predicted <= slo_seconds:
+                reason = "preferred" if slo_seconds is None else "slo"
+            else:
+                reason = "over_slo"
+            (over if reason == "over_slo" else within).append((engine, reason, predicted))
+        # Beste Qualität zuerst, bei gleicher Stufe die schnellere; über dem SLO nur nach Tempo
+        within.sort(key=lambda item: (-item[0].tier, item[2]))
+        over.sort(key=lambda item: item[2])
+        return [(engine, reason) for engine, reason, _ in within + over]
+
+    def synthesize(self, text, output_file, slo_seconds=None, min_tier=0):
+        """Erste erfolgreiche Engine laut plan(); gibt deren Label zurück, sonst None"""
+        plan = self.plan(len(text), slo_seconds, min_tier)
+        try:
+            return self._attempt(text, output_file, plan)
+        finally:
+            with self._lock:
+                for engine, _ in plan:
+                    engine.breaker.release()  # nur noch halb offen, wenn nicht versucht
+
+    def _attempt(self, text, output_file, plan):
+        for attempt, (engine, reason) in enumerate(plan):
+            if attempt and reason not in ("probe", "last_resort"):
+                reason = "fallback"
+            started = time.perf_counter()
+            with span("tts_engine", engine=engine.name, reason=reason, tier=engine.tier) as attempt_span:
+                try:
+                    ok = bool(engine.synthesize(text, output_file))
+                except Exception as e:
+                    print(f"❌ {engine.label} fehlgeschlagen: {e}")
+                    ok = False
+                attempt_span.set(ok=ok)
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                engine.calls["ok" if ok else "failed"] += 1
+                if ok:
+                    engine.breaker.record_success()
+                    engine.observe(elapsed, len(text))
+                    self.routes[(engine.name, reason)] += 1
+                else:
+                    engine.breaker.record_failure()
+            if ok:
+                current_span().set(route_reason=reason, attempts=attempt + 1)
+                return engine.label
+        with self._lock:
+            self.failures += 1
+        return None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "engines": {
+                    engine.name: {
+                        "state": engine.breaker.state,
+                        "tier": engine.tier,
+                        "ok": engine.calls["ok"],
+                        "failed": engine.calls["failed"],
+                        "trips": engine.breaker.trips,
+                        "p50_seconds": engine.latency(0.5),
+                        "p95_seconds": engine.latency(0.95),
+                    }
+                    for engine in self.engines
+                },
+                "routes": {f"{name}/{reason}": count for (name, reason), count in sorted(self.routes.items())},
+                "failures": self.failures,
+            }
+
+    def render_metrics(self):
+        """Zeilen für aegis_trace.PrometheusMetrics (Zustand, Latenz, Routing)"""
+        lines = ["# TYPE aegis_tts_engine_state gauge"]
+        with self._lock:
+            for engine in self.engines:
+                lines.append(f'aegis_tts_engine_state{{engine="{engine.name}",state="{engine.breaker.state}"}} '
+                             f'{_STATE_VALUE[engine.breaker.state]}')
+            lines.append("# TYPE aegis_tts_engine_latency_seconds gauge")
+            for engine in self.engines:
+                for quantile in (0.5, 0.95):
+                    lines.append(f'aegis_tts_engine_latency_seconds{{engine="{engine.name}",quantile="{quantile}"}} '
+                                 f'{engine.latency(quantile):.6f}')
+            lines.append("# TYPE aegis_tts_engine_calls_total counter")
+            for engine in self.engines:
+                for result, count in sorted(engine.calls.items()):
+                    lines.append(f'aegis_tts_engine_calls_total{{engine="{engine.name}",result="{result}"}} {count}')
+            lines.append("# TYPE aegis_tts_breaker_trips_total counter")
+            lines += [f'aegis_tts_breaker_trips_total{{engine="{engine.name}"}} {engine.breaker.trips}'
+                      for engine in self.engines]
+            lines.append("# TYPE aegis_tts_route_total counter")
+            lines += [f'aegis_tts_route_total{{engine="{name}",reason="{reason}"}} {count}'
+                      for (name, reason), count in sorted(self.routes.items())]
+            lines += ["# TYPE aegis_tts_route_failures_total counter", f"aegis_tts_route_failures_total {self.failures}"]
+        return lines
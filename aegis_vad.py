@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+🛡️ Aegis Voice Activity Detection
+Energiebasierte Sprach-/Stille-Erkennung auf PCM16 Mono:
+- trim_silence():   Stille am Anfang/Ende abschneiden
+- split_at_pauses(): lange Notizen an Sprechpausen in Stücke teilen
+  (pause_ranges(): dieselben Stücke als Byte-Offsets)
+- trim_wav_file():  tote Luft aus synthetisierten Antworten entfernen
+
+Die Ruheschwelle wird aus den leisesten Frames der Nachricht selbst
+geschätzt, damit entfällt adjust_for_ambient_noise() vor der Erkennung.
+"""
+
+import math
+import warnings
+import wave
+from array import array
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop  # C-Implementierung, ab Python 3.13 nicht mehr vorhanden
+    except ImportError:
+        audioop = None
+
+FRAME_MS = 30
+MIN_THRESHOLD = 300  # entspricht dem bisherigen energy_threshold
+HANGOVER_MS = 300    # kürzere Pausen gehören noch zum Sprachabschnitt
+PAD_MS = 150         # Rand, damit Anlaute nicht abgeschnitten werden
+
+
+def _rms(frame):
+    if audioop is not None:
+        return audioop.rms(frame, 2)
+    samples = array('h')
+    samples.frombytes(frame)  # auch memoryview (AudioBuffer.data)
+    if not samples:
+        return 0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def _frame_bytes(sample_rate, ms):
+    return int(sample_rate * ms / 1000) * 2
+
+
+def frame_energies(pcm, sample_rate=16000, frame_ms=FRAME_MS):
+    """RMS-Energie pro Frame"""
+    step = _frame_bytes(sample_rate, frame_ms)
+    return [_rms(pcm[i:i + step]) for i in range(0, len(pcm) - 1, step)]
+
+
+def estimate_threshold(energies):
+    """Schwelle = 3x Grundrauschen (10. Perzentil), mindestens MIN_THRESHOLD"""
+    if not energies:
+        return MIN_THRESHOLD
+    floor = sorted(energies)[len(energies) // 10]
+    return max(MIN_THRESHOLD, floor * 3)
+
+
+def speech_segments(pcm, sample_rate=16000, threshold=None, hangover_ms=HANGOVER_MS, energies=None):
+    """Liste von (Start, Ende) Byte-Offsets der Sprachabschnitte (energies: schon berechnete Frame-Energien)"""
+    step = _frame_bytes(sample_rate, FRAME_MS)
+    if energies is None:
+        energies = frame_energies(pcm, sample_rate)
+    if threshold is None:
+        threshold = estimate_threshold(energies)
+    hangover = max(1, hangover_ms // FRAME_MS)
+
+    segments = []
+    start = last = None
+    for index, energy in enumerate(energies):
+        if energy >= threshold:
+            if start is None:
+                start = index
+            last = index
+        elif start is not None and index - last > hangover:
+            segments.append((start, last + 1))
+            start = None
+    if start is not None:
+        segments.append((start, last + 1))
+
+    return [(s * step, min(e * step, len(pcm))) for s, e in segments]
+
+
+def trim_silence(pcm, sample_rate=16000, pad_ms=PAD_MS, threshold=None):
+    """Stille an Anfang und Ende entfernen; reine Stille ergibt b''"""
+    segments = speech_segments(pcm, sample_rate, threshold)
+    if not segments:
+        return b""
+    pad = _frame_bytes(sample_rate, pad_ms)
+    return pcm[max(0, segments[0][0] - pad):min(len(pcm), segments[-1][1] + pad)]
+
+
+def split_at_pauses(pcm, sample_rate=16000, max_seconds=30.0, pad_ms=PAD_MS, threshold=None, energies=None):
+    """Teile in Stücke von höchstens max_seconds, geschnitten wird nur in Pausen.
+
+    Ein einzelner Sprachabschnitt ohne Pause bleibt ungeteilt, auch wenn er länger ist.
+    """
+    return [pcm[s:e] for s, e in pause_ranges(pcm, sample_rate, max_seconds, pad_ms, threshold, energies)]
+
+
+def pause_ranges(pcm, sample_rate=16000, max_seconds=30.0, pad_ms=PAD_MS, threshold=None, energies=None):
+    """Wie split_at_pauses, aber als (Start, Ende) Byte-Offsets (für AudioBuffer.byte_range)"""
+    segments = speech_segments(pcm, sample_rate, threshold, energies=energies)
+    if not segments:
+        return []
+    pad = _frame_bytes(sample_rate, pad_ms)
+    limit = int(max_seconds * sample_rate) * 2
+
+    chunks = []
+    chunk_start, chunk_end = segments[0]
+    for start, end in segments[1:]:
+        if end - chunk_start > limit:
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = start
+        chunk_end = end
+    chunks.append((chunk_start, chunk_end))
+    return [(max(0, s - pad), min(len(pcm), e + pad)) for s, e in chunks]
+
+
+def trim_wav_file(path, pad_ms=PAD_MS):
+    """Kürze eine PCM16-Mono-WAV in place; gibt (Bytes vorher, Bytes nachher) zurück"""
+    try:
+        with wave.open(str(path), 'rb') as wav:
+            params = wav.getparams()
+            pcm = wav.readframes(params.nframes)
+    except (wave.Error, EOFError):
+        return 0, 0  # kein PCM-WAV, unverändert lassen
+    if params.sampwidth != 2 or params.nchannels != 1:
+        return len(pcm), len(pcm)
+
+    trimmed = trim_silence(pcm, params.framerate, pad_ms)
+    if trimmed and len(trimmed) < len(pcm):
+        with wave.open(str(path), 'wb') as wav:
+            wav.setparams(params)
+            wav.writeframes(trimmed)
+        return len(pcm), len(trimmed)
+    return len(pcm), len(pcm)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Real-Time-Faktor der ASR-Backends
+RTF = Erkennungszeit / Audiodauer (< 1 heißt schneller als Echtzeit).
+Clips: fixtures/voice/* (de/en, Soll-Text in transcripts.json) plus
+synthetische Clips. Fehlgeschlagene Aufrufe (Ausnahme oder kein Ergebnis)
+zählen nicht zum RTF und werden markiert.
+
+Usage: python3 bench_asr.py [--backends stub,whisper,google] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+
+from aegis_asr import get_recognizer
+from aegis_bench import StubRecognizer, audio_data, fixture_clips, fixture_transcripts
+
+SAMPLE_RATE = 16000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="stub,whisper,google")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    clips = fixture_clips(SAMPLE_RATE)
+    expected = fixture_transcripts()
+    print(f"🛡️ ASR Real-Time-Faktor, {len(clips)} Clips, {args.repeat} Wiederholungen")
+
+    for name in args.backends.split(","):
+        started = time.perf_counter()
+        try:
+            recognizer = StubRecognizer() if name == "stub" else get_recognizer(name)
+        except ImportError as e:
+            print(f"ℹ️ {name}: nicht installiert ({e.name})")
+            continue
+        load = time.perf_counter() - started
+
+        audio_seconds = 0.0
+        busy = 0.0
+        failed = 0
+        for clip_name, pcm in clips:
+            audio = audio_data(pcm, SAMPLE_RATE)
+            seconds = len(pcm) / (2 * SAMPLE_RATE)
+            timings = []
+            result = error = None
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                try:
+                    result = recognizer.transcribe(audio)
+                except Exception as e:
+                    result, error = None, e
+                elapsed = time.perf_counter() - started
+                if result:
+                    timings.append(elapsed)
+                else:
+                    failed += 1
+            busy += sum(timings)
+            audio_seconds += seconds * len(timings)
+            if not timings:
+                reason = f"{type(error).__name__}: {error}" if error else "kein Ergebnis"
+                print(f"   {name:<8} {clip_name:<24} {seconds:5.1f}s Audio  ❌ fehlgeschlagen ({reason})")
+                continue
+            rtf = sum(timings) / len(timings) / seconds
+            line = f"   {name:<8} {clip_name:<24} {seconds:5.1f}s Audio  RTF={rtf:.3f}"
+            if len(timings) < args.repeat:
+                line += f"  ({args.repeat - len(timings)} fehlgeschlagen)"
+            if clip_name in expected and result:
+                line += f"  [{result[1]}] {result[0]!r} (soll [{expected[clip_name]['language']}])"
+            print(line)
+        total = f"Gesamt-RTF={busy / audio_seconds:.3f}" if audio_seconds else "Gesamt-RTF=-"
+        print(f"📊 {name:<8} Ladezeit {load * 1000:.0f} ms, {total}, {failed} Aufrufe fehlgeschlagen")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Audio an Prozess-Worker übergeben
+Eine Sprachnachricht wird wie in der Pipeline in VAD-Stücke geteilt und an
+einen Prozess-Pool geschickt (der Worker berechnet nur die RMS-Energie).
+Verglichen werden
+- bytes:  Stücke als Kopien, beim Pickeln serialisiert (bisher)
+- shared: AudioBuffer.share(), es gehen nur Segmentname und Bereich über die Pipe
+Gemessen: Bytes über die Pipe und Latenz pro Nachricht.
+
+Usage: python3 bench_audio_buffer.py [--seconds 10,60,300] [--repeat 5]
+"""
+
+import argparse
+import multiprocessing
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+
+from aegis_audio_buffer import AudioBuffer
+from aegis_bench import synthetic_pcm
+from aegis_vad import pause_ranges, _rms
+
+SAMPLE_RATE = 16000
+
+
+def _energy(chunks):
+    return [_rms(chunk.data if isinstance(chunk, AudioBuffer) else chunk) for chunk in chunks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", default="10,60,300")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    resource_tracker.ensure_running()
+    pool = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork"))
+    pool.submit(time.perf_counter).result()
+    print(f"🛡️ AudioBuffer Benchmark ({SAMPLE_RATE} Hz Mono PCM16, Median aus {args.repeat})")
+
+    for seconds in (float(s) for s in args.seconds.split(",")):
+        # Sprechpausen alle paar Sekunden, damit VAD mehrere Stücke liefert
+        pcm = b"".join(synthetic_pcm(5.0, SAMPLE_RATE) for _ in range(max(1, int(seconds // 5))))
+        audio = AudioBuffer(pcm, SAMPLE_RATE)
+        ranges = pause_ranges(audio.data, SAMPLE_RATE, max_seconds=10.0)
+        print(f"\n📊 {audio.seconds:g}s Nachricht, {len(ranges)} Stücke")
+
+        for label in ("bytes", "shared"):
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                if label == "bytes":
+                    chunks = [pcm[start:end] for start, end in ranges]
+                else:
+                    shared = audio.share()
+                    chunks = [shared.byte_range(start, end) for start, end in ranges]
+                pool.submit(_energy, chunks).result()
+                if label == "shared":
+                    shared.release()
+                timings.append(time.perf_counter() - started)
+            wire = len(pickle.dumps(chunks))
+            elapsed = sorted(timings)[len(timings) // 2]
+            print(f"   {label:<7} {wire / 1024:10.1f} KiB über die Pipe, {elapsed * 1000:7.1f} ms pro Nachricht")
+
+    pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
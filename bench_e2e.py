@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+🛡️ End-to-End Benchmark der Voice-Einstiegspunkte
+Läuft ohne Mikrofon, Google oder OpenAI: deterministische Stub-ASR und
+Stub-TTS mit einstellbarer Latenz, die mitgelieferten Clips aus
+fixtures/voice/ plus synthetische Clips.
+
+Szenarien (jedes in einem eigenen Prozess, damit Peak-RSS vergleichbar ist):
+- coqui:    AegisVoiceChat.process_voice_message
+- telegram: process_telegram_voice_message (TTS über Daemon mit Stub-Engine)
+- openai:   VoiceChatSystem.process_audio_message gegen lokale Stub-API
+
+Ergebnis: p50/p95/p99 pro Stufe, Durchsatz, Peak-RSS; mit --output als JSON.
+Mit --compare ALT.json wird gegen einen früheren Lauf verglichen (Exit-Code 1
+bei Regression über --tolerance, oder wenn der Lauf andere Clips benutzt hat).
+
+Usage: python3 bench_e2e.py [--scenarios coqui,telegram,openai] [--rounds 3]
+                            [--asr-latency 0.05] [--tts-char-delay 0.0005]
+                            [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from aegis_bench import (StubRecognizer, StubTTS, fixture_clips, fixture_fingerprint, fixture_transcripts,
+                         load_script, start_stub_api, summarize)
+
+SCENARIOS = ("coqui", "telegram", "openai")
+SAMPLE_RATE = 16000
+RESULT_VERSION = 2  # 2: mit Fixture-Fingerabdruck
+
+
+def _timed(samples, stage, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples[stage].append(time.perf_counter() - started)
+    return wrapper
+
+
+def _write_clips(workdir):
+    import wave
+
+    paths = []
+    for name, pcm in fixture_clips(SAMPLE_RATE):
+        path = Path(workdir) / f"{Path(name).stem}.wav"
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(pcm)
+        paths.append(str(path))
+    return paths
+
+
+def _register_stub_asr(args):
+    import aegis_asr
+
+    aegis_asr.register_backend("stub", functools.partial(StubRecognizer, latency=args.asr_latency, rtf=args.asr_rtf))
+    os.environ["AEGIS_ASR_BACKEND"] = "stub"
+
+
+def setup_coqui(args, samples, workdir):
+    _register_stub_asr(args)
+    voice_chat = load_script("coqui-voice-chat.py")
+    chat = voice_chat.AegisVoiceChat(cache_bytes=0, asr_backend="stub",
+                                     history_db=Path(workdir) / "history.sqlite")
+    chat.tts = StubTTS(char_delay=args.tts_char_delay)
+    chat.transcribe_audio = _timed(samples, "asr", chat.transcribe_audio)
+    chat.generate_response = _timed(samples, "respond", chat.generate_response)
+    chat.speak_text = _timed(samples, "tts", chat.speak_text)
+    return chat.process_voice_message
+
+
+def setup_telegram(args, samples, workdir):
+    _register_stub_asr(args)
+    os.environ["AEGIS_TTS_SOCKET"] = str(Path(workdir) / "tts.sock")
+    from aegis_tts_daemon import TTSDaemon
+
+    daemon = TTSDaemon(os.environ["AEGIS_TTS_SOCKET"],
+                       engine_factory=functools.partial(StubTTS, char_delay=args.tts_char_delay))
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+
+    telegram = load_script("simple-telegram-voice.py")
+    telegram.transcribe_telegram_voice = _timed(samples, "asr", telegram.transcribe_telegram_voice)
+    telegram.generate_ai_response = _timed(samples, "respond", telegram.generate_ai_response)
+    telegram.synthesize_reply = _timed(samples, "tts", telegram.synthesize_reply)
+    return telegram.process_telegram_voice_message
+
+
+def setup_openai(args, samples, workdir):
+    _, base = start_stub_api(audio_bytes=64 * 1024, latency=args.api_latency)
+    os.environ["OPENAI_BASE_URL"] = base
+    voice_system = load_script("voice_chat_setup.py").VoiceChatSystem()
+    voice_system.transcribe_audio = _timed(samples, "asr", voice_system.transcribe_audio)
+    voice_system.text_to_speech = _timed(samples, "tts", voice_system.text_to_speech)
+    return voice_system.process_audio_message
+
+
+def run_scenario(name, args):
+    """Ein Szenario im aktuellen Prozess; gibt das Ergebnis-dict zurück"""
+    workdir = tempfile.mkdtemp(prefix=f"aegis_e2e_{name}_")
+    clips = _write_clips(workdir)
+    samples = defaultdict(list)
+    entry = globals()[f"setup_{name}"](args, samples, workdir)
+
+    entry(clips[0])  # Aufwärmen (Imports, erster Verbindungsaufbau)
+    samples.clear()
+
+    totals = []
+    failures = 0
+    started = time.perf_counter()
+    for _ in range(args.rounds):
+        for clip in clips:
+            t0 = time.perf_counter()
+            result = entry(clip)
+            totals.append(time.perf_counter() - t0)
+            if not result or not result[-1] or not os.path.exists(str(result[-1])):
+                failures += 1
+    elapsed = time.perf_counter() - started
+
+    return {
+        "messages": len(totals),
+        "failures": failures,
+        "throughput_msg_per_min": len(totals) / elapsed * 60,
+        "total": summarize(totals),
+        "stages": {stage: summarize(values) for stage, values in samples.items()},
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Regressionen gegenüber einem früheren Lauf auflisten"""
+    if baseline.get("fixtures", {}).get("sha256") != results["fixtures"]["sha256"]:
+        return ["andere Fixture-Clips als im Vergleichslauf, Ergebnisse nicht vergleichbar"]
+    regressions = []
+    for name, current in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        checks = [("total.p95", current["total"]["p95"], old["total"]["p95"])]
+        checks += [(f"{stage}.p95", stats["p95"], old["stages"].get(stage, {}).get("p95"))
+                   for stage, stats in current["stages"].items()]
+        for metric, now, before in checks:
+            if before and now > before * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {before * 1000:.1f} ms -> {now * 1000:.1f} ms")
+        if current["throughput_msg_per_min"] < old["throughput_msg_per_min"] * (1 - tolerance):
+            regressions.append(f"{name} throughput: {old['throughput_msg_per_min']:.1f} -> "
+                               f"{current['throughput_msg_per_min']:.1f} msg/min")
+    return regressions
+
+
+def print_results(results):
+    for name, result in results["scenarios"].items():
+        if "error" in result:
+            print(f"❌ {name}: {result['error']}")
+            continue
+        print(f"\n📊 {name}: {result['messages']} Nachrichten, {result['failures']} Fehler, "
+              f"{result['throughput_msg_per_min']:.1f} msg/min, Peak-RSS {result['peak_rss_kb'] / 1024:.1f} MiB")
+        rows = [("total", result["total"])] + sorted(result["stages"].items())
+        for stage, s in rows:
+            print(f"   {stage:<8} p50={s['p50'] * 1000:8.1f} ms  p95={s['p95'] * 1000:8.1f} ms  "
+                  f"p99={s['p99'] * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--asr-latency", type=float, default=0.05)
+    parser.add_argument("--asr-rtf", type=float, default=0.05)
+    parser.add_argument("--tts-char-delay", type=float, default=0.0005)
+    parser.add_argument("--api-latency", type=float, default=0.02)
+    parser.add_argument("--output", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--compare", help="früheres JSON-Ergebnis zum Vergleich")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)  # intern: Kindprozess
+    args = parser.parse_args()
+
+    if args.scenario:
+        # Kindprozess: Ausgaben der Skripte nach stderr, Ergebnis als JSON nach stdout
+        stdout = sys.stdout
+        sys.stdout = sys.stderr
+        result = run_scenario(args.scenario, args)
+        stdout.write(json.dumps(result))
+        return 0
+
+    results = {
+        "version": RESULT_VERSION,
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare", "scenario")},
+        "fixtures": {"clips": sorted(fixture_transcripts()), "sha256": fixture_fingerprint()},
+        "scenarios": {},
+    }
+    for name in args.scenarios.split(","):
+        proc = subprocess.run([sys.executable, __file__, *sys.argv[1:], "--scenario", name],
+                              capture_output=True, text=True)
+        try:
+            results["scenarios"][name] = json.loads(proc.stdout)
+        except json.JSONDecodeError:
+            lines = proc.stderr.strip().splitlines()
+            results["scenarios"][name] = {"error": lines[-1] if lines else f"Exit-Code {proc.returncode}"}
+
+    print_results(results)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Ergebnisse gespeichert: {args.output}")
+
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"⚠️ Regression: {line}")
+        if regressions:
+            return 1
+        print("✅ Keine Regression gegenüber", args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
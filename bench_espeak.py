@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: eSpeak pro Aufruf vs. residente Engine
+Vergleicht Äußerungen pro Sekunde für
+- subprocess: ein espeak-Prozess pro Antwort (bisheriger Fallback)
+- library:    libespeak-ng einmal geladen, ein Aufruf pro Antwort
+- batch:      libespeak-ng, alle Antworten in einem synthesize_batch()
+Stimme wie im Telegram-Fallback (de+f3, -s 120, -p 32). Nicht installierte
+Varianten werden übersprungen.
+
+Usage: python3 bench_espeak.py [--utterances 50] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aegis_espeak import EspeakLibrary, EspeakProcess, EspeakUnavailable
+
+SENTENCES = [
+    "Hallo Ironman! Schön, dass wir jetzt per Sprache kommunizieren.",
+    "Das ist ein wichtiger Punkt. Was denkst du weiter dazu?",
+    "Interessante technische Frage. Lass mich das systematisch angehen.",
+    "Da stimme ich zu. Wie sollen wir das angehen?",
+]
+
+
+def _run(label, synthesize, texts, paths, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        synthesize(texts, paths)
+        timings.append(time.perf_counter() - started)
+    elapsed = sorted(timings)[len(timings) // 2]
+    print(f"   {label:<11} {len(texts) / elapsed:8.1f} Äußerungen/s  ({elapsed / len(texts) * 1000:6.1f} ms pro Äußerung)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--utterances", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aegis_espeak_"))
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.utterances)]
+    paths = [workdir / f"utterance_{i}.wav" for i in range(args.utterances)]
+    print(f"🛡️ eSpeak Benchmark ({args.utterances} Äußerungen, Median aus {args.repeat})")
+
+    results = {}
+    try:
+        process = EspeakProcess()
+        results["subprocess"] = _run("subprocess", process.synthesize_batch, texts, paths, args.repeat)
+    except EspeakUnavailable as e:
+        print(f"   subprocess  übersprungen: {e}")
+    try:
+        library = EspeakLibrary()
+    except (EspeakUnavailable, OSError, AttributeError) as e:
+        print(f"   library     übersprungen: {e}")
+    else:
+        results["library"] = _run(
+            "library", lambda texts, paths: [library.synthesize_to_file(t, p) for t, p in zip(texts, paths)],
+            texts, paths, args.repeat)
+        results["batch"] = _run("batch", library.synthesize_batch, texts, paths, args.repeat)
+
+    if not results:
+        print("❌ Weder libespeak-ng noch espeak installiert")
+        return 1
+    if "subprocess" in results and "library" in results:
+        print(f"\n📊 Residente Engine {results['subprocess'] / results['library']:.1f}x, "
+              f"Stapel {results['subprocess'] / results['batch']:.1f}x schneller als ein Prozess pro Aufruf")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Verbindungs-Pool und Streaming gegen einen lokalen Stub-Server
+1. Handshake-Overhead: requests.post pro Aufruf vs. gepoolte Keep-Alive-Session
+2. Time-to-first-byte: gepufferte Antwort (response.content) vs. Streaming
+
+Mit --tls wird ein selbstsigniertes Zertifikat per openssl erzeugt, damit
+auch der TLS-Handshake mitgemessen wird.
+
+Usage: python3 bench_http.py [--requests 20] [--tls] [--audio-kb 256] [--chunk-delay 0.01]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from aegis_bench import print_summary, start_stub_api
+from aegis_http import create_session, stream_to_file
+
+
+def _self_signed_cert(workdir):
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+        "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        "-keyout", key, "-out", cert,
+    ], check=True, capture_output=True)
+    return cert, key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--tls", action="store_true")
+    parser.add_argument("--audio-kb", type=int, default=256)
+    parser.add_argument("--chunk-delay", type=float, default=0.01, help="Pause zwischen Audio-Stücken (s)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aegis_http_")
+    verify = True
+    tls = None
+    if args.tls:
+        tls = _self_signed_cert(workdir)
+        verify = tls[0]
+    server, base = start_stub_api(args.audio_kb * 1024, args.chunk_delay, tls=tls)
+    scheme = base.split(":")[0]
+
+    print(f"🛡️ HTTP Benchmark gegen lokalen Stub ({scheme}, {args.requests} Aufrufe)")
+
+    fresh = []
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        requests.post(f"{base}/audio/transcriptions", data={"model": "whisper-1"}, verify=verify)
+        fresh.append(time.perf_counter() - started)
+
+    session = create_session()
+    pooled = []
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        session.post(f"{base}/audio/transcriptions", data={"model": "whisper-1"}, verify=verify)
+        pooled.append(time.perf_counter() - started)
+
+    print_summary("neue Verbindung pro Aufruf", fresh)
+    print_summary("gepoolte Session", pooled)
+
+    output = os.path.join(workdir, "response.mp3")
+    buffered = []
+    streamed = []
+    for _ in range(max(1, args.requests // 4)):
+        started = time.perf_counter()
+        response = session.post(f"{base}/audio/speech", json={"input": "Hallo"}, verify=verify)
+        with open(output, "wb") as f:
+            f.write(response.content)
+        buffered.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        response = session.post(f"{base}/audio/speech", json={"input": "Hallo"}, stream=True,
+                                verify=verify)
+        headers_received = time.perf_counter() - started
+        _, first_byte = stream_to_file(response, output)
+        streamed.append(headers_received + (first_byte or 0.0))
+
+    print_summary("TTFB gepuffert (ganzer Body)", buffered)
+    print_summary("TTFB gestreamt", streamed)
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
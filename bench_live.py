@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Live-Modus, Sprechende bis erstes Antwort-Audio
+Eine WAV (Standard: synthetische Äußerungen mit Pausen dazwischen) wird in
+Echtzeit als Mikrofon-Strom abgespielt und durch AegisVoiceChat.start_live_mode
+geschickt, mit Stub-ASR und Stub-TTS. Verglichen wird die Enderkennung
+- speculative: startet schon in der Sprechpause (HANGOVER_MS)
+- endpoint:    startet erst beim bestätigten Äußerungsende (ENDPOINT_MS)
+
+Usage: python3 bench_live.py [--wav aufnahme.wav] [--utterances 5]
+                             [--asr-latency 0.3] [--speed 1.0]
+"""
+
+import argparse
+import functools
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from aegis_audio_buffer import AudioBuffer
+from aegis_bench import StubRecognizer, StubTTS, load_script, summarize, synthetic_pcm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--wav", help="eigene Aufnahme statt synthetischer Äußerungen")
+    parser.add_argument("--utterances", type=int, default=5)
+    parser.add_argument("--asr-latency", type=float, default=0.3)
+    parser.add_argument("--asr-rtf", type=float, default=0.05)
+    parser.add_argument("--tts-char-delay", type=float, default=0.0005)
+    parser.add_argument("--speed", type=float, default=1.0, help="Wiedergabe schneller als Echtzeit")
+    args = parser.parse_args()
+
+    import aegis_asr
+
+    aegis_asr.register_backend("stub", functools.partial(StubRecognizer, latency=args.asr_latency, rtf=args.asr_rtf))
+    workdir = Path(tempfile.mkdtemp(prefix="aegis_live_"))
+    wav = args.wav
+    if not wav:
+        wav = workdir / "live.wav"
+        pcm = b"".join(synthetic_pcm(3.0 + i % 3, lead_silence=1.0, trail_silence=1.0)
+                       for i in range(args.utterances))
+        AudioBuffer(pcm).write_wav(wav)
+
+    voice_chat = load_script("coqui-voice-chat.py")
+    print(f"🛡️ Live-Benchmark: {wav}, ASR {args.asr_latency * 1000:.0f} ms + RTF {args.asr_rtf}")
+    for label, speculative in (("speculative", True), ("endpoint", False)):
+        chat = voice_chat.AegisVoiceChat(cache_bytes=0, asr_backend="stub", history_db=workdir / f"{label}.sqlite")
+        chat.tts = StubTTS(char_delay=args.tts_char_delay)
+        with redirect_stdout(io.StringIO()):
+            latencies = chat.start_live_mode(str(wav), player=("true",), speed=args.speed, speculative=speculative)
+        chat.conversation_history.close()
+        if not latencies:
+            print(f"❌ {label}: keine Antwort")
+            return 1
+        s = summarize(latencies)
+        print(f"   {label:<12} {len(latencies)} Antworten  p50={s['p50'] * 1000:7.1f} ms  "
+              f"p95={s['p95'] * 1000:7.1f} ms  p99={s['p99'] * 1000:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
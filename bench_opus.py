@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Antwort-Audio als WAV vs. OGG/Opus
+Synthetische Sprachclips im TTS-Format (22,05 kHz Mono PCM16) werden bei
+mehreren Bitraten kodiert. Gemessen: Bytes auf der Leitung, Kodier-Latenz,
+Real-Time-Faktor und die reine Übertragungszeit bei gegebenem Uplink.
+
+Usage: python3 bench_opus.py [--durations 2,5,15,30] [--bitrates 16000,24000,32000]
+                             [--uplink-kbit 1000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import wave
+
+from aegis_bench import synthetic_pcm
+from aegis_opus import EncoderUnavailable, encode_wav_file
+
+SAMPLE_RATE = 22050
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--durations", default="2,5,15,30")
+    parser.add_argument("--bitrates", default="16000,24000,32000")
+    parser.add_argument("--uplink-kbit", type=float, default=1000.0, help="Upload-Bandbreite in kbit/s")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aegis_opus_")
+    uplink = args.uplink_kbit * 1000 / 8  # Bytes pro Sekunde
+    print(f"🛡️ Opus Benchmark ({SAMPLE_RATE} Hz Mono, Uplink {args.uplink_kbit:.0f} kbit/s)")
+
+    for seconds in (float(d) for d in args.durations.split(",")):
+        wav_file = os.path.join(workdir, f"clip_{seconds:g}.wav")
+        with wave.open(wav_file, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(synthetic_pcm(seconds, SAMPLE_RATE))
+        wav_bytes = os.path.getsize(wav_file)
+        print(f"\n📊 {seconds:g}s Clip: WAV {wav_bytes / 1024:8.1f} KiB, Übertragung {wav_bytes / uplink * 1000:7.0f} ms")
+
+        for bitrate in (int(b) for b in args.bitrates.split(",")):
+            ogg_file = os.path.join(workdir, f"clip_{seconds:g}_{bitrate}.ogg")
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                try:
+                    encode_wav_file(wav_file, ogg_file, bitrate)
+                except EncoderUnavailable as e:
+                    print(f"❌ {e}")
+                    return 1
+                timings.append(time.perf_counter() - started)
+            encode = sorted(timings)[len(timings) // 2]
+            ogg_bytes = os.path.getsize(ogg_file)
+            print(f"   Opus {bitrate // 1000:>2} kbit/s: {ogg_bytes / 1024:8.1f} KiB ({wav_bytes / ogg_bytes:4.1f}x kleiner), "
+                  f"Kodierung {encode * 1000:6.1f} ms (RTF {encode / seconds:.3f}), "
+                  f"Übertragung {ogg_bytes / uplink * 1000:5.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
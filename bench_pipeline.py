@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Durchsatz der Stufen-Pipeline
+Nachrichten pro Minute bei 1, 4 und 16 gleichzeitigen Absendern; jeder
+Absender schickt seine Nachrichten nacheinander und wartet auf die Antwort.
+Stufen sind Stubs mit fester Latenz (Transkodieren, ASR, TTS) plus die echte
+generate_ai_response().
+
+Usage: python3 bench_pipeline.py [--messages 4] [--asr 0.25] [--tts 0.3]
+"""
+
+import argparse
+import asyncio
+import functools
+import sys
+import time
+
+from aegis_bench import load_script
+from aegis_pipeline import Stage, StagedPipeline
+
+
+def _sleep_stage(seconds, job):
+    time.sleep(seconds)
+    return job
+
+
+def _respond(generate, job):
+    job["response"] = generate("Hallo, wie klingt die Stimme?")
+    return job
+
+
+async def run_senders(handler, senders, messages):
+    async def sender(index):
+        for n in range(messages):
+            await handler({"audio_file": f"sender{index}_{n}.ogg"})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(sender(i) for i in range(senders)))
+    return senders * messages / (time.perf_counter() - started) * 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=4, help="Nachrichten pro Absender")
+    parser.add_argument("--decode", type=float, default=0.02)
+    parser.add_argument("--asr", type=float, default=0.25)
+    parser.add_argument("--tts", type=float, default=0.3)
+    parser.add_argument("--asr-workers", type=int, default=8)
+    parser.add_argument("--tts-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    telegram = load_script("simple-telegram-voice.py")
+    stages = [
+        functools.partial(_sleep_stage, args.decode),
+        functools.partial(_sleep_stage, args.asr),
+        functools.partial(_respond, telegram.generate_ai_response),
+        functools.partial(_sleep_stage, args.tts),
+    ]
+
+    async def serial(job):
+        for stage in stages:
+            job = stage(job)
+        return job
+
+    async def bench():
+        print(f"🛡️ Pipeline-Durchsatz (decode {args.decode}s, asr {args.asr}s, tts {args.tts}s)")
+        for senders in (1, 4, 16):
+            baseline = await run_senders(serial, senders, args.messages)
+            pipeline = StagedPipeline([
+                Stage("decode", stages[0], workers=2),
+                Stage("asr", stages[1], workers=args.asr_workers),
+                Stage("respond", stages[2], executor=None),
+                Stage("tts", stages[3], workers=args.tts_workers),
+            ])
+            async with pipeline:
+                staged = await run_senders(pipeline.process, senders, args.messages)
+            print(f"📊 {senders:>2} Absender: seriell {baseline:7.1f} msg/min, Pipeline {staged:7.1f} msg/min "
+                  f"({staged / baseline:.1f}x)")
+
+    asyncio.run(bench())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Kaltstart der Einstiegspunkte
+Misst in frischen Prozessen, wie lange es dauert, bis der Coqui-Prompt bzw.
+der Telegram-Handler bereitsteht (Engines laden danach im Hintergrund), und
+listet die teuersten Module aus python -X importtime.
+
+Überschreitet ein Einstiegspunkt (Median) das Budget (--budget, Standard
+AEGIS_STARTUP_BUDGET oder 1 s), endet der Lauf mit Exit-Code 1;
+test_startup.py prüft dasselbe Budget mit pytest.
+
+Usage: python3 bench_startup.py [--repeat 5] [--budget 1.0] [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+from aegis_bench import BASE_DIR, synthetic_pcm
+
+DEFAULT_BUDGET = float(os.getenv("AEGIS_STARTUP_BUDGET", 1.0))
+
+# Einstiegspunkt -> (Argumente, Zeile auf stderr, sobald bereit)
+ENTRY_POINTS = {
+    "coqui": (["coqui-voice-chat.py"], "Prompt bereit"),
+    "telegram": (["simple-telegram-voice.py", "{clip}"], "Handler bereit"),
+}
+
+
+def write_clip(workdir):
+    path = Path(workdir) / "startup.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(synthetic_pcm(1.0, 16000))
+    return str(path)
+
+
+def entry_point(name, clip):
+    """(Argumente, Bereit-Zeile) eines Einstiegspunkts"""
+    argv, marker = ENTRY_POINTS[name]
+    return [arg.format(clip=clip) for arg in argv], marker
+
+
+def median_time_to_ready(argv, marker, repeat):
+    timings = sorted(time_to_ready(argv, marker) for _ in range(repeat))
+    return timings[len(timings) // 2], timings
+
+
+def time_to_ready(argv, marker):
+    """Sekunden vom Prozessstart bis zur Bereit-Meldung auf stderr"""
+    env = dict(os.environ, AEGIS_PROFILE_STARTUP="1", PYTHONUNBUFFERED="1")
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, *argv], cwd=BASE_DIR, env=env, text=True,
+                               stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        for line in process.stderr:
+            if marker in line:
+                return time.perf_counter() - started
+        raise RuntimeError(f"{argv[0]} beendet ohne '{marker}' (Exit-Code {process.wait()})")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def import_times(argv):
+    """Kumulierte Importzeit (Sekunden) je Modul laut -X importtime"""
+    code = ("import importlib.util as u; "
+            f"s = u.spec_from_file_location('entry', {argv[0]!r}); s.loader.exec_module(u.module_from_spec(s))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=BASE_DIR,
+                            capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name] = int(cumulative) / 1e6
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="maximale Zeit bis bereit in Sekunden")
+    parser.add_argument("--top", type=int, default=10, help="teuerste Importe je Einstiegspunkt")
+    args = parser.parse_args()
+
+    clip = write_clip(tempfile.mkdtemp(prefix="aegis_startup_"))
+    print(f"🛡️ Kaltstart Benchmark ({args.repeat} Läufe, Median)")
+    over_budget = []
+
+    for name in ENTRY_POINTS:
+        argv, marker = entry_point(name, clip)
+        median, timings = median_time_to_ready(argv, marker, args.repeat)
+        print(f"\n📊 {name}: bereit nach {median * 1000:6.0f} ms "
+              f"(min {timings[0] * 1000:.0f}, max {timings[-1] * 1000:.0f})")
+
+        times = import_times(argv)
+        ranked = sorted(((seconds, module) for module, seconds in times.items()
+                         if module.startswith("aegis_") or "." not in module), reverse=True)
+        for seconds, module in ranked[:args.top]:
+            print(f"   {module:<28} {seconds * 1000:7.1f} ms")
+
+        if median > args.budget:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"\n❌ Budget {args.budget:g}s überschritten: {', '.join(over_budget)}")
+        return 1
+    print(f"\n✅ Alle Einstiegspunkte unter {args.budget:g}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Zeit bis zum ersten Audio
+Ganze Antwort synthetisieren (speak_text) vs. satzweise Pipeline (iter_speech).
+
+Usage: python3 bench_streaming.py [--sentences 6] [--char-delay 0.004]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aegis_bench import StubTTS, load_script
+
+SENTENCE = "Das ist ein typischer Antwortsatz mit ein paar Wörtern mehr."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sentences", type=int, default=6)
+    parser.add_argument("--char-delay", type=float, default=0.004, help="Stub: Synthesezeit pro Zeichen (s)")
+    args = parser.parse_args()
+
+    voice_chat = load_script("coqui-voice-chat.py")
+    # Cache aus, sonst misst man Treffer; Wegwerf-Journal statt des echten Verlaufs
+    chat = voice_chat.AegisVoiceChat(cache_bytes=0, history_db=Path(tempfile.mkdtemp()) / "history.sqlite")
+    chat.tts = StubTTS(char_delay=args.char_delay)
+    reply = " ".join([SENTENCE] * args.sentences)
+
+    print(f"🛡️ Time-to-first-audio, Antwort mit {args.sentences} Sätzen ({len(reply)} Zeichen)")
+
+    started = time.perf_counter()
+    chat.speak_text(reply)
+    whole = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stream = chat.iter_speech(reply)
+    next(stream)
+    first = time.perf_counter() - started
+    for _ in stream:
+        pass
+    total = time.perf_counter() - started
+    chat.conversation_history.close()
+
+    print(f"📊 ganze Antwort:  erstes Audio nach {whole * 1000:8.1f} ms")
+    print(f"📊 satzweise:      erstes Audio nach {first * 1000:8.1f} ms (gesamt {total * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: Kalte vs. warme Sprachsynthese
+Kalt  = Modell pro Nachricht neu laden (bisheriges generate_speech_with_coqui)
+Warm  = Auftrag an den laufenden Aegis TTS Daemon
+
+Usage: python3 bench_tts_daemon.py [--engine stub|coqui] [--runs 5]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from aegis_bench import StubTTS, print_summary
+from aegis_tts_daemon import TTSDaemon, load_coqui_tts, request_speech, synthesize_to_file
+
+SAMPLE_TEXTS = [
+    "Hallo Ironman! Schön, dass wir jetzt per Sprache kommunizieren!",
+    "Interessante technische Frage. Lass mich das systematisch angehen.",
+    "Das ist ein wichtiger Punkt. Was denkst du weiter dazu?",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engine", choices=["stub", "coqui"], default="stub")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--load-delay", type=float, default=1.5, help="Stub: simulierte Modell-Ladezeit (s)")
+    parser.add_argument("--char-delay", type=float, default=0.0005, help="Stub: Synthesezeit pro Zeichen (s)")
+    args = parser.parse_args()
+
+    if args.engine == "coqui":
+        factory = load_coqui_tts
+    else:
+        factory = functools.partial(StubTTS, load_delay=args.load_delay, char_delay=args.char_delay)
+
+    workdir = Path(tempfile.mkdtemp(prefix="aegis_bench_"))
+    output = workdir / "out.wav"
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(args.runs)]
+
+    print(f"🛡️ TTS Kalt-vs-Warm Benchmark ({args.engine}, {args.runs} Durchläufe)")
+
+    cold = []
+    for text in texts:
+        started = time.perf_counter()
+        synthesize_to_file(factory(), text, output)
+        cold.append(time.perf_counter() - started)
+
+    socket_path = workdir / "tts.sock"
+    daemon = TTSDaemon(socket_path, engine_factory=factory)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    try:
+        warm = []
+        for text in texts:
+            started = time.perf_counter()
+            if not request_speech(text, output, socket_path=socket_path):
+                print("❌ Daemon-Auftrag fehlgeschlagen")
+                return 1
+            warm.append(time.perf_counter() - started)
+    finally:
+        daemon.shutdown()
+        daemon.server_close()
+
+    print(f"⏱️ Einmalige Ladezeit im Daemon: {daemon.load_seconds * 1000:.1f} ms")
+    cold_stats = print_summary("kalt (Modell pro Aufruf)", cold)
+    warm_stats = print_summary("warm (Daemon)", warm)
+    if warm_stats["p50"] > 0:
+        print(f"🚀 Speedup p50: {cold_stats['p50'] / warm_stats['p50']:.1f}x")
+
+    output.unlink(missing_ok=True)
+    os.rmdir(workdir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
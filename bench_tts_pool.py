@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: TTS im Hauptprozess vs. Worker-Pool mit geteiltem Modell
+Viele gleichzeitige Antworten unterschiedlicher Länge (CPU-gebundene
+Stub-Synthese, damit Kerne tatsächlich ausgelastet werden):
+- seriell im Hauptprozess (bisheriges AegisVoiceChat.speak_text)
+- TTSWorkerPool mit 1..N Workern, Reihenfolge "shortest" und "longest"
+
+Gemessen: Gesamtdauer, Durchsatz, mittlere/p95-Latenz pro Antwort und der
+private Speicher je Worker (Modellgewichte bleiben copy-on-write geteilt).
+
+Usage: python3 bench_tts_pool.py [--jobs 24] [--workers 1,2,4] [--char-delay 0.0005]
+                                 [--weights-mb 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from aegis_bench import StubTTS, percentile
+from aegis_tts_daemon import synthesize_to_file
+from aegis_tts_pool import TTSWorkerPool, default_workers
+
+
+def private_mib(pid):
+    """Privat belegter Speicher eines Prozesses (MiB) laut /proc/PID/smaps_rollup"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+    return sum(int(fields.get(key, "0 kB").split()[0]) for key in ("Private_Clean", "Private_Dirty")) / 1024
+
+
+def report(label, latencies, elapsed, baseline=None):
+    speedup = f", {baseline / elapsed:4.1f}x" if baseline else ""
+    print(f"   {label:<22} {elapsed:6.2f}s gesamt, {len(latencies) / elapsed:5.1f} Antworten/s{speedup}, "
+          f"Latenz mittel {sum(latencies) / len(latencies):5.2f}s p95 {percentile(latencies, 95):5.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=24)
+    parser.add_argument("--workers", default=",".join(str(n) for n in sorted({1, 2, default_workers()})))
+    parser.add_argument("--char-delay", type=float, default=0.0005, help="CPU-Zeit pro Zeichen (s)")
+    parser.add_argument("--weights-mb", type=int, default=200, help="Größe der Stub-Modellgewichte")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    texts = ["Antwort " + "x" * rng.choice([40, 80, 160, 600]) for _ in range(args.jobs)]
+    workdir = tempfile.mkdtemp(prefix="aegis_pool_")
+    engine = StubTTS(char_delay=args.char_delay, cpu_bound=True, weights_mb=args.weights_mb)
+    print(f"🛡️ TTS-Pool Benchmark: {args.jobs} Antworten, {default_workers()} Kerne, "
+          f"Modell {args.weights_mb} MiB")
+
+    # Seriell: jeder wartet auf alle vor ihm
+    started = time.perf_counter()
+    latencies = []
+    for index, text in enumerate(texts):
+        synthesize_to_file(engine, text, os.path.join(workdir, f"serial_{index}.wav"))
+        latencies.append(time.perf_counter() - started)
+    serial = time.perf_counter() - started
+    report("seriell", latencies, serial)
+
+    for workers in (int(n) for n in args.workers.split(",")):
+        for order in ("shortest", "longest"):
+            pool = TTSWorkerPool(engine, workers, order=order)
+            started = time.perf_counter()
+            futures = [pool.submit(text, os.path.join(workdir, f"pool_{index}.wav"))
+                       for index, text in enumerate(texts)]
+            latencies = []
+            for future in futures:
+                future.add_done_callback(lambda _: latencies.append(time.perf_counter() - started))
+            for future in futures:
+                future.result()
+            elapsed = time.perf_counter() - started
+            memory = [private_mib(pid) for pid in pool.worker_pids]
+            pool.close()
+            report(f"{workers} Worker ({order})", latencies, elapsed, serial)
+            if None not in memory:
+                print(f"      privat je Worker: {max(memory):.1f} MiB (Modell {args.weights_mb} MiB geteilt)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+🛡️ Benchmark: VAD vor der Erkennung
+Vergleicht verarbeitete Bytes und Erkennungslatenz ohne/mit Stille-Trimmung.
+Clips mit langer Stille vorne/hinten; Erkennung über die Stub-ASR (fester
+Real-Time-Faktor), damit nur der Effekt der Datenmenge sichtbar wird.
+
+Usage: python3 bench_vad.py [--rtf 0.3] [--lead 2.0] [--trail 3.0]
+"""
+
+import argparse
+import sys
+import time
+
+from aegis_bench import StubRecognizer, PcmAudio, synthetic_pcm
+from aegis_vad import split_at_pauses
+
+SAMPLE_RATE = 16000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtf", type=float, default=0.3, help="Stub-ASR Real-Time-Faktor")
+    parser.add_argument("--lead", type=float, default=2.0, help="Stille am Anfang (s)")
+    parser.add_argument("--trail", type=float, default=3.0, help="Stille am Ende (s)")
+    args = parser.parse_args()
+
+    recognizer = StubRecognizer(latency=0.0, rtf=args.rtf)
+    print(f"🛡️ VAD Benchmark (Stille {args.lead:g}s vorne, {args.trail:g}s hinten, RTF {args.rtf:g})")
+
+    for seconds in (3.0, 10.0, 30.0):
+        pcm = synthetic_pcm(seconds + args.lead + args.trail, SAMPLE_RATE, args.lead, args.trail)
+
+        started = time.perf_counter()
+        recognizer.transcribe(PcmAudio(pcm, SAMPLE_RATE))
+        plain = time.perf_counter() - started
+
+        started = time.perf_counter()
+        chunks = split_at_pauses(pcm, SAMPLE_RATE)
+        vad_cost = time.perf_counter() - started
+        for chunk in chunks:
+            recognizer.transcribe(PcmAudio(chunk, SAMPLE_RATE))
+        with_vad = time.perf_counter() - started
+
+        kept = sum(len(chunk) for chunk in chunks)
+        print(f"📊 {seconds:4.0f}s Sprache: {len(pcm) / 1024:7.0f} KiB -> {kept / 1024:7.0f} KiB "
+              f"({len(chunks)} Stück), Latenz {plain * 1000:7.0f} ms -> {with_vad * 1000:7.0f} ms "
+              f"(VAD {vad_cost * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
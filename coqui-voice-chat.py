@@ -9,26 +9,142 @@ import sys
 import tempfile
 import subprocess
 import json
+import time
+import uuid
 from pathlib import Path
 
+from aegis_asr import get_recognizer, recognizer_stats, transcribe_chunks
+from aegis_audio_buffer import AudioBuffer, as_audio_buffer
+from aegis_audio_cache import AudioCache, DEFAULT_MAX_BYTES
+from aegis_calibration import CalibrationCache
+from aegis_history import ConversationHistory
+from aegis_scratch import ScratchSpace
+from aegis_startup import BackgroundLoad, report as report_startup, timed
+from aegis_intents import Intent, IntentRouter
+from aegis_live import LiveTranscriber, pcm_stream
+from aegis_opus import EncoderUnavailable, encode_audio, reply_suffix
+from aegis_streaming import prefetch, split_sentences
+from aegis_trace import current_span, traced, wav_seconds
+from aegis_tts_daemon import synthesize_to_file
+from aegis_vad import pause_ranges, trim_wav_file
+
+# Erweiterte kontextuelle Antworten (einmal geladen, {user_text} wird eingesetzt);
+# Schlüsselwörter treffen wie bisher auch innerhalb von Wörtern
+RESPONSE_ROUTER = IntentRouter([
+    Intent('greeting', ['hallo', 'hi', 'hey', 'guten'], [
+        "Hallo Ironman! Schön dass wir jetzt mit Coqui TTS sprechen können. Du sagtest: '{user_text}' - das freut mich!",
+        "Hi! Endlich eine natürliche deutsche Stimme! Zu deiner Nachricht '{user_text}' kann ich sagen: Das ist ein guter Start!",
+        "Hey! Coqui TTS funktioniert! Du meintest '{user_text}' - lass uns das ausbauen!"
+    ]),
+    Intent('voice_quality', ['stimme', 'sprache', 'hören', 'klingen', 'verstehen'], [
+        "Du fragst nach '{user_text}' - diese Coqui-Stimme ist definitiv besser als der chinesische Roboter von vorhin!",
+        "Zu '{user_text}': Die Qualität sollte jetzt viel natürlicher sein. Wie klingt das?",
+        "'{user_text}' - endlich eine verständliche deutsche Stimme! Ist das so besser?"
+    ]),
+    Intent('technical', ['code', 'app', 'entwickl', 'programm', 'tech', 'system'], [
+        "Spannende technische Frage zu '{user_text}'. Mit Coqui TTS können wir jetzt richtig entwickeln!",
+        "Bei '{user_text}' sehe ich mehrere Lösungsansätze. Die kostenlose TTS macht alles möglich!",
+        "Gute Frage zu '{user_text}'! Jetzt wo die Sprache funktioniert, können wir fokussiert arbeiten."
+    ]),
+], default=Intent('general', [], [
+    "Du sagtest '{user_text}' - das bringt mich zum Nachdenken. Was sind deine weiteren Pläne?",
+    "Interessant! Zu '{user_text}' fällt mir ein: Jetzt können wir endlich flüssig kommunizieren!",
+    "Das mit '{user_text}' sehe ich auch so. Wie sollen wir weitermachen?"
+]), substring=True)
+
+HISTORY_DB = os.getenv('AEGIS_HISTORY_DB', str(Path.home() / '.clawdbot' / 'aegis_history.sqlite'))
+# Ausdünnen des Journals nur auf Wunsch: neueste N Züge pro Sitzung behalten (leer = alles)
+HISTORY_KEEP_TURNS = int(os.getenv('AEGIS_HISTORY_KEEP_TURNS', 0)) or None
+
+def new_session_id():
+    """Eigener Gesprächsschlüssel pro Programmstart"""
+    return f"coqui-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
 class AegisVoiceChat:
-    def __init__(self):
+    def __init__(self, cache_bytes=None, asr_backend=None, history_db=HISTORY_DB, session=None):
+        self.asr_backend = asr_backend  # None = AEGIS_ASR_BACKEND bzw. google
         self.temp_dir = Path(tempfile.gettempdir()) / "aegis_voice"
         self.temp_dir.mkdir(exist_ok=True)
-        self.conversation_history = []
+        
+        # Antwort-Audio: eindeutige Namen, Quota (AEGIS_SCRATCH_QUOTA_BYTES), älteste zuerst weg
+        self.scratch = ScratchSpace("aegis_voice")
+        # Antworten als OGG/Opus ausliefern (AEGIS_REPLY_FORMAT=wav für unkomprimiert)
+        self.reply_suffix = reply_suffix()
+        
+        # Letzte Züge im Speicher, vollständiger Verlauf im Journal (übersteht Neustarts).
+        # Jede Sitzung hat ihren eigenen Schlüssel; fortsetzen mit --session bzw. AEGIS_SESSION
+        self.session = session or os.getenv('AEGIS_SESSION') or new_session_id()
+        self.conversation_history = ConversationHistory(self.session, history_db,
+                                                        keep_turns=HISTORY_KEEP_TURNS)
+        
+        # Cache für wiederkehrende Antworten (Budget per AEGIS_TTS_CACHE_BYTES)
+        if cache_bytes is None:
+            cache_bytes = int(os.getenv('AEGIS_TTS_CACHE_BYTES', DEFAULT_MAX_BYTES))
+        self.audio_cache = AudioCache(self.temp_dir / "tts_cache", max_bytes=cache_bytes)
+        self.tts_pool = None
+        self.calibration = CalibrationCache()
+        self.tts_loader = None
+        self.asr_loader = None
+        
+    def start_background_setup(self, tts_workers=0):
+        """TTS und Spracherkennung im Hintergrund laden und aufwärmen; kehrt sofort zurück
+
+        Mit tts_workers wird das Modell vorher im Hauptthread geladen und der Pool geforkt,
+        solange noch kein Lade-Thread läuft (sonst erben die Worker dessen Import-Locks).
+        Gibt False zurück, wenn das dabei schon scheitert.
+        """
+        def load_tts():
+            if not self.setup_coqui_tts():
+                raise RuntimeError("TTS-Setup fehlgeschlagen")
+            return self.tts
+        
+        def warm_tts(tts):
+            # Erste Synthese initialisiert Kernel und Caches, Ergebnis wird verworfen
+            if self.tts_pool:
+                self.tts_pool.warm_up()
+            else:
+                synthesize_to_file(tts, "Hallo.", os.devnull)
+        
+        def load_asr():
+            with timed("asr", "import + Backend"):
+                return get_recognizer(self.asr_backend)
+        
+        if tts_workers:
+            if not self.setup_coqui_tts():
+                return False
+            self.start_tts_pool(tts_workers)
+            self.tts_loader = BackgroundLoad("tts", lambda: self.tts, warm_tts)
+        else:
+            self.tts_loader = BackgroundLoad("tts", load_tts, warm_tts)
+        self.asr_loader = BackgroundLoad("asr", load_asr)
+        return True
+    
+    def tts_failed(self):
+        """TTS-Laden im Hintergrund ist gescheitert (ohne zu warten)"""
+        return bool(self.tts_loader and self.tts_loader.failed)
+        
+    def start_tts_pool(self, workers=None):
+        """Synthese in geforkten Worker-Prozessen (Modell copy-on-write geteilt)"""
+        from aegis_tts_pool import TTSWorkerPool
+        
+        self.tts_pool = TTSWorkerPool(self.tts, workers)
+        print(f"✅ {self.tts_pool.workers} TTS-Worker mit je {self.tts_pool.threads_per_worker} Threads")
+        return self.tts_pool
         
     def setup_coqui_tts(self):
         """Initialisiere Coqui TTS mit deutschem Modell"""
         try:
-            # Import erst nach Installation
-            from TTS.api import TTS
+            # Import erst nach Installation (zieht torch nach sich)
+            with timed("tts", "import TTS.api"):
+                from TTS.api import TTS
             
             # Verfügbare deutsche Modelle anzeigen
             print("🔍 Suche deutsche TTS-Modelle...")
             
             # Bestes deutsches Modell laden
             # tts_models/de/thorsten/tacotron2-DDC ist speziell für Deutsch optimiert
-            self.tts = TTS(model_name="tts_models/de/thorsten/tacotron2-DDC")
+            with timed("tts", "Modell laden"):
+                self.tts = TTS(model_name="tts_models/de/thorsten/tacotron2-DDC")
             
             print("✅ Coqui TTS mit deutschem Modell geladen!")
             return True
@@ -48,127 +164,104 @@ class AegisVoiceChat:
                 print(f"❌ Auch Fallback fehlgeschlagen: {e2}")
                 return False
     
-    def transcribe_audio(self, audio_file):
-        """Transkribiere Audio mit optimierter Spracherkennung"""
+    @traced()
+    def transcribe_audio(self, audio_file, sender="local"):
+        """Transkribiere Audio (Pfad oder AudioBuffer) mit optimierter Spracherkennung
+
+        sender: Gerät/Nutzer für die Kalibrierung
+        """
         try:
-            # Konvertiere zu WAV falls nötig
-            wav_file = self.convert_to_wav(audio_file)
+            if self.asr_loader:
+                self.asr_loader.get()  # wartet nur, falls noch im Hintergrund geladen wird
             
-            # Verwende verbesserte Python Speech Recognition
-            import speech_recognition as sr
+            # Puffer oder Datei direkt zu 16 kHz PCM dekodieren, kein Umweg über WAV
+            audio = as_audio_buffer(audio_file, 16000)
             
-            r = sr.Recognizer()
-            r.energy_threshold = 300
-            r.dynamic_energy_threshold = True
-            r.pause_threshold = 0.8
-            r.operation_timeout = 10
-            
-            with sr.AudioFile(wav_file) as source:
-                r.adjust_for_ambient_noise(source, duration=0.3)
-                audio = r.record(source)
+            # VAD statt adjust_for_ambient_noise: Stille weg, lange Notizen an Pausen teilen;
+            # die Schwelle kommt aus dem gelernten Rauschprofil des Absenders
+            threshold, energies = self.calibration.calibrate(sender, audio.data, 16000)
+            chunks = [audio.byte_range(start, end)
+                      for start, end in pause_ranges(audio.data, 16000, threshold=threshold, energies=energies)]
+            current_span().set(audio_seconds=audio.seconds, chunks=len(chunks),
+                               speech_seconds=sum(chunk.seconds for chunk in chunks))
+            if not chunks:
+                print("🔇 Nur Stille erkannt")
+                return None
             
-            # Versuche zuerst Deutsch, dann Englisch
-            try:
-                text = r.recognize_google(audio, language='de-DE')
-                print(f"🎤 Verstanden (DE): {text}")
-                return text
-            except sr.UnknownValueError:
-                try:
-                    text = r.recognize_google(audio, language='en-US')
-                    print(f"🎤 Verstanden (EN): {text}")
-                    return text
-                except:
-                    return None
-            except sr.RequestError as e:
-                print(f"❌ Google Speech Recognition Fehler: {e}")
+            # Erkennung über das konfigurierte Backend (Google oder lokal)
+            result = transcribe_chunks(chunks, get_recognizer(self.asr_backend))
+            if not result:
                 return None
+            text, language = result
+            current_span().set(language=language)
+            print(f"🎤 Verstanden ({language.upper()}): {text}")
+            return text
                 
         except Exception as e:
             print(f"❌ Transkription fehlgeschlagen: {e}")
             return None
     
-    def convert_to_wav(self, audio_file):
-        """Konvertiere Audio zu WAV für bessere Erkennung"""
-        wav_file = self.temp_dir / f"converted_{os.path.basename(audio_file)}.wav"
-        
-        try:
-            subprocess.run([
-                'ffmpeg', '-i', str(audio_file),
-                '-ar', '16000',  # 16kHz Sample Rate
-                '-ac', '1',      # Mono
-                '-c:a', 'pcm_s16le',  # PCM 16-bit
-                str(wav_file), '-y'
-            ], check=True, capture_output=True)
-            
-            return str(wav_file)
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Audio-Konvertierung fehlgeschlagen: {e}")
-            return str(audio_file)  # Return original if conversion fails
-    
+    @traced()
     def generate_response(self, user_text):
         """Generiere kontextuelle AI-Antwort"""
-        # Erweiterte kontextuelle Antworten
-        responses = {
-            'greeting': [
-                f"Hallo Ironman! Schön dass wir jetzt mit Coqui TTS sprechen können. Du sagtest: '{user_text}' - das freut mich!",
-                f"Hi! Endlich eine natürliche deutsche Stimme! Zu deiner Nachricht '{user_text}' kann ich sagen: Das ist ein guter Start!",
-                f"Hey! Coqui TTS funktioniert! Du meintest '{user_text}' - lass uns das ausbauen!"
-            ],
-            'technical': [
-                f"Spannende technische Frage zu '{user_text}'. Mit Coqui TTS können wir jetzt richtig entwickeln!",
-                f"Bei '{user_text}' sehe ich mehrere Lösungsansätze. Die kostenlose TTS macht alles möglich!",
-                f"Gute Frage zu '{user_text}'! Jetzt wo die Sprache funktioniert, können wir fokussiert arbeiten."
-            ],
-            'voice_quality': [
-                f"Du fragst nach '{user_text}' - diese Coqui-Stimme ist definitiv besser als der chinesische Roboter von vorhin!",
-                f"Zu '{user_text}': Die Qualität sollte jetzt viel natürlicher sein. Wie klingt das?",
-                f"'{user_text}' - endlich eine verständliche deutsche Stimme! Ist das so besser?"
-            ],
-            'general': [
-                f"Du sagtest '{user_text}' - das bringt mich zum Nachdenken. Was sind deine weiteren Pläne?",
-                f"Interessant! Zu '{user_text}' fällt mir ein: Jetzt können wir endlich flüssig kommunizieren!",
-                f"Das mit '{user_text}' sehe ich auch so. Wie sollen wir weitermachen?"
-            ]
-        }
-        
-        # Kategorisierung basierend auf Kontext
-        text_lower = user_text.lower()
-        
-        if any(word in text_lower for word in ['hallo', 'hi', 'hey', 'guten']):
-            category = 'greeting'
-        elif any(word in text_lower for word in ['stimme', 'sprache', 'hören', 'klingen', 'verstehen']):
-            category = 'voice_quality'
-        elif any(word in text_lower for word in ['code', 'app', 'entwickl', 'programm', 'tech', 'system']):
-            category = 'technical'
-        else:
-            category = 'general'
-        
-        import random
-        response = random.choice(responses[category])
+        # Kategorisierung und Vorlage über den vorkompilierten Router
+        intent, response = RESPONSE_ROUTER.respond(user_text)
+        current_span().set(category=intent.name)
         
         # Füge zur Gesprächshistorie hinzu
         self.conversation_history.append({
             'user': user_text,
             'ai': response,
-            'timestamp': str(subprocess.check_output(['date'], text=True).strip())
+            'timestamp': time.strftime('%a %b %d %H:%M:%S %Z %Y')
         })
         
         return response
     
-    def speak_text(self, text, output_file=None):
-        """Generiere Sprache mit Coqui TTS"""
+    def _tts_ready(self):
+        """Wartet auf das Modell, falls es noch im Hintergrund lädt; False, wenn keins da ist"""
+        if self.tts_loader:
+            try:
+                self.tts_loader.get()
+            except Exception:
+                pass  # Fehler wurde beim Laden schon gemeldet
         if not hasattr(self, 'tts'):
             print("❌ TTS nicht initialisiert!")
+            return False
+        return True
+    
+    def _cache_language(self):
+        """Sprache im Cache-Schlüssel (Thorsten ist einsprachig)"""
+        return None if "thorsten" in self.tts.model_name else "de"
+    
+    @traced()
+    def speak_text(self, text, output_file=None):
+        """Generiere Sprache mit Coqui TTS"""
+        if not self._tts_ready():
             return None
             
+        language = self._cache_language()
+        span = current_span()
+        span.set(engine=self.tts.model_name, chars=len(text))
+        
         if not output_file:
-            output_file = self.temp_dir / f"response_{len(self.conversation_history)}.wav"
+            output_file = self.scratch.path("response")
         
         try:
+            # Cache-Treffer: Modell komplett überspringen (Kopie, der Cache darf den Eintrag
+            # jederzeit verdrängen; ist er schon weg, wird normal synthetisiert)
+            cached = self.audio_cache.copy_to(self.tts.model_name, language, text, output_file)
+            span.set(cache_hit=cached)
+            if cached:
+                print(f"⚡ Audio aus Cache: {text[:50]}...")
+                return str(output_file)
+            
             print(f"🗣️ Generiere Sprache: {text[:50]}...")
             
+            if self.tts_pool:
+                # Eigener Worker-Prozess: lange Antworten blockieren andere nicht
+                self.tts_pool.synthesize(text, output_file, "de")
             # Verwende deutsches Modell
-            if "thorsten" in self.tts.model_name:
+            elif "thorsten" in self.tts.model_name:
                 # Deutsches Modell - direkt verwenden
                 self.tts.tts_to_file(
                     text=text,
@@ -182,6 +275,9 @@ class AegisVoiceChat:
                     language="de"
                 )
             
+            trim_wav_file(output_file)  # tote Luft am Anfang/Ende entfernen
+            span.set(audio_seconds=wav_seconds(output_file))
+            self.audio_cache.put(self.tts.model_name, language, text, output_file)
             print(f"✅ Audio gespeichert: {output_file}")
             return str(output_file)
             
@@ -189,6 +285,67 @@ class AegisVoiceChat:
             print(f"❌ Sprachgenerierung fehlgeschlagen: {e}")
             return None
     
+    def speak_audio(self, text):
+        """Wie speak_text, liefert aber einen AudioBuffer; das WAV bleibt im RAM (memfd)"""
+        with self.scratch.intermediate("response") as wav_file:
+            if not self.speak_text(text, wav_file):
+                return None
+            return AudioBuffer.from_wav(wav_file)
+    
+    def speak_opus(self, text):
+        """Wie speak_text, liefert aber OGG/Opus; das kodierte Ergebnis landet mit im Cache"""
+        if not self._tts_ready():
+            return None
+        language = self._cache_language()
+        output_file = self.scratch.path("response", ".ogg")
+        # Treffer ist schon kodiert: nur kopieren, weder Synthese noch Opus-Kodierung
+        if self.audio_cache.copy_to(self.tts.model_name, language, text, output_file, suffix=".ogg"):
+            print(f"⚡ Opus aus Cache: {text[:50]}...")
+            return str(output_file)
+        
+        audio = self.speak_audio(text)
+        if audio is None:
+            return None
+        try:
+            encode_audio(audio, output_file)
+            self.audio_cache.put(self.tts.model_name, language, text, output_file, suffix=".ogg")
+            return str(output_file)
+        except (EncoderUnavailable, OSError, ValueError, subprocess.CalledProcessError) as e:
+            print(f"❌ Opus-Kodierung fehlgeschlagen: {e}")
+            return None
+    
+    def iter_speech(self, text):
+        """Satzweise Synthese: liefert (Satz, Audio-Datei), Satz N+1 läuft schon im Hintergrund"""
+        sentences = list(enumerate(split_sentences(text)))
+        
+        def synthesize(indexed):
+            index, sentence = indexed
+            return self.speak_text(sentence, self.scratch.path(f"stream_{index}"))
+        
+        for (_, sentence), audio_file in prefetch(sentences, synthesize):
+            if audio_file:
+                yield sentence, audio_file
+    
+    def speak_streaming(self, text, player=('aplay',), started=None):
+        """Spiele Antwort satzweise ab, während der nächste Satz synthetisiert wird
+
+        started: Bezugszeitpunkt (perf_counter) für "Erstes Audio", z.B. das Sprechende im Live-Modus
+        """
+        started = started if started is not None else time.perf_counter()
+        first_audio = None
+        
+        for sentence, audio_file in self.iter_speech(text):
+            if first_audio is None:
+                first_audio = time.perf_counter() - started
+                print(f"⏱️ Erstes Audio nach {first_audio:.2f}s")
+            try:
+                subprocess.run([*player, audio_file], check=True, capture_output=True)
+            except (OSError, subprocess.CalledProcessError):
+                print(f"ℹ️ Audio gespeichert ({player[0]} nicht verfügbar): {audio_file}")
+        
+        return first_audio
+    
+    @traced()
     def process_voice_message(self, input_audio_file):
         """Kompletter Voice-to-Voice Workflow"""
         print(f"\n🎤 Verarbeite Sprachnachricht: {input_audio_file}")
@@ -196,25 +353,30 @@ class AegisVoiceChat:
         # 1. Transkribieren
         transcription = self.transcribe_audio(input_audio_file)
         if not transcription:
+            current_span().set(failed_stage="asr")
             return None, None, "Spracherkennung fehlgeschlagen"
         
         # 2. AI-Antwort generieren
         ai_response = self.generate_response(transcription)
         
         # 3. Sprache generieren
-        audio_file = self.speak_text(ai_response)
+        if self.reply_suffix == '.ogg':
+            audio_file = self.speak_opus(ai_response)
+        else:
+            audio_file = self.speak_text(ai_response)
         if not audio_file:
+            current_span().set(failed_stage="tts")
             return transcription, ai_response, "Sprachgenerierung fehlgeschlagen"
         
         return transcription, ai_response, audio_file
     
-    def start_interactive_mode(self):
-        """Interaktiver Voice Chat Modus"""
+    def start_interactive_mode(self, stream=False):
+        """Interaktiver Voice Chat Modus (stream=True: satzweise Wiedergabe)"""
         print("\n🛡️ Aegis Voice Chat gestartet!")
         print("Drücke Enter und gib den Pfad zu einer Audiodatei ein...")
         print("Oder 'quit' zum Beenden\n")
         
-        while True:
+        while not self.tts_failed():
             try:
                 user_input = input("Audio-Datei Pfad (oder 'quit'): ").strip()
                 
@@ -229,6 +391,17 @@ class AegisVoiceChat:
                     print(f"❌ Datei nicht gefunden: {user_input}")
                     continue
                 
+                if stream:
+                    transcription = self.transcribe_audio(user_input)
+                    if not transcription:
+                        print("❌ Fehler: Spracherkennung fehlgeschlagen")
+                        continue
+                    response = self.generate_response(transcription)
+                    print(f"📝 Du: {transcription}")
+                    print(f"🛡️ Aegis: {response}")
+                    self.speak_streaming(response)
+                    continue
+                
                 # Verarbeite Sprachnachricht
                 transcription, response, audio_file = self.process_voice_message(user_input)
                 
@@ -240,10 +413,11 @@ class AegisVoiceChat:
                     
                     # Versuche Audio abzuspielen (falls verfügbar)
                     try:
-                        subprocess.run(['aplay', audio_file], check=True, capture_output=True)
+                        player = ['aplay'] if audio_file.endswith('.wav') else ['ffplay', '-nodisp', '-autoexit']
+                        subprocess.run([*player, audio_file], check=True, capture_output=True)
                         print("🔊 Audio abgespielt!")
                     except:
-                        print("ℹ️ Audio gespeichert (aplay nicht verfügbar)")
+                        print(f"ℹ️ Audio gespeichert ({player[0]} nicht verfügbar)")
                 else:
                     print(f"❌ Fehler: {audio_file}")
                 
@@ -252,23 +426,101 @@ class AegisVoiceChat:
                 break
             except Exception as e:
                 print(f"❌ Fehler: {e}")
+    
+    def start_live_mode(self, source="mic", player=('aplay',), speed=1.0, speculative=True):
+        """Live-Modus: Sprache von Mikrofon, Pipe oder Datei (in Echtzeit abgespielt);
+        die Antwort beginnt, sobald das Ende der Äußerung erkannt ist.
+        
+        Gibt die Latenzen Sprechende -> erstes Antwort-Audio (Sekunden) zurück.
+        """
+        print(f"\n🛡️ Aegis Live-Modus: {source}")
+        print("Sprich einfach los, Strg+C zum Beenden\n")
+        if self.asr_loader:
+            self.asr_loader.get()
+        transcriber = LiveTranscriber(get_recognizer(self.asr_backend), speculative=speculative)
+        latencies = []
+        
+        try:
+            for event in transcriber.run(pcm_stream(source, speed=speed)):
+                if event.kind == "partial":
+                    print(f"💬 ... {event.text}")
+                    continue
+                
+                if self.tts_failed():
+                    break
+                print(f"🎤 Verstanden ({event.language.upper()}): {event.text}")
+                response = self.generate_response(event.text)
+                print(f"🛡️ Aegis: {response}")
+                latency = self.speak_streaming(response, player, started=event.speech_end)
+                # Eigene Antwort nicht wieder aufnehmen (Echo über Lautsprecher)
+                transcriber.mute_until(time.perf_counter())
+                if latency is None:
+                    continue
+                latencies.append(latency)
+                timings = event.timings
+                print(f"⏱️ Sprechende -> erstes Audio {latency:.2f}s (Endpunkt {timings['endpoint']:.2f}s, "
+                      f"ASR {timings['asr_wait']:.2f}s{' spekulativ' if timings['speculative'] else ''})")
+        except KeyboardInterrupt:
+            print("\n👋 Auf Wiedersehen!")
+        except OSError as e:
+            print(f"❌ Live-Quelle nicht verfügbar ({source}): {e}")
+        
+        if latencies:
+            ordered = sorted(latencies)
+            print(f"📊 Live: {len(latencies)} Antworten, Sprechende -> erstes Audio "
+                  f"Median {ordered[len(ordered) // 2]:.2f}s, max {ordered[-1]:.2f}s")
+        return latencies
 
 def main():
     """Hauptprogramm"""
     print("🛡️ Aegis Voice Chat - Coqui TTS Edition")
     print("=" * 50)
     
-    chat = AegisVoiceChat()
+    # --session NAME: früheres Gespräch fortsetzen (Kontext aus dem Journal)
+    session = None
+    if '--session' in sys.argv:
+        index = sys.argv.index('--session') + 1
+        if index < len(sys.argv):
+            session = sys.argv[index]
+    chat = AegisVoiceChat(session=session)
     
-    # Initialisiere TTS
-    if not chat.setup_coqui_tts():
+    # TTS und ASR laden im Hintergrund, der Prompt erscheint sofort.
+    # Mehrere Nutzer: AEGIS_TTS_WORKERS Synthese-Prozesse (0 = im Hauptprozess)
+    if not chat.start_background_setup(tts_workers=int(os.getenv('AEGIS_TTS_WORKERS', 0))):
         print("❌ TTS-Setup fehlgeschlagen. Installiere Coqui TTS...")
         return 1
+    report_startup("Prompt bereit")
+    
+    if '--live' in sys.argv:
+        # --live [Gerät | - | FIFO | Audiodatei]: Sprache direkt vom Mikrofon oder aus einer Pipe
+        index = sys.argv.index('--live') + 1
+        source = sys.argv[index] if index < len(sys.argv) and not sys.argv[index].startswith('--') else 'mic'
+        chat.start_live_mode(source)
+    else:
+        # Starte interaktiven Modus (--stream: satzweise Synthese + Wiedergabe)
+        chat.start_interactive_mode(stream='--stream' in sys.argv)
+    report_startup("Beenden")  # enthält jetzt auch Lade- und Aufwärmzeiten
+    tts_failed = chat.tts_failed()
+    if tts_failed:
+        print("❌ TTS-Setup fehlgeschlagen. Installiere Coqui TTS...")
     
-    # Starte interaktiven Modus
-    chat.start_interactive_mode()
+    stats = chat.audio_cache.stats()
+    print(f"📊 TTS-Cache: {stats['hits']} Treffer, {stats['misses']} Fehlgriffe, "
+          f"{stats['bytes'] / 1024:.0f} KiB belegt")
+    for asr in recognizer_stats():
+        rates = ", ".join(f"{lang}: {rate:.0%}" for lang, rate in asr['language_rates'].items())
+        print(f"📊 ASR ({asr['backend']}): {asr['total']} Nachrichten, {rates or 'keine Treffer'}")
+    scratch = chat.scratch.stats()
+    print(f"📊 Scratch ({scratch['backing']}): {scratch['files']} Dateien, "
+          f"{scratch['bytes'] / 1024:.0f} / {scratch['quota_bytes'] / 1024:.0f} KiB, "
+          f"{scratch['evicted_files']} verdrängt")
+    print(f"📊 Verlauf: {chat.conversation_history.turns} Züge im Journal ({HISTORY_DB}), "
+          f"fortsetzen mit --session {chat.session}")
+    chat.conversation_history.close()
+    if chat.tts_pool:
+        chat.tts_pool.close()
     
-    return 0
+    return 1 if tts_failed else 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -4,145 +4,151 @@
 Direkte Integration in bestehenden Clawdbot Workflow
 """
 
+import asyncio
 import os
 import sys
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 
-def transcribe_telegram_voice(audio_file_path):
-    """Transkribiere Telegram Sprachnachricht"""
-    print(f"🎤 Transkribiere: {audio_file_path}")
+from aegis_asr import RecognitionUnavailable, get_recognizer, transcribe_chunks
+from aegis_audio_buffer import AudioBuffer, as_audio_buffer
+from aegis_calibration import CalibrationCache
+from aegis_espeak import get_espeak
+from aegis_intents import Intent, IntentRouter
+from aegis_opus import EncoderUnavailable, encode_audio, reply_suffix
+from aegis_pipeline import Stage, StagedPipeline
+from aegis_scratch import ScratchSpace
+from aegis_startup import BackgroundLoad, report as report_startup
+from aegis_trace import current_span, traced, wav_seconds
+from aegis_tts_daemon import load_coqui_tts, request_speech, synthesize_to_file
+from aegis_tts_router import TTSEngine, TTSRouter
+from aegis_vad import pause_ranges, trim_wav_file
+
+# Antwortvorlagen (einmal geladen, {user_text} wird eingesetzt);
+# Schlüsselwörter treffen wie bisher auch innerhalb von Wörtern
+RESPONSE_ROUTER = IntentRouter([
+    Intent('greeting', ['hallo', 'hi', 'hey', 'guten'], [
+        "Hallo Ironman! Du sagtest '{user_text}' - schön, dass wir jetzt per Sprache kommunizieren!",
+        "Hi! Das funktioniert ja perfekt. Zu '{user_text}' kann ich sagen: Endlich können wir richtig sprechen!",
+        "Hey! Super, dass das Voice System läuft. '{user_text}' - das ist ein guter Start!"
+    ]),
+    Intent('voice_feedback', ['stimme', 'sprache', 'hören', 'verstehen', 'klingen'], [
+        "Du meintest '{user_text}' - hoffentlich ist meine neue Stimme jetzt besser verständlich!",
+        "Zu '{user_text}': Die Coqui TTS sollte deutlich natürlicher klingen als vorhin.",
+        "'{user_text}' - endlich eine deutsche Stimme die nicht wie ein Roboter klingt, oder?"
+    ]),
+    Intent('technical', ['code', 'app', 'entwickl', 'programm', 'tech'], [
+        "Interessante technische Frage zu '{user_text}'. Lass mich das systematisch angehen.",
+        "Bei '{user_text}' sehe ich verschiedene Lösungsansätze. Am besten wäre:",
+        "Gute Frage zu '{user_text}'! Aus Entwickler-Sicht würde ich empfehlen:"
+    ]),
+], default=Intent('general', [], [
+    "Du sagtest '{user_text}' - das ist ein wichtiger Punkt. Was denkst du weiter dazu?",
+    "Interessant! Zu '{user_text}' fällt mir ein: Das können wir gut ausbauen.",
+    "'{user_text}' - da stimme ich zu. Wie sollen wir das angehen?"
+]), substring=True)
+
+# Antwort-Audio mit eindeutigen Namen und Quota statt /tmp/aegis_response_{pid}.wav
+SCRATCH = ScratchSpace("aegis_voice")
+# Gelernte VAD-Schwelle pro Chat statt Schätzung aus jeder Nachricht allein
+CALIBRATION = CalibrationCache()
+# OGG/Opus wie Telegram-Sprachnachrichten (AEGIS_REPLY_FORMAT=wav für unkomprimiert)
+REPLY_SUFFIX = reply_suffix()
+
+@traced()
+def decode_telegram_voice(audio, sender=None, share=False):
+    """Dekodiere zu 16 kHz Mono PCM und teile per VAD in Sprachstücke (Schwelle aus dem Profil des Absenders)
+
+    audio: Dateipfad oder AudioBuffer. Die Stücke sind AudioBuffer-Ausschnitte ohne Kopie;
+    mit share=True liegen sie in Shared Memory (für ASR-Worker in anderen Prozessen).
+    """
+    audio = as_audio_buffer(audio, 16000)
+    if share:
+        audio = audio.share()
+    # VAD: Stille abschneiden, lange Notizen an Pausen teilen
+    threshold, energies = CALIBRATION.calibrate(sender, audio.data, 16000)
+    chunks = [audio.byte_range(start, end)
+              for start, end in pause_ranges(audio.data, 16000, threshold=threshold, energies=energies)]
+    if share and not chunks:
+        audio.release()
+    current_span().set(audio_seconds=audio.seconds, chunks=len(chunks),
+                       speech_seconds=sum(chunk.seconds for chunk in chunks))
+    return chunks
+
+@traced()
+def recognize_voice_chunks(chunks):
+    """Erkenne die Sprachstücke über das konfigurierte Backend (AEGIS_ASR_BACKEND)"""
+    if not chunks:
+        print("🔇 Nur Stille erkannt")
+        return None
+    try:
+        result = transcribe_chunks(chunks)
+    except RecognitionUnavailable as e:
+        print(f"❌ Spracherkennung nicht erreichbar: {e}")
+        return None
+    if not result:
+        return None
+    text, language = result
+    current_span().set(language=language)
+    print(f"✅ Verstanden ({language.upper()}): {text}")
+    return text
+
+@traced()
+def transcribe_telegram_voice(audio, sender=None):
+    """Transkribiere Telegram Sprachnachricht (Pfad oder AudioBuffer; sender: Chat-ID für die Kalibrierung)"""
+    print(f"🎤 Transkribiere: {audio}")
     
     try:
-        # Konvertiere zu WAV
-        temp_wav = f"/tmp/telegram_voice_{os.getpid()}.wav"
-        
-        subprocess.run([
-            'ffmpeg', '-i', audio_file_path,
-            '-ar', '16000', '-ac', '1',
-            '-c:a', 'pcm_s16le',
-            temp_wav, '-y'
-        ], capture_output=True, check=True)
-        
-        # Verwende Python Speech Recognition
-        import speech_recognition as sr
-        
-        r = sr.Recognizer()
-        r.energy_threshold = 300
-        r.dynamic_energy_threshold = True
-        
-        with sr.AudioFile(temp_wav) as source:
-            r.adjust_for_ambient_noise(source, duration=0.2)
-            audio = r.record(source)
-        
-        # Deutsch zuerst, dann Englisch
-        try:
-            text = r.recognize_google(audio, language='de-DE')
-            print(f"✅ Verstanden (DE): {text}")
-            return text
-        except:
-            try:
-                text = r.recognize_google(audio, language='en-US')
-                print(f"✅ Verstanden (EN): {text}")
-                return text
-            except:
-                return None
-                
+        return recognize_voice_chunks(decode_telegram_voice(audio, sender))
     except Exception as e:
         print(f"❌ Transkription fehlgeschlagen: {e}")
         return None
-    finally:
-        # Cleanup
-        if os.path.exists(temp_wav):
-            os.remove(temp_wav)
 
+@traced()
 def generate_ai_response(user_text):
     """Generiere intelligente Antwort"""
-    responses = {
-        'greeting': [
-            f"Hallo Ironman! Du sagtest '{user_text}' - schön, dass wir jetzt per Sprache kommunizieren!",
-            f"Hi! Das funktioniert ja perfekt. Zu '{user_text}' kann ich sagen: Endlich können wir richtig sprechen!",
-            f"Hey! Super, dass das Voice System läuft. '{user_text}' - das ist ein guter Start!"
-        ],
-        'technical': [
-            f"Interessante technische Frage zu '{user_text}'. Lass mich das systematisch angehen.",
-            f"Bei '{user_text}' sehe ich verschiedene Lösungsansätze. Am besten wäre:",
-            f"Gute Frage zu '{user_text}'! Aus Entwickler-Sicht würde ich empfehlen:"
-        ],
-        'voice_feedback': [
-            f"Du meintest '{user_text}' - hoffentlich ist meine neue Stimme jetzt besser verständlich!",
-            f"Zu '{user_text}': Die Coqui TTS sollte deutlich natürlicher klingen als vorhin.",
-            f"'{user_text}' - endlich eine deutsche Stimme die nicht wie ein Roboter klingt, oder?"
-        ],
-        'general': [
-            f"Du sagtest '{user_text}' - das ist ein wichtiger Punkt. Was denkst du weiter dazu?",
-            f"Interessant! Zu '{user_text}' fällt mir ein: Das können wir gut ausbauen.",
-            f"'{user_text}' - da stimme ich zu. Wie sollen wir das angehen?"
-        ]
-    }
-    
-    # Kategorisierung
-    text_lower = user_text.lower()
-    
-    if any(word in text_lower for word in ['hallo', 'hi', 'hey', 'guten']):
-        category = 'greeting'
-    elif any(word in text_lower for word in ['stimme', 'sprache', 'hören', 'verstehen', 'klingen']):
-        category = 'voice_feedback'
-    elif any(word in text_lower for word in ['code', 'app', 'entwickl', 'programm', 'tech']):
-        category = 'technical'
-    else:
-        category = 'general'
-    
-    import random
-    return random.choice(responses[category])
+    intent, response = RESPONSE_ROUTER.respond(user_text)
+    current_span().set(category=intent.name)
+    return response
+
+_coqui_tts = None
+_coqui_lock = threading.Lock()  # Laden und Synthese: ein Modell, nicht threadsicher
 
 def generate_speech_with_coqui(text, output_file):
-    """Generiere Sprache mit Coqui TTS (falls verfügbar)"""
+    """Generiere Sprache mit Coqui TTS (falls verfügbar); das Modell bleibt wie im Daemon geladen"""
+    global _coqui_tts
     try:
-        from TTS.api import TTS
-        
-        print(f"🗣️ Generiere Coqui-Sprache: {text[:50]}...")
-        
-        # Verwende bestes deutsches Modell
-        try:
-            # Deutsches Thorsten-Modell (beste Qualität)
-            tts = TTS(model_name="tts_models/de/thorsten/tacotron2-DDC")
-            tts.tts_to_file(text=text, file_path=output_file)
-            print("✅ Deutsche Stimme (Thorsten) verwendet")
-            return True
-        except:
-            # Fallback: Multilingual
-            try:
-                tts = TTS(model_name="tts_models/multilingual/multi-dataset/xtts_v2")
-                tts.tts_to_file(text=text, file_path=output_file, language="de")
-                print("✅ Multilingual Stimme verwendet")
-                return True
-            except Exception as e:
-                print(f"❌ Coqui TTS fehlgeschlagen: {e}")
-                return False
-                
+        with _coqui_lock:
+            if _coqui_tts is None:
+                print("⏳ Lade Coqui-Modell (einmalig)...")
+                _coqui_tts = load_coqui_tts()
+            print(f"🗣️ Generiere Coqui-Sprache: {text[:50]}...")
+            synthesize_to_file(_coqui_tts, text, output_file)
+        print(f"✅ Coqui-Stimme verwendet ({_coqui_tts.model_name})")
+        return True
     except ImportError:
         print("⏳ Coqui TTS noch nicht verfügbar")
         return False
+    except Exception as e:
+        print(f"❌ Coqui TTS fehlgeschlagen: {e}")
+        return False
+
+def generate_speech_with_daemon(text, output_file):
+    """Generiere Sprache über den laufenden Aegis TTS Daemon (Modell bleibt geladen)"""
+    print(f"🗣️ Sende an TTS Daemon: {text[:50]}...")
+    if request_speech(text, output_file):
+        print("✅ Sprache vom TTS Daemon erhalten")
+        return True
+    print("ℹ️ Kein TTS Daemon aktiv")
+    return False
 
 def generate_speech_with_espeak(text, output_file):
-    """Fallback: eSpeak mit optimierten Einstellungen"""
+    """Fallback: eSpeak mit optimierten Einstellungen (residente Engine, kein Prozess pro Antwort)"""
     try:
         print(f"🗣️ Generiere eSpeak-Sprache: {text[:50]}...")
-        
-        # Beste eSpeak-Einstellungen für Deutsch
-        subprocess.run([
-            'espeak', 
-            '-v', 'de+f3',    # Deutsche weibliche Stimme
-            '-s', '120',      # Langsamer als vorhin
-            '-p', '32',       # Tiefere Stimme
-            '-a', '140',      # Lautstärke
-            '-g', '12',       # Längere Pausen
-            '-w', output_file,
-            text
-        ], check=True, capture_output=True)
-        
+        get_espeak().synthesize_to_file(text, output_file)
         print("✅ eSpeak Sprache generiert")
         return True
         
@@ -150,14 +156,24 @@ def generate_speech_with_espeak(text, output_file):
         print(f"❌ eSpeak fehlgeschlagen: {e}")
         return False
 
-def process_telegram_voice_message(audio_file_path):
-    """Hauptfunktion: Voice-to-Voice für Telegram"""
+# Warmer Daemon und Coqui vor eSpeak; kaputte Engines überspringt der Circuit Breaker
+# (AEGIS_TTS_SLO_SECONDS: schnellere Engine wählen, wenn Coqui das Latenzziel reißt)
+TTS_ROUTER = TTSRouter([
+    TTSEngine("coqui_daemon", generate_speech_with_daemon, tier=2, label="Coqui TTS (Daemon)"),
+    TTSEngine("coqui", generate_speech_with_coqui, tier=2, label="Coqui TTS"),
+    TTSEngine("espeak", generate_speech_with_espeak, tier=1, label="eSpeak (optimiert)"),
+])
+
+@traced()
+def process_telegram_voice_message(audio, sender=None):
+    """Hauptfunktion: Voice-to-Voice für Telegram (audio: Dateipfad oder AudioBuffer)"""
     print("\n🛡️ Aegis Voice Processing")
     print("=" * 40)
     
     # 1. Transkribieren
-    transcription = transcribe_telegram_voice(audio_file_path)
+    transcription = transcribe_telegram_voice(audio, sender)
     if not transcription:
+        current_span().set(failed_stage="asr")
         return None, None, "Spracherkennung fehlgeschlagen ❌"
     
     # 2. AI-Antwort generieren
@@ -165,49 +181,166 @@ def process_telegram_voice_message(audio_file_path):
     print(f"🧠 AI Antwort: {ai_response}")
     
     # 3. Sprache generieren
-    output_file = f"/tmp/aegis_response_{os.getpid()}.wav"
-    
-    # Versuche zuerst Coqui, dann eSpeak
-    if generate_speech_with_coqui(ai_response, output_file):
-        speech_engine = "Coqui TTS"
-    elif generate_speech_with_espeak(ai_response, output_file):
-        speech_engine = "eSpeak (optimiert)"
-    else:
+    output_file = str(SCRATCH.path("aegis_response", REPLY_SUFFIX))
+    speech_engine = speak_reply(ai_response, output_file)
+    if not speech_engine:
+        current_span().set(failed_stage="tts")
         return transcription, ai_response, "Sprachgenerierung fehlgeschlagen ❌"
     
     print(f"✅ Voice Processing abgeschlossen mit {speech_engine}")
     return transcription, ai_response, output_file
 
-def main():
-    """Test-Modus"""
-    if len(sys.argv) != 2:
-        print("Usage: python3 simple-telegram-voice.py <audio_file>")
-        print("Beispiel: python3 simple-telegram-voice.py /path/to/voice.ogg")
-        return 1
-    
-    audio_file = sys.argv[1]
-    
-    if not os.path.exists(audio_file):
-        print(f"❌ Audio-Datei nicht gefunden: {audio_file}")
-        return 1
+@traced()
+def synthesize_reply(text, output_file):
+    """Sprache erzeugen, gibt den Namen der genutzten Engine oder None zurück"""
+    speech_engine = TTS_ROUTER.synthesize(text, output_file)
+    if not speech_engine:
+        return None
     
-    # Verarbeite Sprachnachricht
-    transcription, response, audio_output = process_telegram_voice_message(audio_file)
+    trim_wav_file(output_file)  # tote Luft am Anfang/Ende entfernen
+    current_span().set(engine=speech_engine, chars=len(text), audio_seconds=wav_seconds(output_file))
+    return speech_engine
+
+def speak_reply(text, output_file):
+    """Sprache erzeugen und als .ogg (Opus) bzw. .wav ablegen; gibt die Engine oder None zurück"""
+    if not output_file.endswith('.ogg'):
+        return synthesize_reply(text, output_file)
     
+    # WAV nur im RAM, auf die Platte kommt direkt das OGG/Opus
+    speech_engine, audio = synthesize_audio(text)
+    if not speech_engine:
+        return None
+    try:
+        encode_audio(audio, output_file)
+    except (EncoderUnavailable, OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"❌ Opus-Kodierung fehlgeschlagen: {e}")
+        return None
+    return speech_engine
+
+def synthesize_audio(text):
+    """Antwort als AudioBuffer statt Datei; gibt (Engine, AudioBuffer) bzw. (None, None) zurück"""
+    with SCRATCH.intermediate("aegis_tts") as wav_file:  # memfd, verschwindet nach dem Einlesen
+        speech_engine = synthesize_reply(text, str(wav_file))
+        if not speech_engine:
+            return None, None
+        return speech_engine, AudioBuffer.from_wav(wav_file)
+
+# Pipeline-Stufen für mehrere gleichzeitige Nachrichten (siehe aegis_pipeline)
+def _stage_decode(job):
+    try:
+        job['chunks'] = decode_telegram_voice(job['audio_file'], job.get('sender'), job.get('share_audio'))
+    except Exception as e:
+        job['error'] = f"Dekodierung fehlgeschlagen ❌ ({e})"
+    return job
+
+def _stage_recognize(job):
+    chunks = job.pop('chunks')
+    try:
+        job['transcription'] = recognize_voice_chunks(chunks)
+    finally:
+        if chunks and chunks[0].shared:
+            chunks[0].release()  # Segment gehört zu dieser Nachricht, ASR war der letzte Leser
+    if not job['transcription']:
+        job['error'] = "Spracherkennung fehlgeschlagen ❌"
+    return job
+
+def _stage_respond(job):
+    job['response'] = generate_ai_response(job['transcription'])
+    return job
+
+def _stage_speak(job):
+    job['speech_engine'] = speak_reply(job['response'], job['output_file'])
+    if not job['speech_engine']:
+        job['error'] = "Sprachgenerierung fehlgeschlagen ❌"
+    return job
+
+def build_voice_pipeline(decode_workers=2, asr_workers=4, tts_workers=1, queue_size=8, asr_executor="thread"):
+    """Transkodieren -> ASR -> Antwort -> TTS mit eigener Worker-Zahl pro Stufe
+
+    asr_executor="process": lokale ASR (whisper) in eigenen Prozessen; das Audio
+    geht dann über Shared Memory statt serialisiert an die Worker.
+    """
+    return StagedPipeline([
+        Stage('decode', _stage_decode, workers=decode_workers, queue_size=queue_size),
+        Stage('asr', _stage_recognize, workers=asr_workers, queue_size=queue_size, executor=asr_executor),
+        Stage('respond', _stage_respond, executor=None, queue_size=queue_size),
+        Stage('tts', _stage_speak, workers=tts_workers, queue_size=queue_size),
+    ])
+
+async def process_telegram_voice_messages(audio_files, senders=None, **pipeline_options):
+    """Mehrere Sprachnachrichten gleichzeitig verarbeiten; Ergebnis wie process_telegram_voice_message"""
+    senders = senders or [None] * len(audio_files)
+    async with build_voice_pipeline(**pipeline_options) as pipeline:
+        jobs = await asyncio.gather(*(
+            pipeline.process({
+                'audio_file': audio_file,
+                'sender': sender,
+                'share_audio': pipeline_options.get('asr_executor') == 'process',
+                'output_file': str(SCRATCH.path("aegis_response", REPLY_SUFFIX)),
+            })
+            for audio_file, sender in zip(audio_files, senders)
+        ))
+    return [
+        (job.get('transcription'), job.get('response'), job.get('error') or job['output_file'])
+        for job in jobs
+    ]
+
+def report_result(transcription, response, audio_output):
+    """Ergebnis ausgeben und Antwort abspielen"""
     if audio_output and not audio_output.endswith("❌"):
         print(f"\n📝 Du: {transcription}")
         print(f"🛡️ Aegis: {response}")
         print(f"🔊 Audio: {audio_output}")
         
-        # Versuche Wiedergabe
+        # Versuche Wiedergabe (aplay kann nur WAV, OGG/Opus über ffplay)
+        player = ['aplay'] if audio_output.endswith('.wav') else ['ffplay', '-nodisp', '-autoexit']
         try:
-            subprocess.run(['aplay', audio_output], check=True, capture_output=True)
+            subprocess.run([*player, audio_output], check=True, capture_output=True)
             print("🔊 Audio abgespielt!")
         except:
-            print("ℹ️ Audio-Datei gespeichert (Wiedergabe nicht verfügbar)")
+            print(f"ℹ️ Audio-Datei gespeichert (Wiedergabe mit {player[0]} nicht verfügbar)")
     else:
         print(f"❌ Fehler: {audio_output}")
+
+def main():
+    """Test-Modus (mehrere Dateien laufen parallel durch die Pipeline)"""
+    args = sys.argv[1:]
+    # --sender CHAT_ID: Absender (Telegram-Chat) für das gelernte Rauschprofil
+    sender = None
+    if '--sender' in args:
+        index = args.index('--sender')
+        if index + 1 >= len(args):
+            print("❌ --sender braucht eine Chat-ID")
+            return 1
+        sender = args[index + 1]
+        del args[index:index + 2]
+    
+    if not args:
+        print("Usage: python3 simple-telegram-voice.py [--sender CHAT_ID] <audio_file> [<audio_file> ...]")
+        print("Beispiel: python3 simple-telegram-voice.py --sender 123456789 /path/to/voice.ogg")
+        return 1
+    
+    audio_files = args
+    
+    # Spracherkennung lädt im Hintergrund, während die Dateien dekodiert werden
+    BackgroundLoad("asr", get_recognizer)
+    report_startup("Handler bereit")
+    
+    for audio_file in audio_files:
+        if not os.path.exists(audio_file):
+            print(f"❌ Audio-Datei nicht gefunden: {audio_file}")
+            return 1
+    
+    # Verarbeite Sprachnachricht(en)
+    if len(audio_files) == 1:
+        results = [process_telegram_voice_message(audio_files[0], sender)]
+    else:
+        results = asyncio.run(process_telegram_voice_messages(audio_files, [sender] * len(audio_files)))
+    
+    for result in results:
+        report_result(*result)
     
+    report_startup("Fertig")
     return 0
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🛡️ Parität: RESPONSE_ROUTER gegen die bisherige any(word in text)-Logik
+Der Router soll nur schneller sein; jede Nachricht muss dieselbe Absicht
+bekommen wie vorher.
+
+Start: python3 -m pytest -q test_intents.py
+"""
+
+import random
+
+import pytest
+
+from aegis_bench import load_script
+from aegis_intents import Intent, IntentRouter
+
+# Bisherige Kategorisierung aus beiden Skripten (Reihenfolge = Priorität)
+LEGACY_KEYWORDS = {
+    "coqui-voice-chat.py": [
+        ("greeting", ['hallo', 'hi', 'hey', 'guten']),
+        ("voice_quality", ['stimme', 'sprache', 'hören', 'klingen', 'verstehen']),
+        ("technical", ['code', 'app', 'entwickl', 'programm', 'tech', 'system']),
+    ],
+    "simple-telegram-voice.py": [
+        ("greeting", ['hallo', 'hi', 'hey', 'guten']),
+        ("voice_feedback", ['stimme', 'sprache', 'hören', 'verstehen', 'klingen']),
+        ("technical", ['code', 'app', 'entwickl', 'programm', 'tech']),
+    ],
+}
+
+PHRASES = [
+    "Hallo Aegis, wie geht es dir heute?",
+    "Ich habe zwei Apps gebaut",
+    "Meine Codebasis wird langsam unübersichtlich",
+    "Das Systemdesign gefällt mir",
+    "Kannst du mir zuhören?",
+    "Das klappt noch nicht",
+    "Die Stimme klingt jetzt viel besser als vorher",
+    "Wie programmiere ich einen Webserver in Python?",
+    "Erzähl mir etwas über das Wetter am Wochenende",
+    "GUTEN MORGEN! Verstehst du mich?",
+    "Die Sprachqualität ist technisch gut",
+    "Entwickler-Meeting morgen",
+    "Ich weiß nicht genau, was wir morgen machen sollen",
+    "",
+]
+
+
+def legacy_route(text, intents):
+    text_lower = text.lower()
+    for name, keywords in intents:
+        if any(word in text_lower for word in keywords):
+            return name
+    return "general"
+
+
+def fuzz_phrases(keywords, count=500, seed=7):
+    """Zufällige Sätze aus Schlüsselwörtern, Wortteilen und Füllwörtern"""
+    rng = random.Random(seed)
+    filler = ["und", "die", "Zu", "ich", "wir", "morgen", "Nicht", "schön", "Straße", "etwas"]
+    pieces = keywords + [k[1:] for k in keywords] + [k[:-1] for k in keywords]
+    phrases = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(1, 6)):
+            word = rng.choice(filler if rng.random() < 0.5 else pieces)
+            if rng.random() < 0.3:
+                word = rng.choice(["zu", "Ge", "Un"]) + word  # Schlüsselwort mitten im Wort
+            if rng.random() < 0.3:
+                word += rng.choice(["s", "en", "basis", "design"])
+            words.append(word.capitalize() if rng.random() < 0.3 else word)
+        phrases.append(" ".join(words))
+    return phrases
+
+
+@pytest.mark.parametrize("script", sorted(LEGACY_KEYWORDS))
+def test_response_router_matches_legacy(script):
+    router = load_script(script).RESPONSE_ROUTER
+    legacy = LEGACY_KEYWORDS[script]
+    keywords = [keyword for _, words in legacy for keyword in words]
+    for phrase in PHRASES + fuzz_phrases(keywords):
+        assert router.route(phrase).name == legacy_route(phrase, legacy), phrase
+
+
+def test_substring_router_overlapping_keywords():
+    # Kürzeres Schlüsselwort einer früheren Absicht steckt im längeren einer späteren
+    router = IntentRouter([
+        Intent("a", ["te"], ["a"]),
+        Intent("b", ["tech", "xte"], ["b"]),
+    ], default=Intent("general", [], ["g"]), substring=True)
+    assert router.route("Technik").name == "a"
+    assert router.route("xtx").name == "general"
+    assert router.route("axtech").name == "a"
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+🛡️ Kaltstart-Budget: Zeit bis Prompt bzw. Handler bereit (wie bench_startup.py)
+Budget über AEGIS_STARTUP_BUDGET (Sekunden, Standard 1 s), Median aus 3 Läufen.
+
+Start: python3 -m pytest -q test_startup.py
+"""
+
+import pytest
+
+from bench_startup import DEFAULT_BUDGET, ENTRY_POINTS, entry_point, median_time_to_ready, write_clip
+
+REPEAT = 3
+
+
+@pytest.mark.parametrize("name", sorted(ENTRY_POINTS))
+def test_cold_start_within_budget(name, tmp_path):
+    argv, marker = entry_point(name, write_clip(tmp_path))
+    median, timings = median_time_to_ready(argv, marker, REPEAT)
+    assert median <= DEFAULT_BUDGET, (
+        f"{name}: bereit nach {median * 1000:.0f} ms, Budget {DEFAULT_BUDGET * 1000:.0f} ms "
+        f"(Läufe: {', '.join(f'{t * 1000:.0f}' for t in timings)})")
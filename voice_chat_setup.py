@@ -1,15 +1,29 @@
 #!/usr/bin/env python3
 import json
-import requests
 import time
 import subprocess
 import os
 from pathlib import Path
 
+from aegis_http import DEFAULT_TIMEOUT, create_session, stream_to_file
+from aegis_inbox import InboxWatcher
+from aegis_message_store import MessageStore, content_hash
+from aegis_scratch import ScratchSpace
+
+MESSAGE_DB = os.getenv('AEGIS_MESSAGE_DB', '/root/.clawdbot/media/aegis_messages.sqlite')
+
 class VoiceChatSystem:
     def __init__(self):
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.api_base = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
         self.telegram_session_active = True
+        self.inbox = None
+        
+        # One pooled keep-alive session for all API calls (timeouts + retry/backoff)
+        self.session = create_session(headers={'Authorization': f'Bearer {self.openai_api_key}'})
+        
+        # Reply audio gets unique names and a byte quota (oldest files evicted first)
+        self.scratch = ScratchSpace('aegis_voice')
         
     def setup_audio_processing(self):
         """Install required audio processing tools"""
@@ -38,11 +52,11 @@ class VoiceChatSystem:
             
             # Use OpenAI Whisper API
             with open(audio_file_path, 'rb') as audio_file:
-                response = requests.post(
-                    'https://api.openai.com/v1/audio/transcriptions',
-                    headers={'Authorization': f'Bearer {self.openai_api_key}'},
+                response = self.session.post(
+                    f'{self.api_base}/audio/transcriptions',
                     files={'file': audio_file},
-                    data={'model': 'whisper-1'}
+                    data={'model': 'whisper-1'},
+                    timeout=DEFAULT_TIMEOUT
                 )
                 
             if response.status_code == 200:
@@ -57,28 +71,30 @@ class VoiceChatSystem:
             print(f"❌ Transcription failed: {e}")
             return None
     
-    def text_to_speech(self, text, voice="nova"):
-        """Convert text to speech using OpenAI TTS"""
+    def text_to_speech(self, text, voice="nova", player=None):
+        """Convert text to speech using OpenAI TTS, streaming to disk (and optionally a player)"""
         print(f"🔊 Converting to speech: {text[:50]}...")
         
         try:
-            response = requests.post(
-                'https://api.openai.com/v1/audio/speech',
-                headers={'Authorization': f'Bearer {self.openai_api_key}'},
+            response = self.session.post(
+                f'{self.api_base}/audio/speech',
                 json={
                     'model': 'tts-1',
                     'voice': voice,
                     'input': text
-                }
+                },
+                timeout=DEFAULT_TIMEOUT,
+                stream=True
             )
             
             if response.status_code == 200:
-                audio_path = f'/tmp/response_{int(time.time())}.mp3'
-                with open(audio_path, 'wb') as f:
-                    f.write(response.content)
+                audio_path = str(self.scratch.path('response', '.mp3'))
+                size, first_byte = stream_to_file(response, audio_path, player=player)
+                print(f"⏱️ First byte after {first_byte or 0:.2f}s, {size / 1024:.0f} KiB")
                 print(f"🎵 Audio saved: {audio_path}")
                 return audio_path
             else:
+                response.close()
                 print(f"❌ TTS API error: {response.status_code}")
                 return None
                 
@@ -86,26 +102,24 @@ class VoiceChatSystem:
             print(f"❌ TTS failed: {e}")
             return None
     
-    def monitor_telegram_audio(self):
-        """Monitor for new audio messages from Telegram"""
-        print("👂 Monitoring Telegram for audio messages...")
-        
-        # Check for recent audio files
-        media_dir = Path('/root/.clawdbot/media/inbound/')
-        if not media_dir.exists():
-            print("❌ Media directory not found")
-            return
+    def monitor_telegram_audio(self, timeout=5):
+        """Wait for the next unprocessed audio message from Telegram"""
+        if self.inbox is None:
+            print("👂 Monitoring Telegram for audio messages...")
             
-        # Get recent OGG files
-        audio_files = list(media_dir.glob('*.ogg'))
-        audio_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            media_dir = Path('/root/.clawdbot/media/inbound/')
+            if not media_dir.exists():
+                print("❌ Media directory not found")
+                return None
+            
+            # Event-driven watcher with a durable ledger of processed files
+            self.inbox = InboxWatcher(media_dir, pattern='*.ogg')
+            print(f"👂 Inbox watcher active ({self.inbox.backend})")
         
-        if audio_files:
-            latest_audio = audio_files[0]
-            # Check if file is recent (last 5 minutes)
-            if time.time() - latest_audio.stat().st_mtime < 300:
-                print(f"🎤 New audio detected: {latest_audio}")
-                return str(latest_audio)
+        audio_file = self.inbox.next_file(timeout=timeout)
+        if audio_file:
+            print(f"🎤 New audio detected: {audio_file}")
+            return str(audio_file)
         
         return None
     
@@ -123,42 +137,69 @@ class VoiceChatSystem:
             print(f"❌ Failed to send audio: {e}")
             return False
     
+    def process_audio_message(self, audio_file):
+        """Transcribe, respond and synthesize one message; returns (text, response_text, audio_path)"""
+        # Transcribe audio
+        text = self.transcribe_audio(audio_file)
+        if not text:
+            return None, None, None
+        print(f"👤 User said: {text}")
+        
+        # Generate response (this would use your normal AI processing)
+        response_text = f"I heard you say: {text}. This is a test response."
+        
+        # Convert response to audio
+        return text, response_text, self.text_to_speech(response_text)
+    
     def start_voice_chat_loop(self):
         """Main voice chat loop"""
         print("🎙️ VOICE CHAT SYSTEM ACTIVATED")
         print("Listening for audio messages...")
         
+        # Content-hash store so identical notes never hit ASR or TTS twice
+        message_store = MessageStore(MESSAGE_DB)
+        
         while True:
             try:
                 # Check for new audio
                 audio_file = self.monitor_telegram_audio()
                 
                 if audio_file:
-                    # Transcribe audio
-                    text = self.transcribe_audio(audio_file)
-                    
-                    if text:
-                        print(f"👤 User said: {text}")
-                        
-                        # Generate response (this would use your normal AI processing)
-                        response_text = f"I heard you say: {text}. This is a test response."
+                    done = False
+                    try:
+                        # Seen this exact audio before? Reuse the previous reply
+                        digest = content_hash(audio_file)
+                        cached = message_store.lookup(digest)
+                        if cached:
+                            print("♻️ Duplicate voice note, skipping transcription and TTS")
+                            if cached['response_audio']:
+                                self.send_telegram_audio_response(cached['response_audio'])
+                            done = True
+                            continue
                         
-                        # Convert response to audio
-                        audio_response = self.text_to_speech(response_text)
+                        text, response_text, audio_response = self.process_audio_message(audio_file)
                         
                         if audio_response:
                             # Send back via Telegram
                             self.send_telegram_audio_response(audio_response)
+                            message_store.save(digest, text, response_text, audio_response)
                             print("✅ Voice conversation completed")
-                        
-                    # Wait before checking again
-                    time.sleep(10)
-                else:
-                    # No new audio, wait
+                            done = True
+                    finally:
+                        # Only successes go into the ledger; failed notes are retried with backoff
+                        if done:
+                            self.inbox.mark_processed(audio_file)
+                        elif not self.inbox.mark_failed(audio_file):
+                            print(f"⚠️ Giving up on {audio_file} until the next restart")
+                elif self.inbox is None:
+                    # Media directory missing, wait
                     time.sleep(5)
                     
             except KeyboardInterrupt:
-                print("\n🛑 Voice chat stopped")
+                stats = message_store.stats()
+                print(f"\n📊 Duplicates suppressed: {stats['duplicates_suppressed']} "
+                      f"({stats['duplicates_suppressed_total']} total, {stats['entries']} cached)")
+                print("🛑 Voice chat stopped")
                 break
             except Exception as e:
                 print(f"❌ Voice chat error: {e}")